@@ -1,69 +1,376 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import replace
 from datetime import datetime
+from functools import partial
+from http import HTTPStatus
 
 import requests
 
-from bundesliga_scraper.datatypes.constants import LEAGUE_NAMES, League
+from bundesliga_scraper.api import fast_json
+from bundesliga_scraper.api.cache import CacheEntry, CacheMissError, ResponseCache
+from bundesliga_scraper.api.client import get_client
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.api.fast_json import JsonValue
+from bundesliga_scraper.api.memory_cache import MemoryCache
+from bundesliga_scraper.api.store import MeetingRow, SeasonStore
+from bundesliga_scraper.datatypes.constants import get_current_season
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.fixture_store import SeasonFixtureStore
+from bundesliga_scraper.datatypes.head_to_head import HeadToHead, Meeting
+from bundesliga_scraper.datatypes.league_registry import League, league_registry
 from bundesliga_scraper.datatypes.matchday import Matchday
+from bundesliga_scraper.datatypes.standings import SeasonStandings
 from bundesliga_scraper.datatypes.table import Table
-from bundesliga_scraper.datatypes.table_entry import TableEntry
+from bundesliga_scraper.datatypes.table_entry import History, TableEntry
+from bundesliga_scraper.datatypes.team_registry import TeamMatcher, team_registry
+
+BASE_URL_ENV = "BUNDESLIGA_SCRAPER_BASE_URL"
+# e.g. point the cli to a local tools/fake_openligadb.py
+BASE_URL = os.environ.get(BASE_URL_ENV, "https://api.openligadb.de").rstrip("/")
+
+# time to live in seconds, None means the cached response never expires
+LIVE_MATCHDAY_TTL = 30
+CURRENT_MATCHDAY_TTL = 5 * 60
+RUNNING_SEASON_TTL = 60 * 60
+AVAILABLE_TEAMS_TTL = 24 * 60 * 60
+
+response_cache = ResponseCache()
+# parsed objects are kept for the lifetime of the process, e.g. in a session
+memory_cache = MemoryCache()
+# synced seasons are read from the local store instead of the api
+season_store = SeasonStore()
+use_store = True
+
+
+def set_offline(offline: bool) -> None:
+    """Serves every request from the cache without touching the network."""
+    response_cache.offline = offline
+
+
+def set_use_store(enabled: bool) -> None:
+    """Enables / disables reading synced seasons from the local store."""
+    global use_store  # noqa: PLW0603
+    use_store = enabled
+
+
+def fetch_entry(
+    url: str, ttl_policy: Callable[[JsonValue], float | None], revalidate: bool = False
+) -> CacheEntry:
+    """Fetches the response behind url, answering from the caches if possible.
+
+    Fresh responses are served from memory first, then from disk, only then
+    OpenLigaDB is asked. A stale response is revalidated with a conditional
+    request, if it did not change it is kept together with everything parsed
+    from it.
+
+    Args:
+        url (str): the OpenLigaDB url
+        ttl_policy (Callable): maps the decoded response to its time to live
+        revalidate (bool): ask OpenLigaDB even if the cached response is fresh
+
+    Returns:
+        CacheEntry: the cached response holding the decoded json
+    """
+    entry = memory_cache.get_response(url)
+    if entry is None or not entry.is_fresh():
+        # another process might have refreshed the response on disk
+        stored = response_cache.get(url)
+        if (
+            stored is not None
+            and entry is not None
+            and _is_same_response(entry, stored)
+        ):
+            stored = replace(entry, fetched_at=stored.fetched_at, ttl=stored.ttl)
+            memory_cache.renew_response(entry, stored)
+        entry = stored or entry
+    if entry is not None and (
+        response_cache.offline or (entry.is_fresh() and not revalidate)
+    ):
+        memory_cache.set_response(entry)
+        return entry
+    if response_cache.offline:
+        raise CacheMissError(f"{url} is not cached, cannot fetch it in offline mode")
+
+    try:
+        response = get_client().get(url, headers=_conditional_headers(entry))
+    except requests.RequestException:
+        # api unreachable -> a stale answer is better than none
+        if entry is not None:
+            return entry
+        raise
+
+    if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+        renewed = response_cache.renew(entry, ttl_policy(entry.data))
+        memory_cache.renew_response(entry, renewed)
+        return renewed
+
+    data = fast_json.loads(response.content)
+    entry = response_cache.set(
+        url,
+        data,
+        ttl_policy(data),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    memory_cache.set_response(entry)
+    return entry
+
+
+def _conditional_headers(entry: CacheEntry | None) -> dict[str, str]:
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def _is_same_response(entry: CacheEntry, other: CacheEntry) -> bool:
+    if entry.etag is not None or other.etag is not None:
+        return entry.etag == other.etag
+    return entry.last_modified is not None and entry.last_modified == (
+        other.last_modified
+    )
+
+
+def fetch_json(url: str, ttl_policy: Callable[[JsonValue], float | None]) -> JsonValue:
+    """Fetches the decoded json behind url, see fetch_entry."""
+    return fetch_entry(url, ttl_policy).data
+
+
+def _season_ttl(season: int, ttl: float) -> float | None:
+    return None if season < get_current_season() else ttl
+
+
+def is_finished_season(match_data: list[dict]) -> bool:
+    return bool(match_data) and all(match["matchIsFinished"] for match in match_data)
+
+
+def get_season_matchday(match_data: list[dict], current_matchday: int) -> int:
+    """Returns the current matchday, or the last matchday of a finished season.
+
+    OpenLigaDB only knows the current matchday of the running season, a finished
+    season is looked at from its end.
+
+    Args:
+        match_data (list[dict]): match data of the season
+        current_matchday (int): current matchday of OpenLigaDB
+
+    Returns:
+        int: the matchday the season is at
+    """
+    if is_finished_season(match_data):
+        return get_number_of_matchdays(match_data)
+    return current_matchday
+
 
-BASE_URL = "https://api.openligadb.de"
+def get_number_of_matchdays(match_data: list[dict]) -> int:
+    return max((int(match["group"]["groupOrderID"]) for match in match_data), default=0)
 
 
-def get_table(league: League, season: int = 2024) -> dict:
+def _match_data_ttl(data: list[dict]) -> float | None:
+    # a finished season, or matchday, never changes again
+    if is_finished_season(data):
+        return None
+
+    now = datetime.now()
+    next_kickoff = None
+    for match in data:
+        if match["matchIsFinished"]:
+            continue
+        kickoff = datetime.fromisoformat(match["matchDateTime"])
+        if kickoff <= now:
+            return LIVE_MATCHDAY_TTL
+        if next_kickoff is None or kickoff < next_kickoff:
+            next_kickoff = kickoff
+
+    if next_kickoff is None:
+        return RUNNING_SEASON_TTL
+    # nothing changes before the next kickoff
+    return max(
+        LIVE_MATCHDAY_TTL,
+        min(RUNNING_SEASON_TTL, (next_kickoff - now).total_seconds()),
+    )
+
+
+def get_table(league: League, season: int) -> dict:
     """Fetches the Football table data for a particular league and a season."""
     url = build_get_table_url(league, season)
-    response = requests.get(url, timeout=3)
-    return response.json()
+    return fetch_json(url, lambda _: _season_ttl(season, CURRENT_MATCHDAY_TTL))
 
 
-def build_get_table_url(league: League, season: int = 2024) -> str:
+def build_get_table_url(league: League, season: int) -> str:
     return f"{BASE_URL}/getbltable/{league}/{season}"
 
 
-def retrieve_table(league: League, season: int = 2024) -> list[TableEntry]:
-    data = get_table(league=league, season=season)
-    return [TableEntry.from_dict(table_entry) for table_entry in data]
+def retrieve_table(league: League, season: int) -> list[TableEntry]:
+    url = build_get_table_url(league, season)
+    entry = fetch_entry(url, lambda _: _season_ttl(season, CURRENT_MATCHDAY_TTL))
+    return memory_cache.get_parsed(
+        key=("table", url),
+        sources=(entry,),
+        create=lambda: [
+            TableEntry.from_dict(table_entry) for table_entry in entry.data
+        ],
+    )
+
+
+def retrieve_fixture_store(league: League, season: int) -> SeasonFixtureStore:
+    """Returns the fixtures of a season in their compact, column wise form.
 
+    Standings are computed from the store, FixtureEntry objects are only kept
+    for the requests that list fixtures, see retrieve_all_matchdays.
+    """
+    entry = fetch_match_data_entry(league=league, season=season)
+    return memory_cache.get_parsed(
+        key=("fixture_store", entry.url),
+        sources=(entry,),
+        create=lambda: SeasonFixtureStore.from_match_data(entry.data),
+    )
 
-def retrieve_all_matchdays(league: League, season: int = 2024) -> list[Matchday]:
-    all_fixtures_list = get_match_data(league=league, season=season)
 
-    all_fixtures = [
-        FixtureEntry.from_dict(fixture_data) for fixture_data in all_fixtures_list
-    ]
+def retrieve_all_matchdays(league: League, season: int) -> list[Matchday]:
+    fixture_store = retrieve_fixture_store(league=league, season=season)
+    return memory_cache.get_parsed(
+        key=("matchdays", league, season),
+        sources=(fixture_store,),
+        create=lambda: fixture_store.to_matchdays(fixture_store.last_matchday),
+    )
 
-    return _extract_season_matchdays(all_fixtures)
+
+def extract_matchday(match_data: list[dict], matchday: int) -> Matchday:
+    """Parses only the fixtures of one matchday out of the season match data."""
+    return Matchday(
+        matchday=matchday,
+        fixtures=FixtureEntry.from_list(
+            fixture_data
+            for fixture_data in match_data
+            if fixture_data["group"]["groupOrderID"] == matchday
+        ),
+    )
 
 
-def get_match_data(league: League, season: int = 2024, team_filter: str = "") -> dict:
+def get_match_data(league: League, season: int, team_filter: str = "") -> dict:
+    return fetch_match_data_entry(
+        league=league, season=season, team_filter=team_filter
+    ).data
+
+
+def fetch_match_data_entry(
+    league: League, season: int, team_filter: str = ""
+) -> CacheEntry:
+    """Fetches the match data of a season, from the local store if it is synced."""
     url = build_get_match_data_url(
         league=league, season=season, team_filter=team_filter
     )
-    response = requests.get(url, timeout=3)
-    return response.json()
+    stored_entry = _get_stored_match_data_entry(league, season)
+    if stored_entry is None:
+        return fetch_entry(url, _match_data_ttl)
+    if not team_filter:
+        return stored_entry
+
+    team_matcher = team_registry.matcher([team_filter])
+    return memory_cache.get_parsed(
+        key=("stored", url),
+        sources=(stored_entry,),
+        create=lambda: CacheEntry(
+            url=url,
+            data=[
+                match
+                for match in stored_entry.data
+                if team_matcher.matches(
+                    team_registry.register(match["team1"]["teamName"])
+                )
+                or team_matcher.matches(
+                    team_registry.register(match["team2"]["teamName"])
+                )
+            ],
+            fetched_at=stored_entry.fetched_at,
+            ttl=stored_entry.ttl,
+        ),
+    )
 
 
-def build_get_match_data_url(
-    league: League, season: int = 2024, team_filter: str = ""
-) -> str:
+def build_get_match_data_url(league: League, season: int, team_filter: str = "") -> str:
     return f"{BASE_URL}/getmatchdata/{league}/{season}/{team_filter}"
 
 
 def retrieve_team_match_data(
-    league: League, team: str, season: int = 2024
+    league: League, team: str, season: int
+) -> list[FixtureEntry]:
+    entry = fetch_match_data_entry(league=league, season=season, team_filter=team)
+    return memory_cache.get_parsed(
+        key=("team_fixtures", entry.url),
+        sources=(entry,),
+        create=lambda: FixtureEntry.from_list(entry.data),
+    )
+
+
+def retrieve_team_fixtures(
+    league: League, team: str, season: int
 ) -> list[FixtureEntry]:
-    team_data = get_match_data(league=league, team_filter=team, season=season)
-    return [FixtureEntry.from_dict(fixture) for fixture in team_data]
+    """Fixtures of the teams matching the (partial) team name, in kickoff order.
+
+    Taken from the cached season, so looking at several teams costs no request.
+    """
+    fixture_store = retrieve_fixture_store(league=league, season=season)
+    season_matchdays = retrieve_all_matchdays(league=league, season=season)
+    team_matcher = team_registry.matcher([team])
+    # keyed by the matched teams instead of the name, which can be anything
+    team_ids = tuple(
+        team_id
+        for team_id in map(team_registry.register, fixture_store.team_names)
+        if team_matcher.matches(team_id)
+    )
+    return memory_cache.get_parsed(
+        key=("team_fixtures", league, season, team_ids),
+        sources=(season_matchdays,),
+        create=lambda: filter_team_fixtures(season_matchdays, team_matcher),
+    )
+
+
+def filter_team_fixtures(
+    season_matchdays: list[Matchday], team_matcher: TeamMatcher
+) -> list[FixtureEntry]:
+    """Fixtures of the season the matched teams play in, in kickoff order."""
+    return sorted(
+        (
+            fixture
+            for matchday in season_matchdays
+            for fixture in matchday.fixtures
+            if team_matcher.matches(fixture.home_team_id)
+            or team_matcher.matches(fixture.away_team_id)
+        ),
+        key=lambda fixture: fixture.date,
+    )
+
+
+def retrieve_matchday(
+    league: League,
+    matchday: int,
+    season: int,
+    revalidate: bool = False,
+) -> Matchday:
+    """Fetches only the fixtures of a single matchday, e.g. to follow it live."""
+    url = build_get_matchday_data_url(league=league, season=season, matchday=matchday)
+    entry = fetch_entry(url, _match_data_ttl, revalidate=revalidate)
+    return memory_cache.get_parsed(
+        key=("matchday", url),
+        sources=(entry,),
+        create=lambda: Matchday(
+            matchday=matchday, fixtures=FixtureEntry.from_list(entry.data)
+        ),
+    )
 
 
 def retrieve_current_matchday(league: League) -> int:
     url = build_get_current_matchday_url(league)
-    response = requests.get(url, timeout=3)
-    data = response.json()
+    data = fetch_json(url, lambda _: CURRENT_MATCHDAY_TTL)
     return int(data["groupOrderID"])
 
 
@@ -71,27 +378,395 @@ def build_get_current_matchday_url(league: League) -> str:
     return f"{BASE_URL}/getcurrentgroup/{league}"
 
 
-def build_get_available_teams_url(league: League, season: int = 2024) -> str:
+def build_get_available_teams_url(league: League, season: int) -> str:
     return f"{BASE_URL}/getavailableteams/{league}/{season}"
 
 
-def get_available_teams(league: League, season: int = 2024) -> dict:
+def get_available_teams(league: League, season: int) -> dict:
+    return fetch_available_teams_entry(league=league, season=season).data
+
+
+def fetch_available_teams_entry(league: League, season: int) -> CacheEntry:
     url = build_get_available_teams_url(league=league, season=season)
-    response = requests.get(url, timeout=3)
-    return response.json()
+    synced_at = (
+        season_store.get_synced_at(league.shortcut, season) if use_store else None
+    )
+    if synced_at is None:
+        return fetch_entry(url, lambda _: _season_ttl(season, AVAILABLE_TEAMS_TTL))
+    return _get_stored_entry(
+        url,
+        synced_at,
+        create=lambda: CacheEntry(
+            url=url,
+            data=season_store.get_available_teams(league.shortcut, season),
+            fetched_at=synced_at,
+            ttl=None,
+        ),
+    )
 
 
-def initialize_league_table(league: League, season: int = 2024) -> Table:
-    data = get_available_teams(league=league, season=season)
-    teams_dict: dict[str, TableEntry] = {
-        entry["teamName"]: TableEntry(entry["teamName"]) for entry in data
+def retrieve_team_names(league: League, season: int) -> tuple[str, ...]:
+    entry = fetch_available_teams_entry(league=league, season=season)
+    return memory_cache.get_parsed(
+        key=("team_names", entry.url),
+        sources=(entry,),
+        create=lambda: tuple(team["teamName"] for team in entry.data),
+    )
+
+
+def initialize_league_table(league: League, season: int) -> Table:
+    return Table.from_team_names(
+        league_name=league.display_name,
+        team_names=retrieve_team_names(league=league, season=season),
+    )
+
+
+def retrieve_season_standings(league: League, season: int) -> SeasonStandings:
+    """Returns the cumulative standings of a season, see SeasonStandings."""
+    fixture_store = retrieve_fixture_store(league=league, season=season)
+    team_names = retrieve_team_names(league=league, season=season)
+    return memory_cache.get_parsed(
+        key=("standings", league, season),
+        sources=(fixture_store, team_names),
+        create=lambda: SeasonStandings.from_store(
+            league_name=league.display_name,
+            store=fixture_store,
+            team_names=team_names,
+        ),
+    )
+
+
+def retrieve_standings_history(league: League, season: int) -> dict[str, History]:
+    """Returns the placement and points of every team after every played matchday.
+
+    Synced seasons are answered from the standings history index of the local
+    store without folding the season, sync_season updates the index. Other
+    seasons are computed from their standings.
+    """
+    synced_at = (
+        season_store.get_synced_at(league.shortcut, season) if use_store else None
+    )
+    if synced_at is not None:
+        index = season_store.get_standings_index(league.shortcut, season)
+        # the index of a running season is only used once it is synced again
+        if (
+            index is not None
+            and index[0] == synced_at
+            and (index[1] or response_cache.offline)
+        ):
+            return _load_standings_history(league, season)
+
+    # syncs a running season whose data expired, which updates its index
+    fetch_match_data_entry(league=league, season=season)
+    synced_at = (
+        season_store.get_synced_at(league.shortcut, season) if use_store else None
+    )
+    if synced_at is None:
+        season_standings = retrieve_season_standings(league, season)
+        return memory_cache.get_parsed(
+            key=("standings_history", league, season),
+            sources=(season_standings,),
+            create=season_standings.calculate_history,
+        )
+
+    index = season_store.get_standings_index(league.shortcut, season)
+    if index is None or index[0] != synced_at:
+        # the season was synced before the index existed
+        _index_standings_history(league, season)
+    return _load_standings_history(league, season)
+
+
+def filter_team_histories(
+    histories: dict[str, History], team_matcher: TeamMatcher
+) -> dict[str, History]:
+    """Standings histories of the matched teams, see retrieve_standings_history."""
+    return {
+        team: history
+        for team, history in histories.items()
+        if team_matcher.matches(team_registry.register(team))
+    }
+
+
+def _load_standings_history(league: League, season: int) -> dict[str, History]:
+    return {
+        team: History(placements=placements, points=points)
+        for team, (placements, points) in season_store.get_standings_history(
+            league.shortcut, season
+        ).items()
+    }
+
+
+def _index_standings_history(league: League, season: int) -> None:
+    """Computes the standings history of a synced season from the store."""
+    synced_at = season_store.get_synced_at(league.shortcut, season)
+    data = season_store.get_match_data(league.shortcut, season)
+    teams = season_store.get_available_teams(league.shortcut, season)
+    season_standings = SeasonStandings.from_store(
+        league_name=league.display_name,
+        store=SeasonFixtureStore.from_match_data(data),
+        team_names=[team["teamName"] for team in teams],
+    )
+    season_store.save_standings_history(
+        league=league.shortcut,
+        season=season,
+        synced_at=synced_at,
+        finished=is_finished_season(data),
+        history={
+            team: (history.placements, history.points)
+            for team, history in season_standings.calculate_history().items()
+        },
+    )
+
+
+def build_get_last_change_date_url(league: League, season: int, matchday: int) -> str:
+    return f"{BASE_URL}/getlastchangedate/{league}/{season}/{matchday}"
+
+
+def build_get_matchday_data_url(league: League, season: int, matchday: int) -> str:
+    return f"{BASE_URL}/getmatchdata/{league}/{season}/{matchday}"
+
+
+def sync_season(
+    league: League, season: int, matchdays: Iterable[int] | None = None
+) -> list[int]:
+    """Stores a season in the local store, downloading changed matchdays only.
+
+    The last change date of every matchday is compared with the one it was
+    stored with, only matchdays that changed since are downloaded again. If
+    none changed, the stored season is only marked as up to date.
+
+    Args:
+        league (League): league
+        season (int): season
+        matchdays (Iterable[int] | None): matchdays to check, defaults to all
+
+    Returns:
+        list[int]: the matchdays that were downloaded
+    """
+    if response_cache.offline:
+        raise CacheMissError(f"cannot sync {league} {season} in offline mode")
+    if matchdays is None:
+        matchdays = range(1, league.number_of_matchdays + 1)
+    matchdays = list(matchdays)
+
+    last_changes = fetch_concurrently(
+        *(
+            partial(_download_json, build_get_last_change_date_url(league, season, md))
+            for md in matchdays
+        )
+    )
+    stored_last_changes = season_store.get_last_changes(league.shortcut, season)
+    changed = {
+        matchday: last_change
+        for matchday, last_change in zip(matchdays, last_changes)
+        if stored_last_changes.get(matchday) != last_change
     }
-    return Table(league_name=LEAGUE_NAMES[league], teams=teams_dict)
+    if not changed and season_store.get_synced_at(league.shortcut, season) is not None:
+        # teams, meetings and the standings history are those of the stored data
+        season_store.touch_season(league.shortcut, season)
+        return []
+
+    # a season synced before the meetings were indexed is indexed as a whole
+    is_indexed = (league.shortcut, season) not in season_store.get_unindexed_seasons()
+    teams, *changed_match_data = fetch_concurrently(
+        partial(_download_json, build_get_available_teams_url(league, season)),
+        *(
+            partial(_download_json, build_get_matchday_data_url(league, season, md))
+            for md in changed
+        ),
+    )
+    changed_matchdays = {
+        matchday: (last_change, match_data)
+        for (matchday, last_change), match_data in zip(
+            changed.items(), changed_match_data
+        )
+    }
+    season_store.save_season(
+        league=league.shortcut,
+        season=season,
+        matchdays=changed_matchdays,
+        teams=teams,
+        # only the meetings of the changed matchdays are replaced
+        meetings=_get_meetings(
+            {
+                matchday: match_data
+                for matchday, (_, match_data) in changed_matchdays.items()
+            }
+        )
+        if is_indexed
+        else None,
+    )
+    if not is_indexed:
+        _index_meetings(league.shortcut, season)
+    # the standings history is computed once here instead of for every graph
+    _index_standings_history(league, season)
+    return list(changed)
+
+
+def retrieve_head_to_head(
+    team: str, opponent: str, seasons: list[int] | None = None
+) -> HeadToHead:
+    """Returns the meetings of two teams in all synced seasons of all leagues.
+
+    The meetings are read from the index of the local store, which sync_season
+    updates with the matchdays it downloads. Seasons synced before the index
+    existed are indexed first, once.
+
+    Args:
+        team (str): (partial) name of the team
+        opponent (str): (partial) name of the opponent
+        seasons (list[int] | None): only meetings of these seasons
+
+    Returns:
+        HeadToHead: the meetings, the oldest first
+    """
+    for league_shortcut, season in season_store.get_unindexed_seasons():
+        _index_meetings(league_shortcut, season)
+
+    team_names = season_store.get_meeting_teams()
+    team_matcher = team_registry.matcher([team])
+    opponent_matcher = team_registry.matcher([opponent])
+    rows = season_store.get_meetings(
+        teams=[
+            name
+            for name in team_names
+            if team_matcher.matches(team_registry.register(name))
+        ],
+        opponents=[
+            name
+            for name in team_names
+            if opponent_matcher.matches(team_registry.register(name))
+        ],
+        seasons=seasons,
+    )
+    return HeadToHead(
+        team_name=team,
+        opponent_name=opponent,
+        meetings=[
+            Meeting(
+                league=league_shortcut, season=season, fixture=_meeting_fixture(row)
+            )
+            for league_shortcut, season, row in rows
+        ],
+    )
+
+
+def _meeting_fixture(row: MeetingRow) -> FixtureEntry:
+    matchday, _, kickoff, home_team, away_team, home_goals, away_goals = row
+    home_team_id = team_registry.register(home_team)
+    away_team_id = team_registry.register(away_team)
+    return FixtureEntry(
+        home_team=team_registry.names[home_team_id],
+        away_team=team_registry.names[away_team_id],
+        home_goals=home_goals,
+        away_goals=away_goals,
+        matchday=matchday,
+        match_is_finished=True,
+        has_results=False,
+        date=datetime.fromisoformat(kickoff),
+        home_team_id=home_team_id,
+        away_team_id=away_team_id,
+    )
+
+
+def _get_meetings(matchdays: dict[int, list[dict]]) -> dict[int, list[MeetingRow]]:
+    """Returns the finished matches of the matchdays as rows of the store."""
+    return {
+        matchday: [
+            (
+                matchday,
+                match["matchID"],
+                fixture.date.isoformat(),
+                fixture.home_team,
+                fixture.away_team,
+                fixture.home_goals,
+                fixture.away_goals,
+            )
+            for match in match_data
+            if (fixture := FixtureEntry.from_dict(match)).match_is_finished
+        ]
+        for matchday, match_data in matchdays.items()
+    }
+
+
+def _index_meetings(league_shortcut: str, season: int) -> None:
+    """Saves the meetings of every matchday of a synced season."""
+    matchdays: dict[int, list[dict]] = {}
+    for match in season_store.get_match_data(league_shortcut, season):
+        matchdays.setdefault(int(match["group"]["groupOrderID"]), []).append(match)
+    season_store.save_meetings(league_shortcut, season, _get_meetings(matchdays))
+
+
+def _download_json(url: str) -> JsonValue:
+    # syncing has to see the current state, the response cache is bypassed
+    return fast_json.loads(get_client().get(url).content)
+
+
+def _get_stored_match_data_entry(league: League, season: int) -> CacheEntry | None:
+    synced_at = (
+        season_store.get_synced_at(league.shortcut, season) if use_store else None
+    )
+    if synced_at is None:
+        return None
+
+    url = build_get_match_data_url(league=league, season=season)
+    entry = _get_stored_entry(
+        url,
+        synced_at,
+        create=lambda: _create_stored_entry(url, league, season, synced_at),
+    )
+    if entry.is_fresh() or response_cache.offline:
+        return entry
+
+    # running season: bring the matchdays that are not finished up to date
+    unfinished_matchdays = {
+        match["group"]["groupOrderID"]
+        for match in entry.data
+        if not match["matchIsFinished"]
+    }
+    try:
+        sync_season(league, season, matchdays=sorted(unfinished_matchdays))
+    except requests.RequestException:
+        return entry
+
+    synced_at = season_store.get_synced_at(league.shortcut, season)
+    return _get_stored_entry(
+        url,
+        synced_at,
+        create=lambda: _create_stored_entry(url, league, season, synced_at),
+    )
+
+
+def _get_stored_entry(
+    url: str, synced_at: float, create: Callable[[], CacheEntry]
+) -> CacheEntry:
+    """Returns the entry read from the store, read again once the season synced.
+
+    There is one entry per url, its fetched_at is the synced_at of the data it
+    holds, so a newer sync replaces it instead of being kept next to it.
+    """
+    key = ("stored", url)
+    entry = memory_cache.get_parsed(key=key, sources=(), create=create)
+    if entry.fetched_at != synced_at:
+        memory_cache.discard_parsed(key)
+        entry = memory_cache.get_parsed(key=key, sources=(), create=create)
+    return entry
+
+
+def _create_stored_entry(
+    url: str, league: League, season: int, synced_at: float
+) -> CacheEntry:
+    data = season_store.get_match_data(league.shortcut, season)
+    return CacheEntry(
+        url=url, data=data, fetched_at=synced_at, ttl=_match_data_ttl(data)
+    )
 
 
 def _extract_season_matchdays(all_fixtures: list[FixtureEntry]) -> list[Matchday]:
+    # the number of matchdays is the one of the season, not of the league config
+    number_of_matchdays = max((fixture.matchday for fixture in all_fixtures), default=0)
     season_matchdays: list[Matchday] = []
-    for i in range(1, 35):
+    for i in range(1, number_of_matchdays + 1):
         season_matchdays.append(Matchday(matchday=i, fixtures=[]))
     for fixture in all_fixtures:
         matchday = fixture.matchday
@@ -101,7 +776,9 @@ def _extract_season_matchdays(all_fixtures: list[FixtureEntry]) -> list[Matchday
 
 
 def main():
-    all_fixtures = retrieve_all_matchdays(league=League.Bundesliga)
+    all_fixtures = retrieve_all_matchdays(
+        league=league_registry.get("bundesliga"), season=get_current_season()
+    )
     matchday = all_fixtures[23]
 
     print(f"Matchday: {matchday[0].matchday}")
@@ -0,0 +1,165 @@
+"""Persistent on-disk cache for OpenLigaDB responses."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from bundesliga_scraper.api import fast_json
+from bundesliga_scraper.api.fast_json import JsonValue
+
+CACHE_DIR_ENV = "BUNDESLIGA_SCRAPER_CACHE_DIR"
+OFFLINE_ENV = "BUNDESLIGA_SCRAPER_OFFLINE"
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a url has never been cached."""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    url: str
+    data: JsonValue
+    fetched_at: float
+    # None means the entry never expires (e.g. finished seasons)
+    ttl: float | None
+    # validators of the response, sent back to ask whether it has changed
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        if self.ttl is None:
+            return True
+        now = time.time() if now is None else now
+        return now - self.fetched_at < self.ttl
+
+
+def get_default_cache_dir() -> Path:
+    if CACHE_DIR_ENV in os.environ:
+        return Path(os.environ[CACHE_DIR_ENV])
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(xdg_cache_home) / "bundesliga_scraper"
+
+
+class ResponseCache:
+    """Stores decoded json responses on disk, one file per url.
+
+    Files are evicted least recently used first once the cache directory grows
+    beyond `max_size` bytes.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        offline: bool | None = None,
+    ) -> None:
+        self.directory = get_default_cache_dir() if directory is None else directory
+        self.max_size = max_size
+        self.offline = (
+            os.environ.get(OFFLINE_ENV, "") not in ("", "0")
+            if offline is None
+            else offline
+        )
+
+    def get(self, url: str) -> CacheEntry | None:
+        path = self._path(url)
+        try:
+            raw = fast_json.loads(path.read_bytes())
+            # mark entry as recently used for the lru eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if raw.get("url") != url:
+            return None
+        return CacheEntry(
+            url=url,
+            data=raw["data"],
+            fetched_at=raw["fetched_at"],
+            ttl=raw["ttl"],
+            etag=raw.get("etag"),
+            last_modified=raw.get("last_modified"),
+        )
+
+    def set(
+        self,
+        url: str,
+        data: JsonValue,
+        ttl: float | None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
+        entry = CacheEntry(
+            url=url,
+            data=data,
+            fetched_at=time.time(),
+            ttl=ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._store(entry)
+        return entry
+
+    def renew(self, entry: CacheEntry, ttl: float | None) -> CacheEntry:
+        """Marks an entry as fetched just now, after the api confirmed it."""
+        renewed = replace(entry, fetched_at=time.time(), ttl=ttl)
+        self._store(renewed)
+        return renewed
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _store(self, entry: CacheEntry) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write(self._path(entry.url), entry)
+            self._evict()
+        except OSError:
+            # caching is best effort, a read-only home must not break the cli
+            pass
+
+    def _write(self, path: Path, entry: CacheEntry) -> None:
+        raw = {
+            "url": entry.url,
+            "fetched_at": entry.fetched_at,
+            "ttl": entry.ttl,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "data": entry.data,
+        }
+        # write to a temporary file first so concurrent runs never read half a file
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(fast_json.dumps(raw))
+            os.replace(tmp_name, path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _evict(self) -> None:
+        files = []
+        total_size = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
@@ -0,0 +1,93 @@
+"""Shared http client for talking to OpenLigaDB."""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bundesliga_scraper.api.transport import get_default_transport
+
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+BACKOFF_JITTER = 0.2
+# one connection per worker of api.concurrent
+POOL_SIZE = 16
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class ApiClient:
+    """Pooled keep-alive session that retries transient errors.
+
+    Failed requests are retried with exponential backoff plus random jitter,
+    connections to the same host are reused for every request. A transport,
+    e.g. one replaying recorded responses, replaces the network entirely.
+    """
+
+    def __init__(
+        self,
+        timeout: tuple[float, float] = (CONNECT_TIMEOUT, READ_TIMEOUT),
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        pool_size: int = POOL_SIZE,
+        transport: BaseAdapter | None = None,
+    ) -> None:
+        # seconds to connect and to wait for the response
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=BACKOFF_JITTER,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=("GET",),
+            # let the caller decide what to do with the last error response
+            raise_on_status=False,
+        )
+        adapter_settings = {
+            "pool_connections": pool_size,
+            "pool_maxsize": pool_size,
+            "max_retries": retry,
+        }
+        adapter = transport or get_default_transport(**adapter_settings)
+        if adapter is None:
+            adapter = HTTPAdapter(**adapter_settings)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> requests.Response:
+        """Sends a GET request, 304 Not Modified is not treated as an error."""
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: ApiClient | None = None
+# the workers of api.concurrent may ask for the client at the same time
+_client_lock = threading.Lock()
+
+
+def get_client() -> ApiClient:
+    """Returns the client shared by the whole api layer."""
+    global _client  # noqa: PLW0603
+    with _client_lock:
+        if _client is None:
+            _client = ApiClient()
+        return _client
+
+
+def set_client(client: ApiClient) -> None:
+    """Replaces the shared client, e.g. to use other timeouts."""
+    global _client  # noqa: PLW0603
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
@@ -0,0 +1,31 @@
+"""Running independent api calls at the same time."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# three requests per league, enough for `all` to fetch every league at once
+MAX_WORKERS = 16
+
+
+def fetch_concurrently(*calls: Callable[[], Any]) -> tuple[Any, ...]:
+    """Runs the given calls in a thread pool and waits for all of them.
+
+    Use functools.partial to bind the arguments of each call. The total
+    latency is that of the slowest call instead of the sum of all calls.
+
+    Args:
+        *calls (Callable): argument-less callables, e.g. api fetch functions
+
+    Returns:
+        tuple: results in the same order as the calls
+    """
+    if len(calls) <= 1:
+        return tuple(call() for call in calls)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(calls))) as executor:
+        futures = [executor.submit(call) for call in calls]
+        # result() re-raises the exception of a failed call in the caller
+        return tuple(future.result() for future in futures)
@@ -0,0 +1,28 @@
+"""Json encoding and decoding, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import TypeAlias
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+# a decoded json document
+JsonValue: TypeAlias = (
+    dict[str, "JsonValue"] | list["JsonValue"] | str | int | float | bool | None
+)
+
+
+def loads(data: bytes | str) -> JsonValue:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: JsonValue) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
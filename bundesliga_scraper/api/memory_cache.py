@@ -0,0 +1,86 @@
+"""In-memory cache for responses and the objects parsed from them."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from bundesliga_scraper.api.cache import CacheEntry
+
+T = TypeVar("T")
+
+
+class MemoryCache:
+    """Keeps responses and parsed objects alive for the lifetime of the process.
+
+    A parsed object is only reused as long as the objects it was created from
+    are still the same, so a changed response is parsed again. The cache is
+    shared by the worker threads of api.concurrent, objects are created outside
+    of the lock.
+    """
+
+    def __init__(self) -> None:
+        self.responses: dict[str, CacheEntry] = {}
+        self.parsed: dict[Hashable, tuple[tuple[Any, ...], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_response(self, url: str) -> CacheEntry | None:
+        with self._lock:
+            return self.responses.get(url)
+
+    def set_response(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self.responses[entry.url] = entry
+
+    def renew_response(self, old: CacheEntry, new: CacheEntry) -> None:
+        """Replaces a response the api confirmed as unchanged.
+
+        Objects parsed from the old response are kept and now belong to the new
+        one, so they are not parsed again.
+        """
+        with self._lock:
+            self.responses[new.url] = new
+            for key, (sources, value) in list(self.parsed.items()):
+                if any(source is old for source in sources):
+                    self.parsed[key] = (
+                        tuple(new if source is old else source for source in sources),
+                        value,
+                    )
+
+    def get_parsed(
+        self, key: Hashable, sources: tuple[Any, ...], create: Callable[[], T]
+    ) -> T:
+        """Returns the object stored under key or creates it.
+
+        Args:
+            key (Hashable): identifies the parsed object
+            sources (tuple): objects the parsed object is derived from
+            create (Callable): creates the parsed object from the sources
+
+        Returns:
+            T: the cached or newly created object
+        """
+        with self._lock:
+            cached = self.parsed.get(key)
+        if cached is not None:
+            cached_sources, value = cached
+            if len(cached_sources) == len(sources) and all(
+                cached_source is source
+                for cached_source, source in zip(cached_sources, sources)
+            ):
+                return value
+
+        value = create()
+        with self._lock:
+            self.parsed[key] = (sources, value)
+        return value
+
+    def discard_parsed(self, key: Hashable) -> None:
+        with self._lock:
+            self.parsed.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.responses.clear()
+            self.parsed.clear()
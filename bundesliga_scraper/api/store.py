@@ -0,0 +1,419 @@
+"""Local SQLite store of synced seasons."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from bundesliga_scraper.api import fast_json
+
+STORE_PATH_ENV = "BUNDESLIGA_SCRAPER_STORE"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (league, season)
+);
+CREATE TABLE IF NOT EXISTS matchdays (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    matchday INTEGER NOT NULL,
+    last_change TEXT NOT NULL,
+    PRIMARY KEY (league, season, matchday)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    matchday INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (league, season, match_id)
+);
+CREATE INDEX IF NOT EXISTS matches_by_matchday
+    ON matches (league, season, matchday, position);
+CREATE TABLE IF NOT EXISTS teams (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (league, season, position)
+);
+CREATE TABLE IF NOT EXISTS standings_indexes (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    finished INTEGER NOT NULL,
+    PRIMARY KEY (league, season)
+);
+CREATE TABLE IF NOT EXISTS standings_history (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    matchday INTEGER NOT NULL,
+    place INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (league, season, position, matchday)
+);
+CREATE TABLE IF NOT EXISTS meetings (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    matchday INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    kickoff TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_goals INTEGER NOT NULL,
+    away_goals INTEGER NOT NULL,
+    PRIMARY KEY (league, season, match_id)
+);
+CREATE INDEX IF NOT EXISTS meetings_by_teams ON meetings (home_team, away_team);
+CREATE TABLE IF NOT EXISTS meeting_seasons (
+    league TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    PRIMARY KEY (league, season)
+);
+"""
+
+# matchday, match id, kickoff, home team, away team, home goals, away goals
+MeetingRow = tuple[int, int, str, str, str, int, int]
+
+
+def get_default_store_path() -> Path:
+    if STORE_PATH_ENV in os.environ:
+        return Path(os.environ[STORE_PATH_ENV])
+    xdg_data_home = os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")
+    return Path(xdg_data_home) / "bundesliga_scraper" / "seasons.sqlite3"
+
+
+class SeasonStore:
+    """Keeps the raw OpenLigaDB match and team data of synced seasons.
+
+    Matches are stored as the json the api returned, so they are parsed
+    exactly like a live response. Every matchday remembers the last change
+    date it was synced with, which makes syncing incremental.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = get_default_store_path() if path is None else path
+        # sqlite connections must not be shared between threads
+        self._local = threading.local()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        # commits on success, rolls back on an exception
+        with connection:
+            yield connection
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def get_synced_at(self, league: str, season: int) -> float | None:
+        if not self.exists():
+            return None
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT synced_at FROM seasons WHERE league = ? AND season = ?",
+                (league, season),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get_synced_seasons(self) -> list[tuple[str, int]]:
+        if not self.exists():
+            return []
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT league, season FROM seasons ORDER BY league, season"
+            ).fetchall()
+        return [(league, season) for league, season in rows]
+
+    def get_last_changes(self, league: str, season: int) -> dict[int, str]:
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT matchday, last_change FROM matchdays "
+                "WHERE league = ? AND season = ?",
+                (league, season),
+            ).fetchall()
+        return dict(rows)
+
+    def get_match_data(self, league: str, season: int) -> list[dict]:
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT data FROM matches WHERE league = ? AND season = ? "
+                "ORDER BY matchday, position",
+                (league, season),
+            ).fetchall()
+        return [fast_json.loads(data) for (data,) in rows]
+
+    def get_available_teams(self, league: str, season: int) -> list[dict]:
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT data FROM teams WHERE league = ? AND season = ? "
+                "ORDER BY position",
+                (league, season),
+            ).fetchall()
+        return [fast_json.loads(data) for (data,) in rows]
+
+    def save_season(
+        self,
+        league: str,
+        season: int,
+        matchdays: dict[int, tuple[str, list[dict]]],
+        teams: list[dict],
+        meetings: dict[int, list[MeetingRow]] | None = None,
+    ) -> None:
+        """Replaces the given matchdays and the teams of a season.
+
+        Args:
+            league (str): league shortcut
+            season (int): season
+            matchdays (dict): matchday -> (last change date, match data)
+            teams (list[dict]): available teams of the season
+            meetings (dict | None): matchday -> finished matches, see
+                save_meetings, only if they are known for the whole season
+        """
+        with self.connection() as connection:
+            for matchday, (last_change, match_data) in matchdays.items():
+                connection.execute(
+                    "DELETE FROM matches "
+                    "WHERE league = ? AND season = ? AND matchday = ?",
+                    (league, season, matchday),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO matches "
+                    "(league, season, matchday, position, match_id, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            league,
+                            season,
+                            matchday,
+                            position,
+                            match["matchID"],
+                            fast_json.dumps(match).decode(),
+                        )
+                        for position, match in enumerate(match_data)
+                    ],
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO matchdays "
+                    "(league, season, matchday, last_change) VALUES (?, ?, ?, ?)",
+                    (league, season, matchday, last_change),
+                )
+
+            connection.execute(
+                "DELETE FROM teams WHERE league = ? AND season = ?", (league, season)
+            )
+            connection.executemany(
+                "INSERT INTO teams (league, season, position, data) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (league, season, position, fast_json.dumps(team).decode())
+                    for position, team in enumerate(teams)
+                ],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO seasons (league, season, synced_at) "
+                "VALUES (?, ?, ?)",
+                (league, season, time.time()),
+            )
+            if meetings is not None:
+                _replace_meetings(connection, league, season, meetings)
+
+    def touch_season(self, league: str, season: int) -> None:
+        """Marks a stored season as up to date without replacing any of its data.
+
+        A standings history computed from the stored data stays valid, it is
+        moved along with the season.
+        """
+        synced_at = time.time()
+        with self.connection() as connection:
+            connection.execute(
+                "UPDATE standings_indexes SET synced_at = ? "
+                "WHERE league = ? AND season = ? AND synced_at = ("
+                "SELECT synced_at FROM seasons WHERE league = ? AND season = ?)",
+                (synced_at, league, season, league, season),
+            )
+            connection.execute(
+                "UPDATE seasons SET synced_at = ? WHERE league = ? AND season = ?",
+                (synced_at, league, season),
+            )
+
+    def save_meetings(
+        self, league: str, season: int, meetings: dict[int, list[MeetingRow]]
+    ) -> None:
+        """Replaces the finished matches of the given matchdays.
+
+        Once saved the season counts as indexed, so the meetings of all its
+        matchdays have to be saved the first time.
+        """
+        with self.connection() as connection:
+            _replace_meetings(connection, league, season, meetings)
+
+    def get_unindexed_seasons(self) -> list[tuple[str, int]]:
+        """Returns the synced seasons whose meetings were not saved yet."""
+        if not self.exists():
+            return []
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT league, season FROM seasons "
+                "EXCEPT SELECT league, season FROM meeting_seasons "
+                "ORDER BY league, season"
+            ).fetchall()
+        return [(league, season) for league, season in rows]
+
+    def get_meeting_teams(self) -> list[str]:
+        if not self.exists():
+            return []
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT home_team FROM meetings UNION SELECT away_team FROM meetings"
+            ).fetchall()
+        return [team for (team,) in rows]
+
+    def get_meetings(
+        self, teams: list[str], opponents: list[str], seasons: list[int] | None = None
+    ) -> list[tuple[str, int, MeetingRow]]:
+        """Returns the meetings of the teams with the opponents in kickoff order.
+
+        Args:
+            teams (list[str]): names of the teams
+            opponents (list[str]): names of the opponents
+            seasons (list[int] | None): only meetings of these seasons
+
+        Returns:
+            list[tuple[str, int, MeetingRow]]: league, season and the meeting
+        """
+        if not teams or not opponents:
+            return []
+        teams_placeholders = ", ".join("?" * len(teams))
+        opponents_placeholders = ", ".join("?" * len(opponents))
+        query = (
+            "SELECT league, season, matchday, match_id, kickoff, home_team, "
+            "away_team, home_goals, away_goals FROM meetings "
+            f"WHERE ((home_team IN ({teams_placeholders}) "
+            f"AND away_team IN ({opponents_placeholders})) "
+            f"OR (home_team IN ({opponents_placeholders}) "
+            f"AND away_team IN ({teams_placeholders})))"
+        )
+        parameters: list[str | int] = [*teams, *opponents, *opponents, *teams]
+        if seasons is not None:
+            query += f" AND season IN ({', '.join('?' * len(seasons))})"
+            parameters.extend(seasons)
+        with self.connection() as connection:
+            rows = connection.execute(
+                f"{query} ORDER BY kickoff, match_id", parameters
+            ).fetchall()
+        return [(league, season, tuple(meeting)) for league, season, *meeting in rows]
+
+    def get_standings_index(
+        self, league: str, season: int
+    ) -> tuple[float, bool] | None:
+        """Returns when the standings history was computed and if the season ended.
+
+        The history belongs to the data of the season synced at that time.
+        """
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT synced_at, finished FROM standings_indexes "
+                "WHERE league = ? AND season = ?",
+                (league, season),
+            ).fetchone()
+        return None if row is None else (row[0], bool(row[1]))
+
+    def get_standings_history(
+        self, league: str, season: int
+    ) -> dict[str, tuple[list[int], list[int]]]:
+        """Returns the placements and points by matchday of every team."""
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT team, place, points FROM standings_history "
+                "WHERE league = ? AND season = ? ORDER BY position, matchday",
+                (league, season),
+            ).fetchall()
+        history: dict[str, tuple[list[int], list[int]]] = {}
+        for team, place, points in rows:
+            placements, team_points = history.setdefault(team, ([], []))
+            placements.append(place)
+            team_points.append(points)
+        return history
+
+    def save_standings_history(
+        self,
+        league: str,
+        season: int,
+        synced_at: float,
+        finished: bool,
+        history: dict[str, tuple[list[int], list[int]]],
+    ) -> None:
+        """Replaces the standings history of a season.
+
+        Args:
+            league (str): league shortcut
+            season (int): season
+            synced_at (float): synced_at of the season it was computed from
+            finished (bool): whether the season is finished
+            history (dict): team -> (placements, points), by matchday
+        """
+        with self.connection() as connection:
+            connection.execute(
+                "DELETE FROM standings_history WHERE league = ? AND season = ?",
+                (league, season),
+            )
+            connection.executemany(
+                "INSERT INTO standings_history "
+                "(league, season, position, team, matchday, place, points) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (league, season, position, team, matchday, place, points)
+                    for position, (team, (placements, team_points)) in enumerate(
+                        history.items()
+                    )
+                    for matchday, (place, points) in enumerate(
+                        zip(placements, team_points), start=1
+                    )
+                ],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO standings_indexes "
+                "(league, season, synced_at, finished) VALUES (?, ?, ?, ?)",
+                (league, season, synced_at, finished),
+            )
+
+
+def _replace_meetings(
+    connection: sqlite3.Connection,
+    league: str,
+    season: int,
+    meetings: dict[int, list[MeetingRow]],
+) -> None:
+    # a matchday only keeps the matches that are finished by now
+    for matchday, matchday_meetings in meetings.items():
+        connection.execute(
+            "DELETE FROM meetings WHERE league = ? AND season = ? AND matchday = ?",
+            (league, season, matchday),
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO meetings (league, season, matchday, match_id, "
+            "kickoff, home_team, away_team, home_goals, away_goals) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(league, season, *meeting) for meeting in matchday_meetings],
+        )
+    connection.execute(
+        "INSERT OR IGNORE INTO meeting_seasons (league, season) VALUES (?, ?)",
+        (league, season),
+    )
@@ -0,0 +1,90 @@
+"""Transports that record OpenLigaDB responses to disk and replay them later."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+RECORD_DIR_ENV = "BUNDESLIGA_SCRAPER_RECORD"
+REPLAY_DIR_ENV = "BUNDESLIGA_SCRAPER_REPLAY"
+
+
+def get_recording_path(directory: Path, url: str) -> Path:
+    """Maps an api url to its recording, e.g. getmatchdata/bl1/2024.json.
+
+    The layout follows the url scheme of OpenLigaDB, so a directory of
+    recordings can be served as is by tools/fake_openligadb.py.
+    """
+    path = urlsplit(url).path.strip("/")
+    return directory / f"{path}.json"
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Sends requests over the network and records every successful response."""
+
+    def __init__(self, directory: Path, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self.directory = directory
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: object
+    ) -> requests.Response:
+        response = super().send(request, **kwargs)
+        if response.status_code == requests.codes.ok:
+            path = get_recording_path(self.directory, request.url)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers requests from recorded responses without touching the network.
+
+    Urls that were never recorded are answered with 404 Not Found.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__()
+        self.directory = directory
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: object
+    ) -> requests.Response:
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        path = get_recording_path(self.directory, request.url)
+        try:
+            response._content = path.read_bytes()
+        except OSError:
+            response.status_code = requests.codes.not_found
+            response.reason = "Not Recorded"
+            response._content = b""
+            return response
+        response.status_code = requests.codes.ok
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def get_default_transport(**kwargs: object) -> BaseAdapter | None:
+    """Creates the transport selected by the environment, None for the network.
+
+    Args:
+        **kwargs: passed on to the HTTPAdapter of a recording transport
+
+    Returns:
+        BaseAdapter | None: the replay or recording transport
+    """
+    if os.environ.get(REPLAY_DIR_ENV):
+        return ReplayAdapter(Path(os.environ[REPLAY_DIR_ENV]))
+    if os.environ.get(RECORD_DIR_ENV):
+        return RecordingAdapter(Path(os.environ[RECORD_DIR_ENV]), **kwargs)
+    return None
@@ -1,14 +1,94 @@
 """Parsing the users input."""
 
-from argparse import ArgumentParser, _SubParsersAction
-
-from bundesliga_scraper.request_handler.fixture_request_handler import (
-    handle_fixture_request,
-)
-from bundesliga_scraper.request_handler.table_request_handler import (
-    handle_table_request,
+import importlib
+from argparse import (
+    ArgumentParser,
+    ArgumentTypeError,
+    Namespace,
+    _ArgumentGroup,
+    _SubParsersAction,
 )
-from bundesliga_scraper.request_handler.team_request_handler import handle_team_request
+from collections.abc import Callable
+
+from bundesliga_scraper.datatypes.constants import get_current_season
+from bundesliga_scraper.datatypes.league_registry import ALL_LEAGUES, league_registry
+
+# the handlers pull in requests and rich, they are imported once a
+# subcommand is dispatched so that `--help` and completion stay fast
+TABLE_HANDLER = "bundesliga_scraper.request_handler.table_request_handler"
+FIXTURE_HANDLER = "bundesliga_scraper.request_handler.fixture_request_handler"
+TEAM_HANDLER = "bundesliga_scraper.request_handler.team_request_handler"
+SYNC_HANDLER = "bundesliga_scraper.request_handler.sync_request_handler"
+BATCH_HANDLER = "bundesliga_scraper.request_handler.batch_request_handler"
+SERVE_HANDLER = "bundesliga_scraper.request_handler.serve_request_handler"
+MULTI_LEAGUE_HANDLER = "bundesliga_scraper.request_handler.multi_league_request_handler"
+
+LEAGUE_CHOICES = [*league_registry.names(), ALL_LEAGUES]
+# see data_printer.format_printer
+FORMAT_CHOICES = ["json", "csv", "ndjson"]
+WELCOME_MESSAGE = "Welcome to Bundesliga-Scraper!\n"
+
+
+def lazy_handler(
+    module_name: str, handler_name: str, per_league: bool = False
+) -> Callable[[Namespace], None]:
+    """Creates a handler that imports the real handler when it is called.
+
+    Args:
+        module_name (str): module of the request handler
+        handler_name (str): name of the handler function in that module
+        per_league (bool): run the handler for every league of a selection
+            like `all` and every season of --seasons, see
+            multi_league_request_handler
+
+    Returns:
+        Callable[[Namespace], None]: the lazy handler
+    """
+
+    def handle_request(args: Namespace) -> None:
+        handler = getattr(importlib.import_module(module_name), handler_name)
+        # a head to head covers every league and season at once
+        if (
+            per_league
+            and not getattr(args, "vs", None)
+            and (
+                league_registry.is_multi_league(args.league)
+                or getattr(args, "seasons", None)
+            )
+        ):
+            multi_league = importlib.import_module(MULTI_LEAGUE_HANDLER)
+            multi_league.handle_multi_league_request(args, handler)
+            return
+        handler(args)
+
+    return handle_request
+
+
+def league_selection(selection: str) -> str:
+    """Checks a selection like `bundesliga,3_liga`, the league stays a string."""
+    try:
+        league_registry.select(selection)
+    except ValueError as error:
+        raise ArgumentTypeError(str(error)) from None
+    return selection
+
+
+def season_range(seasons: str) -> list[int]:
+    """Parses seasons like `2010-2024` or `2018,2020-2022`, in the given order."""
+    selected: list[int] = []
+    for part in seasons.split(","):
+        first, _, last = part.partition("-")
+        try:
+            first_season = int(first)
+            last_season = int(last) if last else first_season
+        except ValueError:
+            raise ArgumentTypeError(
+                f"invalid seasons {seasons}, use e.g. 2010-2024"
+            ) from None
+        if last_season < first_season:
+            raise ArgumentTypeError(f"the seasons {part} end before they start")
+        selected.extend(range(first_season, last_season + 1))
+    return list(dict.fromkeys(selected))
 
 
 def create_parser() -> ArgumentParser:
@@ -26,23 +106,42 @@ def create_parser() -> ArgumentParser:
 
     parser.add_argument(
         "league",
-        choices=["bundesliga", "2_bundesliga"],
-        help="Choose the league you want the information for.",
+        type=league_selection,
+        metavar=f"{{{','.join(LEAGUE_CHOICES)}}}",
+        help="Choose the league you want the information for, several leagues "
+        "separated by commas or all of them.",
     )
 
-    # parser.add_argument(
-    #     "-s",
-    #     "--start-session",
-    #     dest="session",
-    #     action="store_true",
-    #     help="Starts a session for the given league -> league is now default",
-    # )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        dest="offline",
+        help="Answer from cached data only, without contacting OpenLigaDB.",
+    )
+
+    parser.add_argument(
+        "--no-store",
+        action="store_false",
+        dest="use_store",
+        help="Ignore the local season store and always ask OpenLigaDB.",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--start-session",
+        dest="session",
+        action="store_true",
+        help="Starts a session for the given league -> league is now default",
+    )
 
     subparsers = parser.add_subparsers(dest="subcommand", help="sub-command-help")
 
     create_table_subcommand_parser(subparsers)
     create_fixture_subcommand_parser(subparsers)
     create_team_subcommand_parser(subparsers)
+    create_sync_subcommand_parser(subparsers)
+    create_batch_subcommand_parser(subparsers)
+    create_serve_subcommand_parser(subparsers)
 
     return parser
 
@@ -53,12 +152,121 @@ def parse_user_args(parser: ArgumentParser) -> None:
     Args:
         parser (argparse.ArgumentParser): parser
     """
-    args = parser.parse_args()
+    args = parse_arguments(parser)
+    # formatted output is read by other programs, nothing else goes to stdout,
+    # the commands of a batch may be formatted as well
+    if getattr(args, "output_format", None) is None and args.subcommand != "batch":
+        print(WELCOME_MESSAGE)
+    if args.offline or not args.use_store:
+        # the api imports requests, see the handler imports above
+        from bundesliga_scraper.api import api  # noqa: PLC0415
+
+        api.set_offline(args.offline)
+        api.set_use_store(args.use_store)
     if args.subcommand:
         args.func(args)
-    else:
+    elif not args.session:
         parser.print_help()
 
+    if args.session:
+        # the session handler imports the handlers of every subcommand
+        from bundesliga_scraper.request_handler.session_request_handler import (  # noqa: PLC0415
+            handle_session_request,
+        )
+
+        handle_session_request(parser, args.league)
+
+
+def parse_arguments(
+    parser: ArgumentParser, tokens: list[str] | None = None
+) -> Namespace:
+    """Parses the tokens, the command line by default, like parser.parse_args.
+
+    Options of different mutually exclusive groups that can not be combined
+    are rejected here, with a usage error as well.
+    """
+    args = parser.parse_args(tokens)
+    if getattr(args, "watch", False) and league_registry.is_multi_league(args.league):
+        parser.error("argument -w/--watch: follows the matchday of a single league")
+    if getattr(args, "watch", False) and getattr(args, "seasons", None):
+        parser.error("argument -w/--watch: not allowed with argument --seasons")
+    if getattr(args, "vs", None) and getattr(args, "graph", False):
+        parser.error("argument -g/--graph: not allowed with argument --vs")
+    return args
+
+
+def add_season_arguments(parser: ArgumentParser) -> None:
+    season_group = parser.add_mutually_exclusive_group()
+    season_group.add_argument(
+        "--season",
+        type=int,
+        dest="season",
+        help="Season, named after the year it started in, defaults to the running "
+        f"season {get_current_season()}.",
+    )
+    season_group.add_argument(
+        "--seasons",
+        type=season_range,
+        dest="seasons",
+        help="Several seasons at once, e.g. 2010-2024 or 2018,2020-2022.",
+    )
+
+
+def add_format_argument(parser: ArgumentParser | _ArgumentGroup) -> None:
+    parser.add_argument(
+        "--format",
+        choices=FORMAT_CHOICES,
+        dest="output_format",
+        help="Write the data as json, csv or ndjson instead of displaying it.",
+    )
+
+
+def create_serve_subcommand_parser(subparsers: _SubParsersAction) -> None:
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve tables, fixtures and teams of all leagues as json."
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", dest="host")
+    serve_parser.add_argument("--port", type=int, default=8000, dest="port")
+    serve_parser.add_argument(
+        "--refresh",
+        type=float,
+        default=15,
+        dest="refresh",
+        help="Seconds between two refreshes of the served data, defaults to 15.",
+    )
+
+    serve_parser.set_defaults(func=lazy_handler(SERVE_HANDLER, "handle_serve_request"))
+
+
+def create_batch_subcommand_parser(subparsers: _SubParsersAction) -> None:
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run many commands, one per line, in a single process."
+    )
+    batch_parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="File with one command per line, e.g. `table -l 5`, defaults to stdin.",
+    )
+
+    batch_parser.set_defaults(func=lazy_handler(BATCH_HANDLER, "handle_batch_request"))
+
+
+def create_sync_subcommand_parser(subparsers: _SubParsersAction) -> None:
+    sync_parser = subparsers.add_parser(
+        "sync", help="Store a season locally, only changed matchdays are downloaded."
+    )
+    sync_parser.add_argument(
+        "--season",
+        type=int,
+        dest="season",
+        help=f"Season to sync, defaults to the running season {get_current_season()}.",
+    )
+
+    sync_parser.set_defaults(
+        func=lazy_handler(SYNC_HANDLER, "handle_sync_request", per_league=True)
+    )
+
 
 def create_team_subcommand_parser(subparsers: _SubParsersAction) -> None:
     team_parser = subparsers.add_parser(
@@ -98,7 +306,30 @@ def create_team_subcommand_parser(subparsers: _SubParsersAction) -> None:
         help="Display all results and fixtures of the specified team.",
     )
 
-    team_parser.set_defaults(func=handle_team_request)
+    team_parser.add_argument(
+        "--vs",
+        dest="vs",
+        metavar="OPPONENT",
+        help="Compare the team with an opponent over all synced seasons: all-time "
+        "record, goals and the recent meetings.",
+    )
+
+    # a graph is drawn for the terminal, it can not be written as data
+    output_group = team_parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "-g",
+        "--graph",
+        action="store_true",
+        dest="graph",
+        help="Draw the placements and points of the team over the season.",
+    )
+
+    add_season_arguments(team_parser)
+    add_format_argument(output_group)
+
+    team_parser.set_defaults(
+        func=lazy_handler(TEAM_HANDLER, "handle_team_request", per_league=True)
+    )
 
 
 def create_fixture_subcommand_parser(subparsers: _SubParsersAction) -> None:
@@ -141,7 +372,22 @@ def create_fixture_subcommand_parser(subparsers: _SubParsersAction) -> None:
         help="Give a list of teams that will be highlighted in the output.",
     )
 
-    fixture_parser.set_defaults(func=handle_fixture_request)
+    # a followed matchday is redrawn in place, that can not be written as data
+    output_group = fixture_parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        dest="watch",
+        help="Follow the matchday live, updating it until all matches are finished.",
+    )
+
+    add_format_argument(output_group)
+    add_season_arguments(fixture_parser)
+
+    fixture_parser.set_defaults(
+        func=lazy_handler(FIXTURE_HANDLER, "handle_fixture_request", per_league=True)
+    )
 
 
 def create_table_subcommand_parser(subparsers: _SubParsersAction) -> None:
@@ -211,4 +457,19 @@ def create_table_subcommand_parser(subparsers: _SubParsersAction) -> None:
         help="Give a list of teams that will be highlighted in the output.",
     )
 
-    table_parser.set_defaults(func=handle_table_request)
+    output_group = table_parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "-g",
+        "--graph",
+        action="store_true",
+        dest="graph",
+        help="Draw the placements and points of every team, or the highlighted "
+        "ones, over the season up to the given matchday.",
+    )
+
+    add_season_arguments(table_parser)
+    add_format_argument(output_group)
+
+    table_parser.set_defaults(
+        func=lazy_handler(TABLE_HANDLER, "handle_table_request", per_league=True)
+    )
@@ -1,11 +1,14 @@
 """Creating colorful strings of matchday fixture information."""
 
-from rich.console import Console
+from collections.abc import Iterable
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.text import Text
 
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
 from bundesliga_scraper.datatypes.matchday import Matchday
+from bundesliga_scraper.datatypes.team_registry import team_registry
 
 WINNING_STYLE = "[bold pale_green3]"
 WINNING_STYLE_END = f"[/{WINNING_STYLE[1:]}"
@@ -15,72 +18,94 @@ NEUTRAL_STYLE = "[bold pale_turquoise4]"
 NEUTRAL_STYLE_END = f"[/{NEUTRAL_STYLE[1:]}"
 HIGHLIGHT_STYLE = "[on orange3]"
 HIGHLIGHT_STYLE_END = f"[/{HIGHLIGHT_STYLE[1:]}"
+# the same styles for building Text without markup
+WINNING = WINNING_STYLE[1:-1]
+HIGHLIGHT = HIGHLIGHT_STYLE[1:-1]
 
 WIDTH = 62
 MATCH_SEPERATOR = " : "
 FUTURE_MATCH_SEPERATOR = " - : - "
 NAME_SPACE = (WIDTH - len(MATCH_SEPERATOR)) // 2
 FUTURE_GAME_SPACE = (WIDTH - len(FUTURE_MATCH_SEPERATOR)) // 2
+LIVE_MARKER = 45 * " " + "🔴 LIVE"
 
 
-def get_fixture_string(fixture: FixtureEntry, highlights: list[str]) -> str:
+def get_fixture_text(fixture: FixtureEntry, highlights: list[str]) -> Text:
     if fixture.match_is_finished or fixture.match_is_live:
-        home_string = get_home_team_styled_string(fixture)
-        away_string = get_away_team_styled_string(fixture)
-        match_string = f"{home_string}{MATCH_SEPERATOR}{away_string}"
+        home_string = get_home_string(fixture).rjust(NAME_SPACE)
+        away_string = get_away_string(fixture).ljust(NAME_SPACE)
+        fixture_text = Text(f"{home_string}{MATCH_SEPERATOR}{away_string}")
+        if fixture.home_team_won():
+            fixture_text.stylize(WINNING, 0, len(home_string))
+        if fixture.away_team_won():
+            fixture_text.stylize(WINNING, len(fixture_text) - len(away_string))
     else:
-        match_string = f"{fixture.home_team.rjust(FUTURE_GAME_SPACE)}{FUTURE_MATCH_SEPERATOR}{fixture.away_team.ljust(FUTURE_GAME_SPACE)}"
+        fixture_text = Text(
+            f"{fixture.home_team.rjust(FUTURE_GAME_SPACE)}{FUTURE_MATCH_SEPERATOR}"
+            f"{fixture.away_team.ljust(FUTURE_GAME_SPACE)}"
+        )
 
-    if any(
-        highlight.lower() in fixture.home_team.lower()
-        or highlight.lower() in fixture.away_team.lower()
-        for highlight in highlights
+    highlight_matcher = team_registry.matcher(highlights)
+    if highlight_matcher.matches(fixture.home_team_id) or highlight_matcher.matches(
+        fixture.away_team_id
     ):
-        return f"{HIGHLIGHT_STYLE}{match_string}{HIGHLIGHT_STYLE_END}"
+        fixture_text.stylize(HIGHLIGHT)
 
-    return match_string
+    return fixture_text
 
 
 def print_fixture_entries(
     title: str, matchday: Matchday, highlights: list[str]
 ) -> None:
     console = Console()
-    matchday_weekdays_split = matchday.split_fixture_into_weekdays()
+    console.print(create_fixture_renderable(title, matchday, highlights))
 
-    print_title(console, title)
 
-    for weekday_date, kickoff_times in matchday_weekdays_split.items():
-        panel_content = get_panel_content(highlights, kickoff_times)
+def create_fixture_renderable(
+    title: str, matchday: Matchday, highlights: list[str]
+) -> Group:
+    matchday_weekdays_split = matchday.split_fixture_into_weekdays()
 
-        console.print(
+    renderables: list[RenderableType] = [create_title(title)]
+    for weekday_date, kickoff_times in matchday_weekdays_split.items():
+        renderables.append(
             Panel(
-                renderable=panel_content,
+                renderable=get_panel_content(highlights, kickoff_times),
                 title=weekday_date.strftime(r"%d.%m.%Y, %A"),
                 width=WIDTH,
                 padding=1,
             )
         )
+    return Group(*renderables)
 
 
 def get_panel_content(
     highlights: list[str], kickoff_times: dict[str, list[FixtureEntry]]
-) -> str:
-    panel_content = ""
+) -> Text:
+    panel_content = Text()
     for kickoff_time, fixtures in kickoff_times.items():
-        panel_content += f"{kickoff_time}\n"
-        is_live = any(fixture.match_is_live for fixture in fixtures)
-        if is_live:
-            panel_content = panel_content[:-1] + 45 * " " + "🔴 LIVE\n"
-        panel_content += "\n".join(
-            get_fixture_string(fixture, highlights) for fixture in fixtures
+        if any(fixture.match_is_live for fixture in fixtures):
+            panel_content.append(f"{kickoff_time}{LIVE_MARKER}\n")
+        else:
+            panel_content.append(f"{kickoff_time}\n")
+        append_rows(
+            panel_content,
+            (get_fixture_text(fixture, highlights) for fixture in fixtures),
         )
-
     return panel_content
 
 
-def print_title(console: Console, title: str) -> None:
+def append_rows(panel_content: Text, rows: Iterable[Text]) -> None:
+    # appended one by one, Text.join copies every row first
+    for index, row in enumerate(rows):
+        if index:
+            panel_content.append("\n")
+        panel_content.append_text(row)
+
+
+def create_title(title: str) -> Text:
     leftspace = (WIDTH - len(title)) // 2
-    console.print(Text(leftspace * " ") + Text(f"{title}\n", style="bold italic"))
+    return Text(leftspace * " ") + Text(f"{title}\n", style="bold italic")
 
 
 def get_home_string(fixture: FixtureEntry) -> str:
@@ -89,19 +114,3 @@ def get_home_string(fixture: FixtureEntry) -> str:
 
 def get_away_string(fixture: FixtureEntry) -> str:
     return f"{fixture.away_goals} {fixture.away_team}"
-
-
-def get_home_team_styled_string(fixture: FixtureEntry) -> str:
-    home_string = f"{get_home_string(fixture).rjust(NAME_SPACE)}"
-    if fixture.home_team_won():
-        return f"{WINNING_STYLE}{home_string}{WINNING_STYLE_END}"
-    else:
-        return home_string
-
-
-def get_away_team_styled_string(fixture: FixtureEntry) -> str:
-    away_string = f"{get_away_string(fixture).ljust(NAME_SPACE)}"
-    if fixture.away_team_won():
-        return f"{WINNING_STYLE}{away_string}{WINNING_STYLE_END}"
-    else:
-        return away_string
@@ -0,0 +1,243 @@
+"""Writing tables and fixtures as json, csv or ndjson for other programs.
+
+Nothing in here imports rich, records are written to stdout as they are
+created. Every kind of output has a fixed list of fields, json and ndjson use
+them as keys and csv as its header, so the schema does not depend on the
+format.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import sys
+from argparse import Namespace
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from types import TracebackType
+from typing import Any, TextIO
+
+from bundesliga_scraper.api import fast_json
+from bundesliga_scraper.datatypes.constants import ResultSymbol
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.head_to_head import HeadToHead
+from bundesliga_scraper.datatypes.table_entry import TableEntry
+from bundesliga_scraper.datatypes.team import TeamSeasonMatches
+
+FORMATS = ("json", "csv", "ndjson")
+
+TABLE_FIELDS = (
+    "league",
+    "season",
+    "view",
+    "from_matchday",
+    "to_matchday",
+    "place",
+    "team",
+    "matches",
+    "won",
+    "draw",
+    "lost",
+    "goals",
+    "opponent_goals",
+    "goal_diff",
+    "points",
+    "form",
+)
+FIXTURE_FIELDS = (
+    "league",
+    "season",
+    "matchday",
+    "date",
+    "status",
+    "home_team",
+    "away_team",
+    "home_goals",
+    "away_goals",
+)
+TEAM_FIELDS = ("team", "kind", *FIXTURE_FIELDS, "outcome")
+
+# the last 5 results as letters, most recent first
+FORM_LETTERS = {
+    ResultSymbol.WIN.value: "W",
+    ResultSymbol.DRAW.value: "D",
+    ResultSymbol.LOSE.value: "L",
+}
+
+Record = tuple[Any, ...]
+
+
+class RecordWriter:
+    """Streams records of one kind to a file in the chosen format.
+
+    Records are tuples in the order of the fields. json is written as an array
+    with one record per line, so it can be produced without holding all records.
+    """
+
+    def __init__(
+        self, output_format: str, fields: tuple[str, ...], file: TextIO | None = None
+    ) -> None:
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format {output_format}")
+        self.output_format = output_format
+        self.fields = fields
+        self.file = sys.stdout if file is None else file
+        self.count = 0
+        self._csv_writer = None
+        if output_format == "csv":
+            self._csv_writer = csv.writer(self.file, lineterminator="\n")
+            self._csv_writer.writerow(fields)
+        elif output_format == "json":
+            self.file.write("[")
+
+    def write(self, records: Iterable[Record]) -> None:
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(records)
+            return
+
+        fields = self.fields
+        for record in records:
+            line = fast_json.dumps(dict(zip(fields, record))).decode()
+            if self.output_format == "ndjson":
+                self.file.write(f"{line}\n")
+            else:
+                self.file.write(f"{',' if self.count else ''}\n{line}")
+            self.count += 1
+
+    def close(self) -> None:
+        if self.output_format == "json":
+            self.file.write("\n]\n" if self.count else "]\n")
+        self.file.flush()
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        if isinstance(exc, BrokenPipeError) and self.file is sys.stdout:
+            # the reader stopped early, e.g. `| head`, which is not an error, but
+            # python would fail again flushing stdout at exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return True
+        # an incomplete json array is still closed, the error is raised anyway
+        self.close()
+        return False
+
+
+def open_writer(
+    args: Namespace, fields: tuple[str, ...]
+) -> AbstractContextManager[RecordWriter]:
+    """Opens a writer for the command, or reuses the one in args.record_writer.
+
+    A command for several leagues writes all of them with one writer, so the
+    output is one json array or csv table with the league in every record.
+    """
+    writer = getattr(args, "record_writer", None)
+    if writer is not None:
+        return nullcontext(writer)
+    return RecordWriter(args.output_format, fields)
+
+
+def dump_records(fields: tuple[str, ...], records: Iterable[Record]) -> bytes:
+    """Encodes the records as a json array, like RecordWriter does for json."""
+    return fast_json.dumps([dict(zip(fields, record)) for record in records])
+
+
+def get_table_records(
+    league: str,
+    season: int,
+    view: str,
+    matchdays: tuple[int, int],
+    table_entries: list[TableEntry],
+) -> Iterator[Record]:
+    """Every entry as a record of TABLE_FIELDS, matchdays is from and to."""
+    for place, entry in enumerate(table_entries, start=1):
+        yield (
+            league,
+            season,
+            view,
+            *matchdays,
+            place,
+            entry.team_name,
+            entry.matches,
+            entry.won,
+            entry.draw,
+            entry.lost,
+            entry.goals,
+            entry.opponent_goals,
+            entry.goal_diff,
+            entry.points,
+            "".join(FORM_LETTERS[result] for result in entry.history.matches[:-6:-1]),
+        )
+
+
+def get_fixture_records(
+    league: str, season: int, fixtures: Iterable[FixtureEntry]
+) -> Iterator[Record]:
+    for fixture in fixtures:
+        yield get_fixture_record(league, season, fixture)
+
+
+def get_team_records(
+    league: str, season: int, team_matches: TeamSeasonMatches
+) -> Iterator[Record]:
+    for kind, fixtures in (
+        ("result", team_matches.results),
+        ("fixture", team_matches.fixtures),
+    ):
+        for fixture in fixtures:
+            yield (
+                team_matches.team_name,
+                kind,
+                *get_fixture_record(league, season, fixture),
+                get_outcome(team_matches, fixture),
+            )
+
+
+def get_head_to_head_records(head_to_head: HeadToHead) -> Iterator[Record]:
+    """Every meeting as a record of TEAM_FIELDS, of kind meeting."""
+    team_matches = head_to_head.team_matches
+    for meeting in head_to_head.meetings:
+        yield (
+            team_matches.team_name,
+            "meeting",
+            *get_fixture_record(meeting.league, meeting.season, meeting.fixture),
+            get_outcome(team_matches, meeting.fixture),
+        )
+
+
+def get_fixture_record(league: str, season: int, fixture: FixtureEntry) -> Record:
+    if fixture.match_is_finished:
+        status = "finished"
+    elif fixture.match_is_live:
+        status = "live"
+    else:
+        status = "scheduled"
+    has_score = status != "scheduled"
+    return (
+        league,
+        season,
+        fixture.matchday,
+        fixture.date.isoformat(),
+        status,
+        fixture.home_team,
+        fixture.away_team,
+        fixture.home_goals if has_score else None,
+        fixture.away_goals if has_score else None,
+    )
+
+
+def get_outcome(team_matches: TeamSeasonMatches, fixture: FixtureEntry) -> str | None:
+    """Returns W, D or L from the view of the team, None if not finished yet."""
+    if not fixture.match_is_finished:
+        return None
+    if team_matches.team_won_match(fixture):
+        return "W"
+    if team_matches.team_lost_match(fixture):
+        return "L"
+    return "D"
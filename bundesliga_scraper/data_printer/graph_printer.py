@@ -0,0 +1,137 @@
+"""Drawing the placements and points of teams over a season.
+
+The curves are plotted with plotext 5 if it is installed, otherwise every team
+gets a row of sparklines.
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+from rich.box import ROUNDED
+from rich.console import Console
+from rich.table import Table
+
+from bundesliga_scraper.data_printer.table_printer import (
+    DEFAULT_COLUMN_SETTINGS,
+    HIGHLIGHT_STYLE,
+)
+from bundesliga_scraper.datatypes.table_entry import History
+from bundesliga_scraper.datatypes.team_registry import team_registry
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+# functions of the plotext 5 api, other versions are drawn as sparklines
+PLOTEXT_API = ("clear_figure", "subplots", "subplot", "theme", "yreverse")
+
+
+def print_standings_graph(
+    title: str,
+    histories: dict[str, History],
+    number_of_teams: int,
+    highlights: list[str],
+) -> None:
+    """Draws the placement and points curves of the teams.
+
+    Args:
+        title (str): title of the graph
+        histories (dict[str, History]): placements and points by team
+        number_of_teams (int): teams of the league, the lowest placement
+        highlights (list[str]): teams that are emphasized
+    """
+    # the final table order, the leader first
+    histories = dict(
+        sorted(
+            histories.items(),
+            key=lambda item: item[1].placements[-1] if item[1].placements else 0,
+        )
+    )
+    try:
+        # optional dependency, see PLOTEXT_API
+        import plotext  # noqa: PLC0415
+    except ImportError:
+        plotext = None
+    if plotext is None or not all(hasattr(plotext, name) for name in PLOTEXT_API):
+        print_sparklines(title, histories, number_of_teams, highlights)
+        return
+    plot_curves(plotext, title, histories, number_of_teams)
+
+
+def plot_curves(
+    plt: ModuleType, title: str, histories: dict[str, History], number_of_teams: int
+) -> None:
+    number_of_matchdays = max(
+        (len(history.placements) for history in histories.values()), default=0
+    )
+    matchdays = list(range(1, number_of_matchdays + 1))
+
+    plt.clear_figure()
+    plt.subplots(2, 1)
+
+    plt.subplot(1, 1)
+    plt.theme("pro")
+    plt.title(f"{title} Placements")
+    for team, history in histories.items():
+        plt.plot(matchdays[: len(history.placements)], history.placements, label=team)
+    plt.xticks(matchdays)
+    plt.yticks(list(range(1, number_of_teams + 1)))
+    plt.yreverse()
+
+    plt.subplot(2, 1)
+    plt.theme("pro")
+    plt.title(f"{title} Points")
+    for team, history in histories.items():
+        plt.plot(matchdays[: len(history.points)], history.points, label=team)
+    plt.xticks(matchdays)
+
+    plt.show()
+
+
+def print_sparklines(
+    title: str,
+    histories: dict[str, History],
+    number_of_teams: int,
+    highlights: list[str],
+) -> None:
+    max_points = max(
+        (max(history.points, default=0) for history in histories.values()),
+        default=0,
+    )
+
+    # placements and points share a column, two full seasons do not fit 80 chars
+    table = Table(title=title, box=ROUNDED, show_lines=True)
+    table.add_column("Team", header_style=DEFAULT_COLUMN_SETTINGS["header_style"])
+    table.add_column("Placements\nPoints", no_wrap=True, **DEFAULT_COLUMN_SETTINGS)
+    table.add_column("Pl\nPts", **DEFAULT_COLUMN_SETTINGS)
+
+    team_matcher = team_registry.matcher(highlights)
+    for team, history in histories.items():
+        # a higher bar is a better placement
+        placements = sparkline(
+            [number_of_teams - place for place in history.placements],
+            number_of_teams - 1,
+        )
+        points = sparkline(history.points, max_points)
+        final = (
+            f"{history.placements[-1]}\n{history.points[-1]}"
+            if history.placements
+            else ""
+        )
+        table.add_row(
+            team,
+            f"{placements}\n{points}",
+            final,
+            style=HIGHLIGHT_STYLE
+            if team_matcher.matches(team_registry.register(team))
+            else None,
+        )
+
+    print()
+    Console().print(table, justify="center")
+
+
+def sparkline(values: list[int], maximum: int) -> str:
+    """Draws the values between 0 and maximum as a line of block characters."""
+    if maximum <= 0:
+        return SPARK_BLOCKS[0] * len(values)
+    top = len(SPARK_BLOCKS) - 1
+    return "".join(SPARK_BLOCKS[round(value * top / maximum)] for value in values)
@@ -0,0 +1,98 @@
+"""Creating colorful strings of the meetings of two teams."""
+
+from __future__ import annotations
+
+from rich.box import ROUNDED
+from rich.console import Console
+from rich.table import Table
+
+from bundesliga_scraper.data_printer.fixture_printer import (
+    LOSING_STYLE,
+    LOSING_STYLE_END,
+    NEUTRAL_STYLE,
+    NEUTRAL_STYLE_END,
+    WINNING_STYLE,
+    WINNING_STYLE_END,
+)
+from bundesliga_scraper.data_printer.table_printer import DEFAULT_COLUMN_SETTINGS
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.head_to_head import (
+    HeadToHead,
+    HeadToHeadRecord,
+    Meeting,
+)
+from bundesliga_scraper.request_handler.utils import format_season
+
+
+def print_head_to_head(title: str, head_to_head: HeadToHead, recent: int) -> None:
+    """Prints the all-time record and the most recent meetings.
+
+    Args:
+        title (str): title, e.g. "Bayern vs Dortmund"
+        head_to_head (HeadToHead): meetings of the teams
+        recent (int): number of meetings that are listed
+    """
+    console = Console()
+    console.print(title, justify="center")
+    console.print(create_record_table(head_to_head), justify="center")
+    console.print(
+        create_meetings_table(head_to_head, head_to_head.recent(recent)),
+        justify="center",
+    )
+
+
+def create_record_table(head_to_head: HeadToHead) -> Table:
+    table = Table(title="All-time Record", box=ROUNDED)
+    table.add_column("", header_style=DEFAULT_COLUMN_SETTINGS["header_style"])
+    for column in ("Matches", "Won", "Draw", "Lost", "Goals", "+/-"):
+        table.add_column(column, **DEFAULT_COLUMN_SETTINGS)
+
+    for name, record in (
+        ("Total", head_to_head.record()),
+        ("Home", head_to_head.record(away=False)),
+        ("Away", head_to_head.record(home=False)),
+    ):
+        table.add_row(name, *get_record_cells(record))
+    return table
+
+
+def get_record_cells(record: HeadToHeadRecord) -> tuple[str, ...]:
+    return (
+        str(record.matches),
+        f"{WINNING_STYLE}{record.won}{WINNING_STYLE_END}",
+        f"{NEUTRAL_STYLE}{record.draw}{NEUTRAL_STYLE_END}",
+        f"{LOSING_STYLE}{record.lost}{LOSING_STYLE_END}",
+        f"{record.goals}:{record.opponent_goals}",
+        str(record.goals - record.opponent_goals),
+    )
+
+
+def create_meetings_table(head_to_head: HeadToHead, meetings: list[Meeting]) -> Table:
+    table = Table(title="Recent Meetings", box=ROUNDED)
+    table.add_column("Season", **DEFAULT_COLUMN_SETTINGS)
+    table.add_column("Md", **DEFAULT_COLUMN_SETTINGS)
+    table.add_column(
+        "Home", justify="right", header_style=DEFAULT_COLUMN_SETTINGS["header_style"]
+    )
+    table.add_column("", **DEFAULT_COLUMN_SETTINGS)
+    table.add_column("Away", header_style=DEFAULT_COLUMN_SETTINGS["header_style"])
+
+    for meeting in meetings:
+        fixture = meeting.fixture
+        style_open, style_close = get_style(head_to_head, fixture)
+        table.add_row(
+            format_season(meeting.season),
+            str(fixture.matchday),
+            fixture.home_team,
+            f"{style_open}{fixture.home_goals} : {fixture.away_goals}{style_close}",
+            fixture.away_team,
+        )
+    return table
+
+
+def get_style(head_to_head: HeadToHead, fixture: FixtureEntry) -> tuple[str, str]:
+    if head_to_head.team_matches.team_won_match(fixture):
+        return WINNING_STYLE, WINNING_STYLE_END
+    if head_to_head.team_matches.team_lost_match(fixture):
+        return LOSING_STYLE, LOSING_STYLE_END
+    return NEUTRAL_STYLE, NEUTRAL_STYLE_END
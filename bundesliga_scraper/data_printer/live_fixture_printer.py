@@ -0,0 +1,96 @@
+"""Rendering a matchday that is followed live, only changed rows are redrawn."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from rich.console import Group, RenderableType
+from rich.panel import Panel
+from rich.text import Text
+
+from bundesliga_scraper.data_printer.fixture_printer import (
+    LIVE_MARKER,
+    WIDTH,
+    append_rows,
+    create_title,
+    get_fixture_text,
+)
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.matchday import Matchday
+
+
+class LiveFixturePrinter:
+    """Keeps the rendered row of every fixture between two updates.
+
+    A fixture is identified by its home and away team, its row is only rendered
+    again when the fixture entry differs from the one of the last update.
+    """
+
+    def __init__(self, title: str, highlights: list[str]) -> None:
+        self.title = title
+        self.highlights = highlights
+        self.rows: dict[tuple[str, str], tuple[FixtureEntry, Text]] = {}
+        self.rendered_rows = 0
+
+    def update(self, matchday: Matchday) -> list[FixtureEntry]:
+        """Renders the rows of changed fixtures.
+
+        Args:
+            matchday (Matchday): latest state of the matchday
+
+        Returns:
+            list[FixtureEntry]: fixtures that changed since the last update
+        """
+        changed = []
+        for fixture in matchday.fixtures:
+            key = (fixture.home_team, fixture.away_team)
+            cached = self.rows.get(key)
+            if cached is not None and cached[0] == fixture:
+                continue
+            self.rows[key] = (fixture, get_fixture_text(fixture, self.highlights))
+            changed.append(fixture)
+        self.rendered_rows += len(changed)
+        return changed
+
+    def render(self, matchday: Matchday, status: str) -> RenderableType:
+        renderables: list[RenderableType] = [create_title(self.title)]
+
+        matchday_weekdays_split = matchday.split_fixture_into_weekdays()
+        for weekday_date, kickoff_times in matchday_weekdays_split.items():
+            renderables.append(
+                Panel(
+                    renderable=self._panel_content(kickoff_times),
+                    title=weekday_date.strftime(r"%d.%m.%Y, %A"),
+                    width=WIDTH,
+                    padding=1,
+                )
+            )
+
+        renderables.append(Text(status, style="dim"))
+        return Group(*renderables)
+
+    def _panel_content(self, kickoff_times: dict[str, list[FixtureEntry]]) -> Text:
+        # assembled like fixture_printer.get_panel_content, from the cached rows
+        panel_content = Text()
+        for kickoff_time, fixtures in kickoff_times.items():
+            if any(fixture.match_is_live for fixture in fixtures):
+                panel_content.append(f"{kickoff_time}{LIVE_MARKER}\n")
+            else:
+                panel_content.append(f"{kickoff_time}\n")
+            append_rows(
+                panel_content,
+                (
+                    self.rows[(fixture.home_team, fixture.away_team)][1]
+                    for fixture in fixtures
+                ),
+            )
+        return panel_content
+
+
+def get_status_line(updated_at: datetime, next_update_in: float | None) -> str:
+    updated = updated_at.strftime(r"%H:%M:%S")
+    if next_update_in is None:
+        return f"Updated {updated}, all matches are finished."
+    return (
+        f"Updated {updated}, next update in {round(next_update_in)}s (Ctrl+C to quit)"
+    )
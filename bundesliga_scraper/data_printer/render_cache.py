@@ -0,0 +1,77 @@
+"""Cache of rendered tables and fixtures, reused by sessions and repeated jobs."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from rich.console import Console, RenderableType
+from rich.segment import Segment, Segments
+
+
+class RenderCache:
+    """Keeps the segments rich rendered for a view, per console width.
+
+    Like api.memory_cache, a rendering is only reused as long as the objects it
+    was created from are still the same, so changed data is rendered again.
+    The least recently used renderings are dropped once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.rendered: OrderedDict[Hashable, tuple[tuple[Any, ...], list[Segment]]] = (
+            OrderedDict()
+        )
+
+    def render(
+        self,
+        console: Console,
+        key: Hashable,
+        sources: tuple[Any, ...],
+        create: Callable[[], RenderableType],
+    ) -> list[Segment]:
+        """Returns the segments stored under key or renders them.
+
+        Args:
+            console (Console): console the segments are rendered for
+            key (Hashable): identifies the view, e.g. league, matchday, highlights
+            sources (tuple): objects the view is derived from
+            create (Callable): creates the renderable of the view
+
+        Returns:
+            list[Segment]: the cached or newly rendered segments
+        """
+        key = (key, console.width, console.options.ascii_only)
+        cached = self.rendered.get(key)
+        if cached is not None:
+            cached_sources, segments = cached
+            if len(cached_sources) == len(sources) and all(
+                cached_source is source
+                for cached_source, source in zip(cached_sources, sources)
+            ):
+                self.rendered.move_to_end(key)
+                return segments
+
+        segments = list(console.render(create()))
+        self.rendered[key] = (sources, segments)
+        self.rendered.move_to_end(key)
+        if len(self.rendered) > self.maxsize:
+            self.rendered.popitem(last=False)
+        return segments
+
+    def print(
+        self,
+        key: Hashable,
+        sources: tuple[Any, ...],
+        create: Callable[[], RenderableType],
+        console: Console | None = None,
+    ) -> None:
+        console = Console() if console is None else console
+        console.print(Segments(self.render(console, key, sources, create)))
+
+    def clear(self) -> None:
+        self.rendered.clear()
+
+
+render_cache = RenderCache()
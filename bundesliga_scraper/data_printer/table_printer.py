@@ -2,10 +2,12 @@
 
 from rich.box import ROUNDED
 from rich.console import Console
-from rich.table import Table
 from rich.style import Style
+from rich.table import Table
+from rich.text import Text
 
 from bundesliga_scraper.datatypes.table_entry import TableEntry
+from bundesliga_scraper.datatypes.team_registry import team_registry
 
 
 HEADER_STYLE = Style(bold=False)
@@ -17,11 +19,16 @@ def print_table_entries(
     title: str, table_list: list[TableEntry], highlights: list[str]
 ) -> None:
     print()
+    console = Console()
+    console.print(create_table_renderable(title, table_list, highlights))
+
+
+def create_table_renderable(
+    title: str, table_list: list[TableEntry], highlights: list[str]
+) -> Table:
     table = create_table(title)
     add_rows(table, table_list, highlights)
-
-    console = Console()
-    console.print(table)
+    return table
 
 
 def create_table(title: str, last_5: bool = True) -> Table:
@@ -54,57 +61,50 @@ def add_rows(
     highlights: list[str],
     place: int = None,
 ) -> None:
+    highlight_matcher = team_registry.matcher(highlights)
     for placement, entry in enumerate(table_entries, start=1):
         style = ""
         if place is not None and not (place - 2 <= placement <= place + 3):
             continue
-        if any(
-            highlight.lower() in entry.team_name.lower() for highlight in highlights
-        ):
+        if highlight_matcher.matches(entry.team_id):
             style = HIGHLIGHT_STYLE
-        goal_diff = determine_goal_diff_color(entry.goal_diff)
+        goal_diff = determine_goal_diff_text(entry.goal_diff)
         placement = determine_placement_string(
             placement, entry.get_standings_direction().value
         )
 
+        cells = [
+            create_cell(placement),
+            create_cell(entry.team_name),
+            create_cell(str(entry.matches)),
+            create_cell(str(entry.won)),
+            create_cell(str(entry.draw)),
+            create_cell(str(entry.lost)),
+            create_cell(f"{entry.goals}:{entry.opponent_goals}"),
+            goal_diff,
+            create_cell(str(entry.points)),
+        ]
         if place is None:
-            table.add_row(
-                str(placement),
-                str(entry.team_name),
-                str(entry.matches),
-                str(entry.won),
-                str(entry.draw),
-                str(entry.lost),
-                f"{entry.goals}:{entry.opponent_goals}",
-                goal_diff,
-                str(entry.points),
-                # gets the results of the last 5 matches in reversed order
-                "".join(entry.history.matches[:-6:-1]),
-                style=style,
-            )
-        else:
-            table.add_row(
-                str(placement),
-                str(entry.team_name),
-                str(entry.matches),
-                str(entry.won),
-                str(entry.draw),
-                str(entry.lost),
-                f"{entry.goals}:{entry.opponent_goals}",
-                goal_diff,
-                str(entry.points),
-                style=style,
-            )
-
-
-def determine_goal_diff_color(goal_diff: int) -> str:
+            # gets the results of the last 5 matches in reversed order
+            cells.append(create_cell("".join(entry.history.matches[:-6:-1])))
+        table.add_row(*cells, style=style)
+
+
+def create_cell(value: str, style: str = "") -> Text:
+    # built directly instead of parsed from markup when the table is rendered,
+    # a span keeps the style off the justification padding like markup does
+    cell = Text(value)
+    if style:
+        cell.stylize(style)
+    return cell
+
+
+def determine_goal_diff_text(goal_diff: int) -> Text:
     if goal_diff < 0:
-        colored_goal_diff = str(f"[red]{goal_diff}")
-    elif goal_diff > 0:
-        colored_goal_diff = str(f"[green]{goal_diff}")
-    else:
-        colored_goal_diff = str(f"[white]{goal_diff}")
-    return colored_goal_diff
+        return create_cell(str(goal_diff), "red")
+    if goal_diff > 0:
+        return create_cell(str(goal_diff), "green")
+    return create_cell(str(goal_diff), "white")
 
 
 def determine_placement_string(placement: int, directions_symbol: str) -> str:
@@ -1,5 +1,3 @@
-import requests
-from bundesliga_scraper.datatypes.constants import League
 from rich.console import Console
 from rich.panel import Panel
 from rich.columns import Columns
@@ -17,10 +15,13 @@ from bundesliga_scraper.data_printer.table_printer import add_rows, create_table
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
 from bundesliga_scraper.datatypes.table_entry import TableEntry
 from bundesliga_scraper.datatypes.team import TeamSeasonMatches
+from bundesliga_scraper.datatypes.team_registry import team_registry
 
 
 def print_team_entries(
-    league: League, title: str, selected_team_matches: TeamSeasonMatches
+    title: str,
+    selected_team_matches: TeamSeasonMatches,
+    table_entries: list[TableEntry],
 ) -> None:
     console = Console()
 
@@ -35,7 +36,7 @@ def print_team_entries(
         renderable=fixtures_panel_content, title="Fixtures", padding=1
     )
 
-    table = do_table(league, selected_team_matches.team_name)
+    table = do_table(table_entries, selected_team_matches.team_name)
 
     height_diff = results_panel_content.count("\n") - fixtures_panel_content.count("\n")
     if height_diff > 0:
@@ -50,16 +51,13 @@ def print_team_entries(
     console.print(columns, justify="center")
 
 
-def do_table(league: League, team_name: str):
-    table_data = requests.get(
-        f"https://api.openligadb.de/getbltable/{league}/2023", timeout=3
-    ).json()
-    table_entries = [TableEntry.from_dict(entry) for entry in table_data]
-    table_entries.sort(reverse=True)
+def do_table(table_entries: list[TableEntry], team_name: str):
+    table_entries = sorted(table_entries, reverse=True)
 
+    team_matcher = team_registry.matcher([team_name])
     placement = 0
     for idx, entry in enumerate(table_entries, start=1):
-        if team_name in entry.team_name:
+        if team_matcher.matches(entry.team_id):
             placement = idx
 
     table = create_table(title="", last_5=False)
@@ -69,11 +67,13 @@ def do_table(league: League, team_name: str):
 
 def get_results_string(selected_team_matches: TeamSeasonMatches) -> str:
     max_home_length = max(
-        len(result.home_team) for result in selected_team_matches.results
+        (len(result.home_team) for result in selected_team_matches.results),
+        default=0,
     )
 
     max_away_length = max(
-        len(result.away_team) for result in selected_team_matches.results
+        (len(result.away_team) for result in selected_team_matches.results),
+        default=0,
     )
 
     return "\n\n".join(
@@ -105,18 +105,20 @@ def get_result_string(
     home_goal_string = f"[o u]| {result.home_goals} |[/]"
     away_goal_string = f"[o u]| {result.away_goals} |[/]"
 
-    if selected_team_matches.team_name in result.home_team:
+    if selected_team_matches.is_home_team(result):
         return f"{style_open}{result.home_team.rjust(max_length)} {home_goal_string}{style_closing}{MATCH_SEPERATOR}{away_goal_string} {result.away_team.ljust(max_away_length)} ({result.matchday})"
     return f"{result.home_team.rjust(max_length)} {home_goal_string}{MATCH_SEPERATOR}{style_open}{away_goal_string} {result.away_team.ljust(max_away_length)}{style_closing} ({result.matchday})"
 
 
 def get_fixtures_string(selected_team_matches: TeamSeasonMatches) -> str:
     max_home_length = max(
-        len(fixture.home_team) for fixture in selected_team_matches.fixtures
+        (len(fixture.home_team) for fixture in selected_team_matches.fixtures),
+        default=0,
     )
 
     max_away_length = max(
-        len(fixture.away_team) for fixture in selected_team_matches.fixtures
+        (len(fixture.away_team) for fixture in selected_team_matches.fixtures),
+        default=0,
     )
     return "\n\n".join(
         get_fixture_string(
@@ -131,6 +133,6 @@ def get_fixture_string(
 ) -> str:
     match_seperator = " [u o]| - |[/] : [u o]| - |[/] "
 
-    if team_name in fixture.home_team:
+    if team_registry.matcher([team_name]).matches(fixture.home_team_id):
         return f"{NEUTRAL_STYLE}{fixture.home_team.rjust(max_length)}{NEUTRAL_STYLE_END}{match_seperator}{fixture.away_team.ljust(max_away_length)} ({fixture.matchday})"
     return f"{fixture.home_team.rjust(max_length)}{match_seperator}{NEUTRAL_STYLE}{fixture.away_team.ljust(max_away_length)}{NEUTRAL_STYLE_END} ({fixture.matchday})"
@@ -1,12 +1,8 @@
-from enum import Enum, StrEnum, auto
+import time
+from enum import Enum, auto
 
-
-class League(StrEnum):
-    Bundesliga = "bl1"
-    Bundesliga_2 = "bl2"
-
-
-LEAGUE_NAMES = {League.Bundesliga: "Bundesliga", League.Bundesliga_2: "2. Bundesliga"}
+# a season starts in summer and is named after the year it started in
+SEASON_START_MONTH = 7
 
 
 class MatchResult(Enum):
@@ -19,3 +15,12 @@ class ResultSymbol(Enum):
     WIN = "✅"
     LOSE = "❌"
     DRAW = "➖"
+
+
+def get_current_season() -> int:
+    """Returns the running season, commands answer for it unless --season is given."""
+    # time instead of datetime, the parser imports this module at startup
+    today = time.localtime()
+    if today.tm_mon >= SEASON_START_MONTH:
+        return today.tm_year
+    return today.tm_year - 1
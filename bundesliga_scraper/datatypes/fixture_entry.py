@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-from bundesliga_scraper.datatypes.constants import League, MatchResult
+from bundesliga_scraper.datatypes.constants import MatchResult
+from bundesliga_scraper.datatypes.league_registry import (
+    END_RESULT_TYPE_ID,
+    league_registry,
+)
+from bundesliga_scraper.datatypes.team_registry import team_registry
 
+# a match without reported results counts as live this long after its kickoff
+LIVE_WINDOW = timedelta(hours=1)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FixtureEntry:
     """Class that represents a fixture entry of a given matchday."""
 
@@ -18,51 +28,58 @@ class FixtureEntry:
     away_goals: int
     matchday: int
     match_is_finished: bool
-    match_is_live: bool
+    # results of an unfinished match were reported, see match_is_live
+    has_results: bool
     date: datetime
+    # ids of the team registry, compared instead of the team names
+    home_team_id: int
+    away_team_id: int
+
+    @classmethod
+    def from_list(cls, data: Iterable[dict]) -> list[FixtureEntry]:
+        """Creates the fixture entries of a whole (decoded) api response."""
+        return [cls.from_dict(fixture_data) for fixture_data in data]
 
     @classmethod
     def from_dict(cls, data: dict) -> FixtureEntry:
-        home_team = data["team1"]["teamName"]
-        away_team = data["team2"]["teamName"]
-        goals = data["goals"]
+        """Decodes one match of the api, every field at once.
+
+        Tables and standings read the teams, goals and results of every
+        fixture, so the fields are made cheap to decode instead of deferred.
+        Commands that show a single matchday only decode that matchday, see
+        api.extract_matchday.
+        """
+        home_team_id = team_registry.register(data["team1"]["teamName"])
+        away_team_id = team_registry.register(data["team2"]["teamName"])
         match_is_finished = bool(data["matchIsFinished"])
-        match_is_live = False
         match_results = data["matchResults"]
-        date = datetime.strptime(data["matchDateTime"], r"%Y-%m-%dT%H:%M:%S")
+        date = _parse_match_date(data["matchDateTime"])
         matchday = int(data["group"]["groupOrderID"])
 
         if match_is_finished:
-            # in Bundesliga matchResults[1] is end of game result
-            if data["leagueShortcut"] == League.Bundesliga:
-                home_goals = int(data["matchResults"][1]["pointsTeam1"])
-                away_goals = int(data["matchResults"][1]["pointsTeam2"])
-            # in 2. Bundesliga matchResults[0] is end of game results
-            elif data["leagueShortcut"] == League.Bundesliga_2:
-                home_goals = int(data["matchResults"][0]["pointsTeam1"])
-                away_goals = int(data["matchResults"][0]["pointsTeam2"])
-        elif match_results or timedelta(hours=0) < datetime.now() - date < timedelta(
-            hours=1
-        ):
-            match_is_live = True
+            end_result = _get_end_result(match_results, data["leagueShortcut"])
+            home_goals = int(end_result["pointsTeam1"])
+            away_goals = int(end_result["pointsTeam2"])
+        else:
             home_goals, away_goals = 0, 0
-            for goal in goals:
+            # only the few running matches have goals, the others none yet
+            for goal in data["goals"]:
                 if goal["scoreTeam1"] == 0:
                     away_goals += 1
                 else:
                     home_goals += 1
-        else:
-            home_goals, away_goals = 0, 0
 
         return cls(
-            home_team=home_team,
-            away_team=away_team,
+            home_team=team_registry.names[home_team_id],
+            away_team=team_registry.names[away_team_id],
             home_goals=home_goals,
             away_goals=away_goals,
             matchday=matchday,
             match_is_finished=match_is_finished,
-            match_is_live=match_is_live,
+            has_results=not match_is_finished and bool(match_results),
             date=date,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
         )
 
     def home_team_won(self) -> bool:
@@ -83,8 +100,25 @@ class FixtureEntry:
             return MatchResult.AWAY_WON
         return MatchResult.DRAW
 
-    def is_in_future(self):
-        return not self.match_is_finished and not self.match_is_live
+    @property
+    def match_is_live(self) -> bool:
+        """Whether the match is running right now, see is_live_at."""
+        # most matches of a season are finished, they do not need the clock
+        return not self.match_is_finished and self.is_live_at(datetime.now())
+
+    def is_live_at(self, now: datetime) -> bool:
+        """Live once results are reported, or in the first hour after kickoff.
+
+        Derived from the kickoff on every call, a cached entry does not keep
+        the state of the time it was parsed at.
+        """
+        if self.match_is_finished:
+            return False
+        return self.has_results or timedelta(0) < now - self.date < LIVE_WINDOW
+
+    def is_in_future(self, now: datetime | None = None):
+        now = datetime.now() if now is None else now
+        return not self.match_is_finished and not self.is_live_at(now)
 
     def get_home_team(self) -> str:
         return self.home_team
@@ -96,3 +130,23 @@ class FixtureEntry:
             else " - : - "
         )
         return f"{self.home_team:>30}{result_str}{self.away_team}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_match_date(match_date: str) -> datetime:
+    # a matchday only has a handful of different kickoff times
+    return datetime.fromisoformat(match_date)
+
+
+def _get_end_result(match_results: list[dict], league_shortcut: str) -> dict:
+    # the order of the results differs between leagues, e.g. the end result is
+    # the first one in 2. Bundesliga and the second one in Bundesliga
+    league = league_registry.get_by_shortcut(league_shortcut)
+    end_result_type_id = (
+        END_RESULT_TYPE_ID if league is None else league.end_result_type_id
+    )
+    for result in match_results:
+        if result.get("resultTypeID") == end_result_type_id:
+            return result
+    # without result types the end result is the last one that was recorded
+    return max(match_results, key=lambda result: result.get("resultOrderID", 0))
@@ -0,0 +1,156 @@
+"""Module that stores the fixtures of a season column by column."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.matchday import Matchday
+from bundesliga_scraper.datatypes.team_registry import team_registry
+
+# kickoff times are stored as seconds since this (naive, local) date
+KICKOFF_EPOCH = datetime(1970, 1, 1)
+
+STATUS_FUTURE = 0
+# results are reported but the match is not finished, see FixtureEntry.has_results
+STATUS_LIVE = 1
+STATUS_FINISHED = 2
+
+
+class SeasonFixtureStore:
+    """Compact, array backed storage of all fixtures of a season.
+
+    Every fixture is a row over a handful of typed arrays (about 16 bytes per
+    fixture) instead of an object with its own datetime and team strings.
+    Teams are referenced by their index into `team_names`. FixtureEntry
+    objects are only created when a row is accessed.
+    """
+
+    def __init__(self, team_names: Iterable[str] = ()) -> None:
+        self.team_names: list[str] = list(team_names)
+        self.team_ids: dict[str, int] = {
+            name: team_id for team_id, name in enumerate(self.team_names)
+        }
+
+        self.home_ids = array("H")
+        self.away_ids = array("H")
+        self.home_goals = array("B")
+        self.away_goals = array("B")
+        self.matchdays = array("B")
+        self.status = array("B")
+        self.kickoffs = array("q")
+
+    @classmethod
+    def from_fixtures(
+        cls, fixtures: Iterable[FixtureEntry], team_names: Iterable[str] = ()
+    ) -> SeasonFixtureStore:
+        """Builds the store, teams missing in team_names are added on the fly."""
+        store = cls(team_names)
+        for fixture in fixtures:
+            store.append(fixture)
+        return store
+
+    @classmethod
+    def from_match_data(
+        cls, match_data: Iterable[dict], team_names: Iterable[str] = ()
+    ) -> SeasonFixtureStore:
+        """Builds the store from a (decoded) api response.
+
+        Every FixtureEntry is only alive until its row is appended.
+        """
+        return cls.from_fixtures(
+            (FixtureEntry.from_dict(fixture_data) for fixture_data in match_data),
+            team_names,
+        )
+
+    @classmethod
+    def from_matchdays(
+        cls, matchdays: Iterable[Matchday], team_names: Iterable[str] = ()
+    ) -> SeasonFixtureStore:
+        return cls.from_fixtures(
+            (fixture for matchday in matchdays for fixture in matchday.fixtures),
+            team_names,
+        )
+
+    @property
+    def last_matchday(self) -> int:
+        return max(self.matchdays, default=0)
+
+    def with_team_order(self, team_names: Iterable[str]) -> SeasonFixtureStore:
+        """Returns a copy whose team ids follow the order of team_names.
+
+        Teams of the fixtures that are missing in team_names come after them.
+        """
+        store = SeasonFixtureStore(team_names)
+        team_ids = [store._get_team_id(team_name) for team_name in self.team_names]
+        store.home_ids = array("H", (team_ids[team_id] for team_id in self.home_ids))
+        store.away_ids = array("H", (team_ids[team_id] for team_id in self.away_ids))
+        store.home_goals = self.home_goals[:]
+        store.away_goals = self.away_goals[:]
+        store.matchdays = self.matchdays[:]
+        store.status = self.status[:]
+        store.kickoffs = self.kickoffs[:]
+        return store
+
+    def append(self, fixture: FixtureEntry) -> None:
+        self.home_ids.append(self._get_team_id(fixture.home_team))
+        self.away_ids.append(self._get_team_id(fixture.away_team))
+        self.home_goals.append(fixture.home_goals)
+        self.away_goals.append(fixture.away_goals)
+        self.matchdays.append(fixture.matchday)
+        if fixture.match_is_finished:
+            self.status.append(STATUS_FINISHED)
+        elif fixture.has_results:
+            self.status.append(STATUS_LIVE)
+        else:
+            self.status.append(STATUS_FUTURE)
+        self.kickoffs.append((fixture.date - KICKOFF_EPOCH) // timedelta(seconds=1))
+
+    def fixture(self, idx: int) -> FixtureEntry:
+        status = self.status[idx]
+        home_team_id = team_registry.register(self.team_names[self.home_ids[idx]])
+        away_team_id = team_registry.register(self.team_names[self.away_ids[idx]])
+        return FixtureEntry(
+            home_team=team_registry.names[home_team_id],
+            away_team=team_registry.names[away_team_id],
+            home_goals=self.home_goals[idx],
+            away_goals=self.away_goals[idx],
+            matchday=self.matchdays[idx],
+            match_is_finished=status == STATUS_FINISHED,
+            has_results=status == STATUS_LIVE,
+            date=KICKOFF_EPOCH + timedelta(seconds=self.kickoffs[idx]),
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+        )
+
+    def matchday_fixtures(self, matchday: int) -> list[FixtureEntry]:
+        return [
+            self.fixture(idx)
+            for idx, fixture_matchday in enumerate(self.matchdays)
+            if fixture_matchday == matchday
+        ]
+
+    def to_matchdays(self, number_of_matchdays: int) -> list[Matchday]:
+        season_matchdays = [
+            Matchday(matchday=matchday)
+            for matchday in range(1, number_of_matchdays + 1)
+        ]
+        for fixture in self:
+            season_matchdays[fixture.matchday - 1].fixtures.append(fixture)
+        return season_matchdays
+
+    def _get_team_id(self, team_name: str) -> int:
+        team_id = self.team_ids.get(team_name)
+        if team_id is None:
+            team_id = len(self.team_names)
+            self.team_names.append(team_name)
+            self.team_ids[team_name] = team_id
+        return team_id
+
+    def __len__(self) -> int:
+        return len(self.matchdays)
+
+    def __iter__(self) -> Iterator[FixtureEntry]:
+        return (self.fixture(idx) for idx in range(len(self)))
@@ -0,0 +1,72 @@
+"""Module that represents the meetings of two teams across seasons."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.team import TeamSeasonMatches
+
+
+@dataclass(frozen=True, slots=True)
+class Meeting:
+    # league shortcut, e.g. bl1
+    league: str
+    season: int
+    fixture: FixtureEntry
+
+
+@dataclass(frozen=True, slots=True)
+class HeadToHeadRecord:
+    matches: int = 0
+    won: int = 0
+    draw: int = 0
+    lost: int = 0
+    goals: int = 0
+    opponent_goals: int = 0
+
+
+@dataclass
+class HeadToHead:
+    """Finished matches of a team against an opponent, the oldest first.
+
+    team_name and opponent_name may be partial names like "Bayern", the record
+    is counted from the view of the team.
+    """
+
+    team_name: str
+    opponent_name: str
+    meetings: list[Meeting] = field(default_factory=list)
+    team_matches: TeamSeasonMatches = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.team_matches = TeamSeasonMatches(
+            team_name=self.team_name,
+            results=[meeting.fixture for meeting in self.meetings],
+        )
+
+    def record(self, home: bool = True, away: bool = True) -> HeadToHeadRecord:
+        """Counts the meetings the team played at home and / or away."""
+        matches = won = draw = lost = goals = opponent_goals = 0
+        for fixture in self.team_matches.results:
+            is_home = self.team_matches.is_home_team(fixture)
+            if (is_home and not home) or (not is_home and not away):
+                continue
+            matches += 1
+            if is_home:
+                goals += fixture.home_goals
+                opponent_goals += fixture.away_goals
+            else:
+                goals += fixture.away_goals
+                opponent_goals += fixture.home_goals
+            if self.team_matches.team_won_match(fixture):
+                won += 1
+            elif self.team_matches.team_lost_match(fixture):
+                lost += 1
+            else:
+                draw += 1
+        return HeadToHeadRecord(matches, won, draw, lost, goals, opponent_goals)
+
+    def recent(self, count: int) -> list[Meeting]:
+        """Returns the last count meetings, the most recent first."""
+        return self.meetings[: -count - 1 : -1] if count > 0 else []
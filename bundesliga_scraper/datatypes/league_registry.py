@@ -0,0 +1,123 @@
+"""Module that knows the leagues that can be selected and their metadata.
+
+The built-in leagues can be extended, or changed, with a json file named by
+BUNDESLIGA_SCRAPER_LEAGUES, a list of objects with the fields of League, e.g.
+[{"name": "eredivisie", "shortcut": "ere", "display_name": "Eredivisie",
+"number_of_matchdays": 34}]. Nothing in here imports requests or rich, the
+parser uses the registry for its choices.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import NamedTuple
+
+LEAGUES_PATH_ENV = "BUNDESLIGA_SCRAPER_LEAGUES"
+ALL_LEAGUES = "all"
+LEAGUE_SEPARATOR = ","
+# resultTypeID of OpenLigaDB's "Endergebnis", 1 is the half time result
+END_RESULT_TYPE_ID = 2
+
+
+class League(NamedTuple):
+    """A league of OpenLigaDB, formatted as its shortcut, e.g. in urls.
+
+    A named tuple rather than a dataclass, importing dataclasses would double
+    the startup time of the parser.
+    """
+
+    # name on the command line, e.g. 2_bundesliga
+    name: str
+    # league shortcut of OpenLigaDB, e.g. bl2
+    shortcut: str
+    display_name: str
+    number_of_matchdays: int
+    end_result_type_id: int = END_RESULT_TYPE_ID
+
+    def __str__(self) -> str:
+        return self.shortcut
+
+
+BUILTIN_LEAGUES = (
+    League("bundesliga", "bl1", "Bundesliga", 34),
+    League("2_bundesliga", "bl2", "2. Bundesliga", 34),
+    League("3_liga", "bl3", "3. Liga", 38),
+)
+
+
+class LeagueRegistry:
+    """Leagues by their name and by their shortcut, in the order they were added."""
+
+    def __init__(self, leagues: tuple[League, ...] = ()) -> None:
+        self.leagues: dict[str, League] = {}
+        self.shortcuts: dict[str, League] = {}
+        for league in leagues:
+            self.add(league)
+
+    def add(self, league: League) -> None:
+        """Adds the league, a league with the same name is replaced in place."""
+        replaced = self.leagues.get(league.name)
+        if replaced is not None:
+            del self.shortcuts[replaced.shortcut]
+        self.leagues[league.name] = league
+        self.shortcuts[league.shortcut] = league
+
+    def load(self, path: str) -> None:
+        # only a league config file needs json, the parser imports this module
+        import json  # noqa: PLC0415
+
+        with open(path, encoding="utf-8") as file:
+            for league_config in json.load(file):
+                self.add(League(**league_config))
+
+    def names(self) -> list[str]:
+        return list(self.leagues)
+
+    def get(self, name: str) -> League:
+        league = self.leagues.get(name.lower())
+        if league is None:
+            raise ValueError(
+                f"Unknown league {name}, choose from {', '.join(self.leagues)}"
+            )
+        return league
+
+    def get_by_shortcut(self, shortcut: str) -> League | None:
+        return self.shortcuts.get(shortcut)
+
+    def select(self, selection: str) -> list[League]:
+        """Returns the leagues of a selection like `bundesliga,3_liga` or `all`.
+
+        Raises:
+            ValueError: if the selection names an unknown league
+        """
+        if selection.lower() == ALL_LEAGUES:
+            return list(self.leagues.values())
+        leagues = [
+            self.get(name.strip())
+            for name in selection.split(LEAGUE_SEPARATOR)
+            if name.strip()
+        ]
+        if not leagues:
+            raise ValueError("No league selected")
+        # a league named twice is answered once
+        return list(dict.fromkeys(leagues))
+
+    def is_selection(self, token: str) -> bool:
+        try:
+            self.select(token)
+        except ValueError:
+            return False
+        return True
+
+    def is_multi_league(self, selection: str) -> bool:
+        return len(self.select(selection)) > 1
+
+
+def create_league_registry() -> LeagueRegistry:
+    registry = LeagueRegistry(BUILTIN_LEAGUES)
+    if os.environ.get(LEAGUES_PATH_ENV):
+        registry.load(os.environ[LEAGUES_PATH_ENV])
+    return registry
+
+
+league_registry = create_league_registry()
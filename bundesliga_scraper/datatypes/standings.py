@@ -0,0 +1,323 @@
+"""Module that answers table requests from cumulative season standings."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from bundesliga_scraper.datatypes.constants import ResultSymbol
+from bundesliga_scraper.datatypes.fixture_store import (
+    STATUS_FUTURE,
+    STATUS_LIVE,
+    SeasonFixtureStore,
+)
+from bundesliga_scraper.datatypes.matchday import Matchday
+from bundesliga_scraper.datatypes.table import Table
+from bundesliga_scraper.datatypes.table_entry import History, TableEntry
+from bundesliga_scraper.datatypes.team_registry import team_registry
+
+# index of each value inside a team's totals
+POINTS, WON, DRAW, LOST, GOALS, OPPONENT_GOALS, MATCHES = range(7)
+TOTALS_SIZE = 7
+
+
+@dataclass
+class TeamResults:
+    """Result symbols of a team in the order they were played."""
+
+    matchdays: list[int] = field(default_factory=list)
+    symbols: list[str] = field(default_factory=list)
+
+    def append(self, matchday: int, symbol: str) -> None:
+        self.matchdays.append(matchday)
+        self.symbols.append(symbol)
+
+    def between(self, from_: int, to: int) -> list[str]:
+        start = bisect_left(self.matchdays, from_)
+        end = bisect_right(self.matchdays, to)
+        return self.symbols[start:end]
+
+
+class SeasonStandings:
+    """Per-matchday cumulative totals of every team for a whole season.
+
+    The season is folded once, afterwards the table of any matchday range is
+    the difference of two prefix snapshots and costs O(teams) instead of
+    replaying every fixture in the range.
+    """
+
+    def __init__(
+        self,
+        league_name: str,
+        team_names: list[str],
+        matchdays: Iterable[Matchday] = (),
+    ) -> None:
+        self.league_name = league_name
+        self.team_names = team_names
+        # the fixtures the standings were folded from, see from_store
+        self.store: SeasonFixtureStore | None = None
+        self.team_ids = [team_registry.register(name) for name in team_names]
+        # registry id -> position of the team in team_names
+        self.team_index = {team_id: idx for idx, team_id in enumerate(self.team_ids)}
+
+        # prefix[m][team] holds the totals after matchday m, prefix[0] is empty
+        self.home_prefix: list[list[tuple[int, ...]]] = []
+        self.away_prefix: list[list[tuple[int, ...]]] = []
+        self.home_results = [TeamResults() for _ in team_names]
+        self.away_results = [TeamResults() for _ in team_names]
+        self.all_results = [TeamResults() for _ in team_names]
+
+        self._home_totals = [[0] * TOTALS_SIZE for _ in team_names]
+        self._away_totals = [[0] * TOTALS_SIZE for _ in team_names]
+        self._add_snapshot()
+
+        for matchday in matchdays:
+            for fixture in matchday.fixtures:
+                # like from_store, the standings count what the api reported
+                if not fixture.match_is_finished and not fixture.has_results:
+                    continue
+                self._add_fixture(
+                    matchday=matchday.matchday,
+                    home_idx=self.team_index[fixture.home_team_id],
+                    away_idx=self.team_index[fixture.away_team_id],
+                    goals=(fixture.home_goals, fixture.away_goals),
+                    is_live=fixture.has_results,
+                )
+            self._add_snapshot()
+
+    @classmethod
+    def from_table(cls, table: Table, matchdays: list[Matchday]) -> SeasonStandings:
+        return cls(
+            league_name=table.league_name,
+            team_names=list(table.teams),
+            matchdays=matchdays,
+        )
+
+    @classmethod
+    def from_store(
+        cls,
+        league_name: str,
+        store: SeasonFixtureStore,
+        team_names: Iterable[str] = (),
+    ) -> SeasonStandings:
+        """Folds the season straight from the columns of a fixture store.
+
+        Args:
+            league_name (str): name of the league
+            store (SeasonFixtureStore): fixtures of the season
+            team_names (Iterable[str]): order of the teams, equal teams are
+                placed in this order, teams missing here come last
+
+        Returns:
+            SeasonStandings: standings up to the last matchday of the store
+        """
+        store = store.with_team_order(team_names)
+        standings = cls(league_name=league_name, team_names=store.team_names)
+        standings.store = store
+
+        played_by_matchday: list[list[int]] = [[] for _ in range(store.last_matchday)]
+        for idx, (matchday, status) in enumerate(zip(store.matchdays, store.status)):
+            if status != STATUS_FUTURE:
+                played_by_matchday[matchday - 1].append(idx)
+
+        for matchday, played in enumerate(played_by_matchday, start=1):
+            for idx in played:
+                standings._add_fixture(
+                    matchday=matchday,
+                    home_idx=store.home_ids[idx],
+                    away_idx=store.away_ids[idx],
+                    goals=(store.home_goals[idx], store.away_goals[idx]),
+                    is_live=store.status[idx] == STATUS_LIVE,
+                )
+            standings._add_snapshot()
+        return standings
+
+    @property
+    def last_matchday(self) -> int:
+        return len(self.home_prefix) - 1
+
+    @property
+    def played_matchdays(self) -> int:
+        """Number of matchdays up to the last one a match was played on."""
+        played = 0
+        for matchday in range(1, self.last_matchday + 1):
+            # every played match adds to the home totals of a team
+            if self.home_prefix[matchday] != self.home_prefix[matchday - 1]:
+                played = matchday
+        return played
+
+    def calculate_history(self) -> dict[str, History]:
+        """Returns the placement and points of every team after every matchday.
+
+        Only played matchdays are included, the histories are ordered like
+        team_names and have no results. Standings folded from a fixture store
+        are computed all at once with numpy if it is installed.
+        """
+        # numpy takes about 0.1s to import, only the history pays for it
+        from bundesliga_scraper.datatypes import standings_matrix  # noqa: PLC0415
+
+        played_matchdays = self.played_matchdays
+        if self.store is not None and standings_matrix.numpy_available():
+            matrix = standings_matrix.StandingsMatrix.from_store(
+                self.store, self.store.last_matchday
+            )
+            histories = [
+                History(placements=placements, points=points)
+                for placements, points in zip(
+                    matrix.placements[:played_matchdays].T.tolist(),
+                    matrix.points[:played_matchdays].T.tolist(),
+                )
+            ]
+        else:
+            histories = [History() for _ in self.team_names]
+            for matchday in range(1, played_matchdays + 1):
+                totals = self._totals(1, matchday, home=True, away=True)
+                placements = self._placements(totals)
+                for idx, history in enumerate(histories):
+                    history.placements.append(placements[idx])
+                    history.points.append(totals[idx][POINTS])
+        return {
+            team_registry.names[team_id]: history
+            for team_id, history in zip(self.team_ids, histories)
+        }
+
+    def calculate_table(
+        self, from_: int, to: int, home: bool = True, away: bool = True
+    ) -> Table:
+        """Calculates the table of the matchdays from_ to to (both included).
+
+        The history of each entry holds the results of the range and the
+        placements / points of the last two matchdays, which is what the table
+        printer needs for the last 5 column and the standings direction.
+        """
+        from_ = max(1, from_)
+        to = min(self.last_matchday, to)
+
+        current = self._totals(from_, to, home, away)
+        previous = self._totals(from_, to - 1, home, away) if to > from_ else None
+
+        if home and away:
+            results = self.all_results
+        elif home:
+            results = self.home_results
+        else:
+            results = self.away_results
+        entries = [
+            self._create_entry(idx, totals, from_, to, results[idx])
+            for idx, totals in enumerate(current)
+        ]
+
+        snapshots = [current] if previous is None else [previous, current]
+        for totals in snapshots:
+            placements = self._placements(totals)
+            for idx, entry in enumerate(entries):
+                entry.history.placements.append(placements[idx])
+                entry.history.points.append(totals[idx][POINTS])
+
+        table = Table(
+            league_name=self.league_name,
+            teams={entry.team_name: entry for entry in entries},
+            standings=sorted(entries, reverse=True),
+        )
+        table.matchday = max((entry.matches for entry in entries), default=0)
+        return table
+
+    def _add_fixture(
+        self,
+        matchday: int,
+        home_idx: int,
+        away_idx: int,
+        goals: tuple[int, int],
+        is_live: bool,
+    ) -> None:
+        # goals of the home and of the away team
+        home_goals, away_goals = goals
+        home_symbol = _add_result(self._home_totals[home_idx], home_goals, away_goals)
+        away_symbol = _add_result(self._away_totals[away_idx], away_goals, home_goals)
+        if is_live:
+            return
+        self.home_results[home_idx].append(matchday, home_symbol)
+        self.all_results[home_idx].append(matchday, home_symbol)
+        self.away_results[away_idx].append(matchday, away_symbol)
+        self.all_results[away_idx].append(matchday, away_symbol)
+
+    def _add_snapshot(self) -> None:
+        self.home_prefix.append([tuple(totals) for totals in self._home_totals])
+        self.away_prefix.append([tuple(totals) for totals in self._away_totals])
+
+    def _totals(
+        self, from_: int, to: int, home: bool, away: bool
+    ) -> list[tuple[int, ...]]:
+        if to < from_:
+            return [(0,) * TOTALS_SIZE for _ in self.team_names]
+
+        prefixes = []
+        if home:
+            prefixes.append((self.home_prefix[to], self.home_prefix[from_ - 1]))
+        if away:
+            prefixes.append((self.away_prefix[to], self.away_prefix[from_ - 1]))
+
+        totals = []
+        for idx in range(len(self.team_names)):
+            team_totals = [0] * TOTALS_SIZE
+            for end, start in prefixes:
+                for value_idx, (end_value, start_value) in enumerate(
+                    zip(end[idx], start[idx])
+                ):
+                    team_totals[value_idx] += end_value - start_value
+            totals.append(tuple(team_totals))
+        return totals
+
+    def _placements(self, totals: list[tuple[int, ...]]) -> list[int]:
+        # sorted() is stable, equal teams keep the order of the team list
+        ranking = sorted(
+            range(len(totals)),
+            key=lambda idx: (
+                totals[idx][POINTS],
+                totals[idx][GOALS] - totals[idx][OPPONENT_GOALS],
+            ),
+            reverse=True,
+        )
+        placements = [0] * len(totals)
+        for placement, idx in enumerate(ranking, start=1):
+            placements[idx] = placement
+        return placements
+
+    def _create_entry(
+        self,
+        idx: int,
+        totals: tuple[int, ...],
+        from_: int,
+        to: int,
+        results: TeamResults,
+    ) -> TableEntry:
+        return TableEntry(
+            team_name=team_registry.names[self.team_ids[idx]],
+            team_id=self.team_ids[idx],
+            points=totals[POINTS],
+            opponent_goals=totals[OPPONENT_GOALS],
+            goals=totals[GOALS],
+            matches=totals[MATCHES],
+            won=totals[WON],
+            lost=totals[LOST],
+            draw=totals[DRAW],
+            goal_diff=totals[GOALS] - totals[OPPONENT_GOALS],
+            history=History(matches=results.between(from_, to)),
+        )
+
+
+def _add_result(totals: list[int], goals: int, opponent_goals: int) -> str:
+    totals[GOALS] += goals
+    totals[OPPONENT_GOALS] += opponent_goals
+    totals[MATCHES] += 1
+    if goals > opponent_goals:
+        totals[POINTS] += 3
+        totals[WON] += 1
+        return ResultSymbol.WIN.value
+    if goals < opponent_goals:
+        totals[LOST] += 1
+        return ResultSymbol.LOSE.value
+    totals[POINTS] += 1
+    totals[DRAW] += 1
+    return ResultSymbol.DRAW.value
@@ -0,0 +1,125 @@
+"""Module that computes the standings of every matchday at once with NumPy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+from bundesliga_scraper.datatypes.fixture_store import (
+    STATUS_FUTURE,
+    SeasonFixtureStore,
+)
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+@dataclass(frozen=True)
+class StandingsMatrix:
+    """Cumulative standings, row m holds every team after matchday m + 1.
+
+    All attributes are (matchday x team) integer arrays, the team axis follows
+    the team ids of the SeasonFixtureStore the matrix was computed from.
+    """
+
+    team_names: list[str]
+    points: np.ndarray
+    won: np.ndarray
+    draw: np.ndarray
+    lost: np.ndarray
+    goals: np.ndarray
+    opponent_goals: np.ndarray
+    matches: np.ndarray
+    placements: np.ndarray
+
+    @property
+    def goal_diff(self) -> np.ndarray:
+        return self.goals - self.opponent_goals
+
+    @classmethod
+    def from_store(
+        cls,
+        store: SeasonFixtureStore,
+        number_of_matchdays: int,
+        home: bool = True,
+        away: bool = True,
+    ) -> StandingsMatrix:
+        """Computes the standings of all matchdays with cumulative sums.
+
+        Args:
+            store (SeasonFixtureStore): fixtures of the season
+            number_of_matchdays (int): number of rows of the matrix
+            home (bool): count the home games of each team
+            away (bool): count the away games of each team
+
+        Returns:
+            StandingsMatrix: standings of every team at every matchday
+        """
+        if np is None:
+            raise ImportError(
+                "numpy is required for the vectorized standings, "
+                "install it with `pip install Bundesliga-Scraper[fast]`"
+            )
+
+        shape = (number_of_matchdays, len(store.team_names))
+        home_ids = np.frombuffer(store.home_ids, dtype=np.uint16).astype(np.intp)
+        away_ids = np.frombuffer(store.away_ids, dtype=np.uint16).astype(np.intp)
+        home_goals = np.frombuffer(store.home_goals, dtype=np.uint8).astype(np.int32)
+        away_goals = np.frombuffer(store.away_goals, dtype=np.uint8).astype(np.int32)
+        rows = np.frombuffer(store.matchdays, dtype=np.uint8).astype(np.intp) - 1
+        played = np.frombuffer(store.status, dtype=np.uint8) != STATUS_FUTURE
+
+        home_won = played & (home_goals > away_goals)
+        away_won = played & (home_goals < away_goals)
+        drawn = played & (home_goals == away_goals)
+
+        totals = {
+            name: np.zeros(shape, dtype=np.int32)
+            for name in ("won", "draw", "lost", "goals", "opponent_goals", "matches")
+        }
+        sides = []
+        if home:
+            sides.append((home_ids, home_goals, away_goals, home_won, away_won))
+        if away:
+            sides.append((away_ids, away_goals, home_goals, away_won, home_won))
+
+        for team_ids, goals, opponent_goals, won, lost in sides:
+            index = (rows, team_ids)
+            np.add.at(totals["won"], index, won)
+            np.add.at(totals["draw"], index, drawn)
+            np.add.at(totals["lost"], index, lost)
+            np.add.at(totals["goals"], index, np.where(played, goals, 0))
+            np.add.at(
+                totals["opponent_goals"], index, np.where(played, opponent_goals, 0)
+            )
+            np.add.at(totals["matches"], index, played)
+
+        for name, values in totals.items():
+            totals[name] = np.cumsum(values, axis=0)
+        points = 3 * totals["won"] + totals["draw"]
+
+        return cls(
+            team_names=list(store.team_names),
+            points=points,
+            placements=_rank(points, totals["goals"] - totals["opponent_goals"]),
+            **totals,
+        )
+
+
+def _rank(points: np.ndarray, goal_diff: np.ndarray) -> np.ndarray:
+    # lexsort sorts by the last key first, the team id keeps ties in team order
+    team_ids = np.broadcast_to(np.arange(points.shape[1]), points.shape)
+    order = np.lexsort((team_ids, -goal_diff, -points), axis=-1)
+    placements = np.empty_like(order)
+    np.put_along_axis(
+        placements,
+        order,
+        np.broadcast_to(np.arange(1, points.shape[1] + 1), points.shape),
+        axis=-1,
+    )
+    return placements
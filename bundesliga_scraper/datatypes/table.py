@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from bundesliga_scraper.datatypes.matchday import Matchday
@@ -12,18 +12,28 @@ class Table:
     league_name: str
     teams: dict[str, TableEntry] = field(default_factory=dict)
     standings: list[TableEntry] = field(default_factory=list)
+    matchday: int = 0
+
+    @classmethod
+    def from_team_names(cls, league_name: str, team_names: Iterable[str]) -> Table:
+        """Creates a table with a zeroed entry for every team."""
+        return cls(
+            league_name=league_name,
+            teams={team_name: TableEntry(team_name) for team_name in team_names},
+        )
 
     def calculate_table(
         self, matchdays: list[Matchday], home: bool = True, away: bool = True
     ) -> None:
+        entries = {entry.team_id: entry for entry in self.teams.values()}
         for matchday in matchdays:
             for fixture in matchday.fixtures:
                 if not fixture.match_is_finished and not fixture.match_is_live:
                     continue
                 if home:
-                    self.teams[fixture.home_team].update(fixture)
+                    entries[fixture.home_team_id].update(fixture)
                 if away:
-                    self.teams[fixture.away_team].update(fixture)
+                    entries[fixture.away_team_id].update(fixture)
 
             self._update_teams_history()
 
@@ -39,4 +49,14 @@ class Table:
         self.standings = sorted(self.teams.values(), reverse=True)
 
     def copy(self) -> Table:
-        return copy.deepcopy(self)
+        teams = {team_name: entry.copy() for team_name, entry in self.teams.items()}
+        return Table(
+            league_name=self.league_name,
+            teams=teams,
+            standings=[teams[entry.team_name] for entry in self.standings],
+            matchday=self.matchday,
+        )
+
+    def empty_copy(self) -> Table:
+        """Creates a table of the same teams without any matches played."""
+        return Table.from_team_names(self.league_name, self.teams)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
 
 from bundesliga_scraper.datatypes.constants import MatchResult, ResultSymbol
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.team_registry import team_registry
 
 
 class StandingsDirection(StrEnum):
@@ -15,14 +16,21 @@ class StandingsDirection(StrEnum):
     SAME = " "
 
 
-@dataclass
+@dataclass(slots=True)
 class History:
     matches: list[str] = field(default_factory=list)
     placements: list[int] = field(default_factory=list)
     points: list[int] = field(default_factory=list)
 
+    def copy(self) -> History:
+        return History(
+            matches=self.matches.copy(),
+            placements=self.placements.copy(),
+            points=self.points.copy(),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class TableEntry:
     team_name: str
     points: int = 0
@@ -34,6 +42,13 @@ class TableEntry:
     draw: int = 0
     goal_diff: int = 0
     history: History = field(default_factory=History)
+    # id of the team registry, looked up from team_name if not given
+    team_id: int = -1
+
+    def __post_init__(self) -> None:
+        if self.team_id < 0:
+            self.team_id = team_registry.register(self.team_name)
+            self.team_name = team_registry.names[self.team_id]
 
     @classmethod
     def from_dict(cls, data: dict[str, str | int]) -> TableEntry:
@@ -49,6 +64,9 @@ class TableEntry:
             goal_diff=int(data["goalDiff"]),
         )
 
+    def copy(self) -> TableEntry:
+        return replace(self, history=self.history.copy())
+
     def get_standings_direction(self):
         if (
             len(self.history.placements) < 2
@@ -64,7 +82,7 @@ class TableEntry:
     def update(self, fixture: FixtureEntry) -> None:
         match_result: MatchResult = fixture.get_result()
 
-        if self.team_name == fixture.get_home_team():
+        if self.team_id == fixture.home_team_id:
             self.update_home_team(fixture, match_result)
         else:
             self.update_away_team(fixture, match_result)
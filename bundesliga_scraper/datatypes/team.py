@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.team_registry import TeamMatcher, team_registry
 
 
 @dataclass
@@ -8,27 +9,34 @@ class TeamSeasonMatches:
     team_name: str
     results: list[FixtureEntry] = field(default_factory=list)
     fixtures: list[FixtureEntry] = field(default_factory=list)
+    # team_name may be a partial name like "Bayern"
+    matcher: TeamMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.matcher = team_registry.matcher([self.team_name])
+
+    def is_home_team(self, fixture: FixtureEntry) -> bool:
+        return self.matcher.matches(fixture.home_team_id)
 
     def team_won_match(self, fixture: FixtureEntry) -> bool:
         self.check_valid_fixture(fixture)
 
-        if self.team_name in fixture.home_team and fixture.home_team_won():
+        if self.is_home_team(fixture) and fixture.home_team_won():
             return True
-        if self.team_name in fixture.away_team and fixture.away_team_won():
+        if self.matcher.matches(fixture.away_team_id) and fixture.away_team_won():
             return True
         return False
 
     def team_lost_match(self, fixture: FixtureEntry) -> bool:
         self.check_valid_fixture(fixture)
-        if self.team_name in fixture.home_team and fixture.away_team_won():
+        if self.is_home_team(fixture) and fixture.away_team_won():
             return True
-        if self.team_name in fixture.away_team and fixture.home_team_won():
+        if self.matcher.matches(fixture.away_team_id) and fixture.home_team_won():
             return True
         return False
 
     def check_valid_fixture(self, fixture):
-        if (
-            self.team_name not in fixture.home_team
-            and self.team_name not in fixture.away_team
+        if not self.is_home_team(fixture) and not self.matcher.matches(
+            fixture.away_team_id
         ):
             raise ValueError(f"{self.team_name} not in fixture {fixture}")
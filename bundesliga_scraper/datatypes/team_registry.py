@@ -0,0 +1,95 @@
+"""Module that assigns every team an integer id and an interned name."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+# matchers kept by TeamRegistry.matcher, e.g. against requests for many names
+MAX_MATCHERS = 256
+
+
+class TeamMatcher:
+    """Case insensitive partial name matching, e.g. for highlights.
+
+    The patterns are lowered once and every team is only checked the first time
+    it is asked for, afterwards a match is a single dict lookup.
+    """
+
+    def __init__(self, registry: TeamRegistry, patterns: Iterable[str]) -> None:
+        self.registry = registry
+        self.patterns = tuple(pattern.lower() for pattern in patterns)
+        self._matches: dict[int, bool] = {}
+
+    def matches(self, team_id: int) -> bool:
+        matched = self._matches.get(team_id)
+        if matched is None:
+            name = self.registry.lowered_names[team_id]
+            matched = any(pattern in name for pattern in self.patterns)
+            self._matches[team_id] = matched
+        return matched
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+
+class TeamRegistry:
+    """League-wide registry of teams, ids are handed out in order of appearance.
+
+    Names are interned, so every fixture and table entry of a team shares the
+    same string object and comparing ids replaces comparing names.
+    """
+
+    def __init__(self, team_names: Iterable[str] = ()) -> None:
+        self.names: list[str] = []
+        self.lowered_names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self._matchers: OrderedDict[tuple[str, ...], TeamMatcher] = OrderedDict()
+        # responses are parsed in worker threads, see api.concurrent
+        self._lock = threading.Lock()
+        for team_name in team_names:
+            self.register(team_name)
+
+    def register(self, team_name: str) -> int:
+        """Returns the id of the team, registering it on first sight."""
+        team_id = self.ids.get(team_name)
+        if team_id is not None:
+            return team_id
+        with self._lock:
+            team_id = self.ids.get(team_name)
+            if team_id is None:
+                team_id = len(self.names)
+                team_name = sys.intern(team_name)
+                self.names.append(team_name)
+                self.lowered_names.append(team_name.lower())
+                self.ids[team_name] = team_id
+        return team_id
+
+    def name_of(self, team_id: int) -> str:
+        return self.names[team_id]
+
+    def matcher(self, patterns: Iterable[str]) -> TeamMatcher:
+        """Returns the (cached) matcher of the given partial names.
+
+        The least recently used matchers are dropped once MAX_MATCHERS is reached.
+        """
+        key = tuple(patterns)
+        with self._lock:
+            matcher = self._matchers.get(key)
+            if matcher is None:
+                matcher = TeamMatcher(self, key)
+                self._matchers[key] = matcher
+                if len(self._matchers) > MAX_MATCHERS:
+                    self._matchers.popitem(last=False)
+            else:
+                self._matchers.move_to_end(key)
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# shared by all leagues, a team keeps its id when it is relegated or promoted
+team_registry = TeamRegistry()
@@ -0,0 +1,103 @@
+"""Handles running many commands in one process."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+from argparse import ArgumentError, ArgumentParser, Namespace
+from collections.abc import Iterable, Iterator
+
+from bundesliga_scraper.arg_parser import user_input_parser
+from bundesliga_scraper.datatypes.league_registry import league_registry
+from bundesliga_scraper.request_handler.session_request_handler import (
+    strip_session_flags,
+)
+from bundesliga_scraper.request_handler.utils import prefetch
+
+BATCH_COMMAND = "batch"
+COMMENT_PREFIX = "#"
+
+
+def handle_batch_request(args: Namespace) -> None:
+    """Runs every command of a file, or stdin, in this process.
+
+    Each line is a command like `table -l 5` or `2_bundesliga team hamburg`,
+    lines without a league use the league of the batch. All commands share the
+    caches and the connection pool of the api, the data they need is fetched
+    concurrently before the first command runs. A failing command is reported
+    on stderr and does not stop the batch, the batch exits with status 1 then.
+
+    Args:
+        args (Namespace): user arguments
+    """
+    if args.file == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(args.file, encoding="utf-8") as file:
+            lines = file.readlines()
+
+    parser = user_input_parser.create_parser()
+    commands: list[tuple[int, Namespace]] = []
+    failed = 0
+    for line_number, tokens in read_commands(lines, args.league):
+        try:
+            commands.append((line_number, parse_command(parser, tokens)))
+        except (ArgumentError, ValueError) as error:
+            report_error(line_number, error)
+            failed += 1
+
+    prefetch(command for _, command in commands)
+
+    for line_number, command in commands:
+        try:
+            command.func(command)
+        except Exception as error:  # noqa: BLE001
+            # a failing command must not end the whole batch
+            report_error(line_number, error)
+            failed += 1
+
+    if failed:
+        sys.exit(1)
+
+
+def read_commands(lines: Iterable[str], league: str) -> Iterator[tuple[int, list[str]]]:
+    """Splits the lines into the tokens of a command, skipping comments.
+
+    Args:
+        lines (Iterable[str]): lines of the batch
+        league (str): league of commands that do not name one
+
+    Yields:
+        tuple[int, list[str]]: line number and tokens of every command
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip() or line.lstrip().startswith(COMMENT_PREFIX):
+            continue
+        try:
+            tokens = shlex.split(line)
+        except ValueError as error:
+            report_error(line_number, error)
+            continue
+        tokens = strip_session_flags(tokens)
+        if not tokens:
+            continue
+        if not league_registry.is_selection(tokens[0]):
+            tokens = [league, *tokens]
+        yield line_number, tokens
+
+
+def parse_command(parser: ArgumentParser, tokens: list[str]) -> Namespace:
+    try:
+        args = user_input_parser.parse_arguments(parser, tokens)
+    except SystemExit:
+        # argparse exits after printing help or a usage error
+        raise ValueError(f"invalid command: {shlex.join(tokens)}") from None
+    if not args.subcommand:
+        raise ValueError(f"missing subcommand: {shlex.join(tokens)}")
+    if args.subcommand == BATCH_COMMAND:
+        raise ValueError("a batch can not run another batch")
+    return args
+
+
+def report_error(line_number: int, error: Exception) -> None:
+    print(f"Error in line {line_number}: {error}", file=sys.stderr)
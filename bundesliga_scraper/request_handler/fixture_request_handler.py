@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import time
 from argparse import Namespace
+from datetime import datetime
+from functools import partial
 
 from bundesliga_scraper.api import api
-from bundesliga_scraper.data_printer import fixture_printer
-from bundesliga_scraper.datatypes.constants import LEAGUE_NAMES
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.data_printer import format_printer
+from bundesliga_scraper.datatypes.league_registry import League
 from bundesliga_scraper.datatypes.matchday import Matchday
-from bundesliga_scraper.request_handler.utils import MAX_MATCHDAY, get_league
+from bundesliga_scraper.request_handler.utils import (
+    get_league,
+    get_league_title,
+    get_season,
+    load_printer,
+)
 from dataclasses import dataclass
 
 
 TITLE_TEMPLATE = "{} Fixture {}"
 
+# seconds between two polls while matches are running
+LIVE_POLL_INTERVAL = 15
+
 
 @dataclass(frozen=True)
 class MatchdaySelectionParams:
@@ -21,6 +33,7 @@ class MatchdaySelectionParams:
     prev: int
     user_matchday: int
     current_matchday: int
+    number_of_matchdays: int
 
 
 def handle_fixture_request(args: Namespace) -> None:
@@ -30,33 +43,70 @@ def handle_fixture_request(args: Namespace) -> None:
         args (Namespace): user arguments
     """
     league = get_league(args.league)
+    season = get_season(args)
+    highlights = [] if args.highlights is None else args.highlights
 
-    season_matchdays = api.retrieve_all_matchdays(league=league)
-    current_matchday = api.retrieve_current_matchday(league)
+    if args.watch:
+        # following a matchday never needs the rest of the season
+        current_matchday = api.retrieve_current_matchday(league)
+        matchday = get_matchday(
+            MatchdaySelectionParams(
+                nxt=args.next,
+                prev=args.prev,
+                user_matchday=args.matchday,
+                current_matchday=current_matchday,
+                number_of_matchdays=league.number_of_matchdays,
+            )
+        )
+        watch_matchday(league, season, matchday, highlights)
+        return
+
+    match_data, current_matchday = fetch_concurrently(
+        partial(api.get_match_data, league=league, season=season),
+        partial(api.retrieve_current_matchday, league),
+    )
 
     matchday_selection_params = MatchdaySelectionParams(
         nxt=args.next,
         prev=args.prev,
         user_matchday=args.matchday,
-        current_matchday=current_matchday,
+        current_matchday=api.get_season_matchday(match_data, current_matchday),
+        # older seasons may have more or less matchdays than the league today
+        number_of_matchdays=api.get_number_of_matchdays(match_data),
     )
-    selected_matchday = get_selected_matchday_games(
-        matchday_selection_params, season_matchdays
-    )
-
-    title = TITLE_TEMPLATE.format(LEAGUE_NAMES[league], selected_matchday.matchday)
-    highlights = [] if args.highlights is None else args.highlights
-
-    fixture_printer.print_fixture_entries(
-        title=title, matchday=selected_matchday, highlights=highlights
+    matchday = get_matchday(matchday_selection_params)
+
+    if args.output_format:
+        write_fixtures(league, season, api.extract_matchday(match_data, matchday), args)
+        return
+
+    fixture_printer = load_printer("fixture_printer")
+    render_cache = load_printer("render_cache").render_cache
+
+    title = TITLE_TEMPLATE.format(get_league_title(league, args), matchday)
+
+    # only the fixtures of the displayed matchday are parsed, and only when the
+    # match data changed since the matchday was last rendered
+    render_cache.print(
+        key=("fixture", league, season, matchday, tuple(highlights)),
+        sources=(match_data,),
+        create=lambda: fixture_printer.create_fixture_renderable(
+            title=title,
+            matchday=api.extract_matchday(match_data, matchday),
+            highlights=highlights,
+        ),
     )
 
 
-def get_selected_matchday_games(
-    params: MatchdaySelectionParams, season_matchdays: list[Matchday]
-) -> Matchday:
-    matchday = get_matchday(params)
-    return season_matchdays[matchday - 1]
+def write_fixtures(
+    league: League, season: int, matchday: Matchday, args: Namespace
+) -> None:
+    with format_printer.open_writer(args, format_printer.FIXTURE_FIELDS) as writer:
+        writer.write(
+            format_printer.get_fixture_records(
+                league.shortcut, season, matchday.fixtures
+            )
+        )
 
 
 def get_matchday(params: MatchdaySelectionParams) -> int:
@@ -65,4 +115,75 @@ def get_matchday(params: MatchdaySelectionParams) -> int:
     if not params.user_matchday:
         effective_count = params.nxt - params.prev
         matchday = params.current_matchday + effective_count
-    return min(MAX_MATCHDAY, max(1, matchday))
+    return min(params.number_of_matchdays, max(1, matchday))
+
+
+def watch_matchday(
+    league: League, season: int, matchday: int, highlights: list[str]
+) -> None:
+    """Follows a matchday live until all of its matches are finished.
+
+    Only the matchday is polled, with conditional requests, and only the rows of
+    fixtures that changed are rendered again.
+
+    Args:
+        league (League): league of the matchday
+        season (int): season of the matchday
+        matchday (int): matchday to follow
+        highlights (list[str]): teams to highlight
+    """
+    # rich only for --watch, like the printers of utils.load_printer
+    from rich.console import Console  # noqa: PLC0415
+    from rich.live import Live  # noqa: PLC0415
+
+    from bundesliga_scraper.data_printer.live_fixture_printer import (  # noqa: PLC0415
+        LiveFixturePrinter,
+        get_status_line,
+    )
+
+    title = TITLE_TEMPLATE.format(league.display_name, matchday)
+    printer = LiveFixturePrinter(title=title, highlights=highlights)
+
+    try:
+        with Live(console=Console(), auto_refresh=False) as live:
+            while True:
+                selected_matchday = api.retrieve_matchday(
+                    league, matchday, season=season, revalidate=True
+                )
+                printer.update(selected_matchday)
+                interval = get_poll_interval(selected_matchday)
+                live.update(
+                    printer.render(
+                        selected_matchday, get_status_line(datetime.now(), interval)
+                    ),
+                    refresh=True,
+                )
+                if interval is None:
+                    return
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def get_poll_interval(matchday: Matchday, now: datetime | None = None) -> float | None:
+    """Seconds until the matchday should be polled again.
+
+    Args:
+        matchday (Matchday): latest state of the matchday
+        now (datetime | None): current time, defaults to now
+
+    Returns:
+        float | None: seconds to wait, None if every match is finished
+    """
+    now = datetime.now() if now is None else now
+    if any(fixture.is_live_at(now) for fixture in matchday.fixtures):
+        return LIVE_POLL_INTERVAL
+
+    kickoffs = [
+        fixture.date for fixture in matchday.fixtures if fixture.is_in_future(now)
+    ]
+    if not kickoffs:
+        return None
+
+    # nothing can change before the next kickoff
+    return max(LIVE_POLL_INTERVAL, (min(kickoffs) - now).total_seconds())
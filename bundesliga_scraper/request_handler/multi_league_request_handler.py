@@ -0,0 +1,79 @@
+"""Handles commands for several leagues or seasons, e.g. `all table`."""
+
+from __future__ import annotations
+
+import sys
+from argparse import Namespace
+from collections.abc import Callable
+from contextlib import nullcontext
+
+from bundesliga_scraper.data_printer import format_printer
+from bundesliga_scraper.datatypes.league_registry import league_registry
+from bundesliga_scraper.request_handler.utils import (
+    format_season,
+    get_season,
+    prefetch,
+)
+
+# fields of the records a subcommand writes with --format
+FORMAT_FIELDS = {
+    "table": format_printer.TABLE_FIELDS,
+    "fixture": format_printer.FIXTURE_FIELDS,
+    "team": format_printer.TEAM_FIELDS,
+}
+
+
+def handle_multi_league_request(
+    args: Namespace, handler: Callable[[Namespace], None]
+) -> None:
+    """Runs the handler of the subcommand once for every league and season.
+
+    The data of all leagues and seasons is fetched, and parsed, at the same time
+    before the first one is answered, so the command takes about as long as the
+    slowest download rather than all of them. They are answered in the order
+    they were selected, every season of the first league first. A failing league
+    or season is reported on stderr and the command exits with status 1 after
+    the others were answered.
+
+    Args:
+        args (Namespace): user arguments, args.league and args.seasons select
+        handler (Callable[[Namespace], None]): handler of the subcommand
+    """
+    leagues = league_registry.select(args.league)
+    # without --seasons every league is answered for the chosen season
+    seasons = getattr(args, "seasons", None) or [getattr(args, "season", None)]
+    selections = [(league, season) for league in leagues for season in seasons]
+    commands = [
+        Namespace(
+            **{**vars(args), "league": league.name, "season": season, "seasons": None}
+        )
+        for league, season in selections
+    ]
+    prefetch(commands)
+
+    output_format = getattr(args, "output_format", None)
+    writer = (
+        format_printer.RecordWriter(output_format, FORMAT_FIELDS[args.subcommand])
+        if output_format
+        else nullcontext()
+    )
+    failed = False
+    with writer as record_writer:
+        for (league, _), command in zip(selections, commands):
+            command.record_writer = record_writer
+            try:
+                handler(command)
+            except BrokenPipeError:
+                # the reader went away, see format_printer.RecordWriter
+                raise
+            except Exception as error:  # noqa: BLE001
+                # the other leagues are answered anyway
+                print(
+                    f"{league.display_name} {format_season(get_season(command))}: "
+                    f"{error}",
+                    file=sys.stderr,
+                )
+                failed = True
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,385 @@
+"""Handles serving tables, fixtures and teams as json over http."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from argparse import Namespace
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from http import HTTPStatus
+from itertools import chain
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from bundesliga_scraper.api import api, fast_json
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.data_printer import format_printer
+from bundesliga_scraper.datatypes.constants import get_current_season
+from bundesliga_scraper.datatypes.league_registry import League, league_registry
+from bundesliga_scraper.datatypes.matchday import Matchday
+from bundesliga_scraper.datatypes.standings import SeasonStandings
+from bundesliga_scraper.datatypes.team_registry import team_registry
+from bundesliga_scraper.request_handler import (
+    table_request_handler,
+    team_request_handler,
+)
+from bundesliga_scraper.request_handler.fixture_request_handler import (
+    MatchdaySelectionParams,
+    get_matchday,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+# seconds between two refreshes, OpenLigaDB is only asked for expired responses
+DEFAULT_REFRESH_INTERVAL = 15
+# encoded responses kept per snapshot, e.g. against requests for many team names
+MAX_CACHED_RESPONSES = 1024
+MAX_HEADERS = 100
+FALSE_VALUES = ("0", "false", "no")
+
+
+class RequestError(Exception):
+    """Answered with its status and message instead of the requested view."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class LeagueSnapshot:
+    """Everything the service answers for a league, as of refreshed_at.
+
+    Requests are only answered from snapshots, never from the api, so the
+    requests to OpenLigaDB do not depend on the number of clients. A refresh
+    that found the same data keeps the snapshot, together with its encoded
+    responses.
+    """
+
+    league: League
+    season: int
+    season_matchdays: list[Matchday]
+    season_standings: SeasonStandings
+    current_matchday: int
+    refreshed_at: datetime
+    responses: dict[str, bytes] = field(default_factory=dict)
+
+    def has_same_data(self, other: LeagueSnapshot) -> bool:
+        return (
+            self.season == other.season
+            and self.season_matchdays is other.season_matchdays
+            and self.season_standings is other.season_standings
+            and self.current_matchday == other.current_matchday
+        )
+
+
+def load_snapshot(league: League) -> LeagueSnapshot:
+    """Fetches and parses a league, blocking, meant to run in a worker thread.
+
+    The running season is determined on every refresh, so a server that runs
+    into the next season serves it.
+    """
+    season = get_current_season()
+    season_matchdays, current_matchday, _ = fetch_concurrently(
+        partial(api.retrieve_all_matchdays, league, season),
+        partial(api.retrieve_current_matchday, league),
+        partial(api.retrieve_team_names, league=league, season=season),
+    )
+    return LeagueSnapshot(
+        league=league,
+        season=season,
+        season_matchdays=season_matchdays,
+        season_standings=api.retrieve_season_standings(league, season),
+        # a finished season is answered from its end, like the subcommands do
+        current_matchday=api.get_season_matchday(
+            api.get_match_data(league, season), current_matchday
+        ),
+        refreshed_at=datetime.now(),
+    )
+
+
+def get_table_response(
+    snapshot: LeagueSnapshot, query: dict[str, list[str]], params: list[str]
+) -> bytes:
+    """Tables like `table`, e.g. ?last=5&home, see format_printer.TABLE_FIELDS."""
+    check_params(params, 0)
+    args = Namespace(
+        matchday=get_int(query, "matchday"),
+        first_round=get_flag(query, "first_round"),
+        second_round=get_flag(query, "second_round"),
+        last=get_int(query, "last"),
+        since=get_int(query, "since"),
+        home=get_flag(query, "home"),
+        away=get_flag(query, "away"),
+    )
+    active_matchday = table_request_handler.get_active_matchday(
+        snapshot.season_matchdays[snapshot.current_matchday - 1]
+    )
+    try:
+        jobs = table_request_handler.create_job_queue(
+            args, active_matchday, len(snapshot.season_matchdays) // 2
+        )
+    except ValueError as error:
+        raise RequestError(HTTPStatus.BAD_REQUEST, str(error)) from None
+
+    records = chain.from_iterable(
+        table_request_handler.get_job_records(
+            snapshot.season_standings, snapshot.league, snapshot.season, job
+        )
+        for job in jobs
+    )
+    return format_printer.dump_records(format_printer.TABLE_FIELDS, records)
+
+
+def get_fixture_response(
+    snapshot: LeagueSnapshot, query: dict[str, list[str]], params: list[str]
+) -> bytes:
+    """Fixtures like `fixture`, e.g. ?matchday=3 or ?next=1."""
+    check_params(params, 0)
+    matchday = get_int(query, "matchday")
+    if matchday is None:
+        matchday = get_matchday(
+            MatchdaySelectionParams(
+                nxt=get_int(query, "next") or 0,
+                prev=get_int(query, "prev") or 0,
+                user_matchday=None,
+                current_matchday=snapshot.current_matchday,
+                number_of_matchdays=len(snapshot.season_matchdays),
+            )
+        )
+    matchday = min(len(snapshot.season_matchdays), max(1, matchday))
+
+    fixtures = snapshot.season_matchdays[matchday - 1].fixtures
+    return format_printer.dump_records(
+        format_printer.FIXTURE_FIELDS,
+        format_printer.get_fixture_records(
+            snapshot.league.shortcut, snapshot.season, fixtures
+        ),
+    )
+
+
+def get_team_response(
+    snapshot: LeagueSnapshot, query: dict[str, list[str]], params: list[str]
+) -> bytes:
+    """Results and fixtures like `team <name>`, e.g. /team/bayern?next=5."""
+    check_params(params, 1)
+    team = params[0].capitalize()
+    team_fixture_entries = api.filter_team_fixtures(
+        snapshot.season_matchdays, team_registry.matcher([team])
+    )
+    if not team_fixture_entries:
+        raise RequestError(HTTPStatus.NOT_FOUND, f"no team matches {params[0]}")
+
+    selected_team_matches = team_request_handler.select_team_matches(
+        team,
+        team_fixture_entries,
+        next_=get_int(query, "next"),
+        prev=get_int(query, "prev"),
+        all_=get_flag(query, "all"),
+    )
+    return format_printer.dump_records(
+        format_printer.TEAM_FIELDS,
+        format_printer.get_team_records(
+            snapshot.league.shortcut, snapshot.season, selected_team_matches
+        ),
+    )
+
+
+VIEWS: dict[
+    str, Callable[[LeagueSnapshot, dict[str, list[str]], list[str]], bytes]
+] = {
+    "table": get_table_response,
+    "fixture": get_fixture_response,
+    "team": get_team_response,
+}
+
+
+class JsonService:
+    """Answers `GET /<league>/<view>` from one asyncio event loop.
+
+    Views are table, fixture and team/<name>, their query parameters mirror the
+    options of the subcommands. Leagues are fetched and parsed in a worker
+    thread, the event loop only computes the views from the snapshots and
+    encodes every response once per snapshot.
+    """
+
+    def __init__(self, refresh_interval: float = DEFAULT_REFRESH_INTERVAL) -> None:
+        self.refresh_interval = refresh_interval
+        self.leagues = dict(league_registry.leagues)
+        self.snapshots: dict[League, LeagueSnapshot] = {}
+
+    async def serve(self, host: str, port: int) -> None:
+        await self.refresh()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"serving on http://{host}:{port}")
+        refresher = asyncio.create_task(self.refresh_forever())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            refresher.cancel()
+
+    async def refresh(self) -> None:
+        leagues = list(self.leagues.values())
+        snapshots = await asyncio.gather(
+            *(asyncio.to_thread(load_snapshot, league) for league in leagues),
+            return_exceptions=True,
+        )
+        for league, snapshot in zip(leagues, snapshots):
+            if isinstance(snapshot, Exception):
+                # the last snapshot is served until the api answers again
+                print(f"refreshing {league} failed: {snapshot}", file=sys.stderr)
+                continue
+            current = self.snapshots.get(league)
+            if current is not None and current.has_same_data(snapshot):
+                current.refreshed_at = snapshot.refreshed_at
+            else:
+                self.snapshots[league] = snapshot
+
+    async def refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = await read_headers(reader)
+                method, target, version = request_line.decode("latin-1").split()
+                # a request body is not used by any view
+                content_length = int(headers.get("content-length", 0))
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                status, body = self.respond(method, target)
+                writer.write(create_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # malformed requests and clients that went away are not answered
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, method: str, target: str) -> tuple[HTTPStatus, bytes]:
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, create_error_body("only GET")
+        url = urlsplit(target)
+        try:
+            return HTTPStatus.OK, self.get_response(url.path, url.query)
+        except RequestError as error:
+            return error.status, create_error_body(str(error))
+        except Exception as error:  # noqa: BLE001
+            # the client gets an answer and the other requests are served anyway
+            print(f"answering {target} failed: {error!r}", file=sys.stderr)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, create_error_body(
+                HTTPStatus.INTERNAL_SERVER_ERROR.phrase
+            )
+
+    def get_response(self, path: str, query: str) -> bytes:
+        parts = [unquote(part) for part in path.split("/") if part]
+        if not parts:
+            return self.get_index()
+        league_name = parts[0]
+        view_name = parts[1] if len(parts) > 1 else ""
+        if league_name not in self.leagues or view_name not in VIEWS:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"unknown path {path}")
+
+        snapshot = self.snapshots.get(self.leagues[league_name])
+        if snapshot is None:
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "league not loaded yet")
+
+        key = f"{path}?{query}"
+        body = snapshot.responses.get(key)
+        if body is None:
+            view = VIEWS[view_name]
+            body = view(snapshot, parse_qs(query, keep_blank_values=True), parts[2:])
+            if len(snapshot.responses) >= MAX_CACHED_RESPONSES:
+                snapshot.responses.clear()
+            snapshot.responses[key] = body
+        return body
+
+    def get_index(self) -> bytes:
+        return fast_json.dumps(
+            {
+                name: {
+                    "league": league.shortcut,
+                    "current_matchday": snapshot.current_matchday,
+                    "refreshed_at": snapshot.refreshed_at.isoformat(),
+                }
+                for name, league in self.leagues.items()
+                if (snapshot := self.snapshots.get(league)) is not None
+            }
+        )
+
+
+async def read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    headers = {}
+    for _ in range(MAX_HEADERS):
+        line = await reader.readline()
+        if not line.strip():
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise ValueError("too many headers")
+
+
+def create_response(status: HTTPStatus, body: bytes, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def create_error_body(message: str) -> bytes:
+    return fast_json.dumps({"error": message})
+
+
+def check_params(params: list[str], expected: int) -> None:
+    if len(params) != expected:
+        raise RequestError(HTTPStatus.NOT_FOUND, "unknown path")
+
+
+def get_int(query: dict[str, list[str]], name: str) -> int | None:
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        return int(values[-1])
+    except ValueError:
+        raise RequestError(
+            HTTPStatus.BAD_REQUEST, f"{name} must be a number"
+        ) from None
+
+
+def get_flag(query: dict[str, list[str]], name: str) -> bool:
+    values = query.get(name)
+    return bool(values) and values[-1].lower() not in FALSE_VALUES
+
+
+def handle_serve_request(args: Namespace) -> None:
+    """Handles the serve request, runs until it is interrupted.
+
+    Args:
+        args (Namespace): user arguments
+    """
+    service = JsonService(refresh_interval=args.refresh)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,102 @@
+"""Handles an interactive session."""
+
+from __future__ import annotations
+
+import shlex
+from argparse import ArgumentError, ArgumentParser
+
+from bundesliga_scraper.arg_parser.user_input_parser import (
+    LEAGUE_CHOICES,
+    parse_arguments,
+)
+from bundesliga_scraper.datatypes.league_registry import league_registry
+
+PROMPT_TEMPLATE = "{} > "
+EXIT_COMMANDS = ("exit", "quit")
+SWITCH_COMMAND = "switch"
+SESSION_FLAGS = ("-s", "--start-session")
+
+
+def handle_session_request(parser: ArgumentParser, league: str) -> None:
+    """Reads commands until the user exits the session.
+
+    The league the session was started with is the default for every command
+    and can be changed with `switch <league> [command]`. Fetched and parsed
+    data stays in memory (see api.memory_cache), so follow-up commands do not
+    download or parse the season again.
+
+    Args:
+        parser (ArgumentParser): parser used to parse every line
+        league (str): default league of the session
+    """
+    print(f"Started session for {league}, type 'exit' to leave.\n")
+
+    while True:
+        try:
+            line = input(PROMPT_TEMPLATE.format(league))
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+
+        try:
+            tokens = shlex.split(line)
+        except ValueError as error:
+            print(error)
+            continue
+        if not tokens:
+            continue
+        if tokens[0] in EXIT_COMMANDS:
+            return
+
+        if tokens[0] == SWITCH_COMMAND:
+            selection = tokens[1] if len(tokens) > 1 else ""
+            if not league_registry.is_selection(selection):
+                print(f"usage: switch {{{','.join(LEAGUE_CHOICES)}}} [command]")
+                continue
+            league = selection
+            tokens = tokens[2:]
+            if not tokens:
+                continue
+
+        # a league given in the command is used for this command only
+        if not league_registry.is_selection(tokens[0]):
+            tokens = [league, *tokens]
+
+        run_session_command(parser, tokens)
+
+
+def strip_session_flags(tokens: list[str]) -> list[str]:
+    """Removes -s / --start-session given before the subcommand.
+
+    A session is not started from within a session or batch. After the
+    subcommand the tokens belong to it, e.g. `-s` is `--since` of `table`.
+    """
+    for idx, token in enumerate(tokens):
+        if not token.startswith("-") and not league_registry.is_selection(token):
+            break
+    else:
+        idx = len(tokens)
+    top_level_tokens = [token for token in tokens[:idx] if token not in SESSION_FLAGS]
+    return [*top_level_tokens, *tokens[idx:]]
+
+
+def run_session_command(parser: ArgumentParser, tokens: list[str]) -> None:
+    tokens = strip_session_flags(tokens)
+    try:
+        args = parse_arguments(parser, tokens)
+    except ArgumentError as error:
+        print(error)
+        return
+    except SystemExit:
+        # argparse exits after printing help or a usage error
+        return
+
+    if not args.subcommand:
+        parser.print_help()
+        return
+
+    try:
+        args.func(args)
+    except Exception as error:  # noqa: BLE001
+        # a failing command must not end the whole session
+        print(f"Error: {error}")
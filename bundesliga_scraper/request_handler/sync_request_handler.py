@@ -0,0 +1,27 @@
+"""Handles requests to sync seasons into the local store."""
+
+from __future__ import annotations
+
+from argparse import Namespace
+
+from bundesliga_scraper.api import api
+from bundesliga_scraper.request_handler.utils import get_league, get_season
+
+
+def handle_sync_request(args: Namespace) -> None:
+    """Handles the sync request.
+
+    Args:
+        args (Namespace): user arguments
+    """
+    league = get_league(args.league)
+    season = get_season(args)
+
+    updated_matchdays = api.sync_season(league=league, season=season)
+
+    title = f"{league.display_name} {season}"
+    if updated_matchdays:
+        matchdays = ", ".join(str(matchday) for matchday in updated_matchdays)
+        print(f"{title}: updated matchdays {matchdays}")
+    else:
+        print(f"{title}: already up to date")
@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 from argparse import Namespace
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import partial
 
 from bundesliga_scraper.api import api
-from bundesliga_scraper.data_printer import table_printer
-from bundesliga_scraper.datatypes.constants import LEAGUE_NAMES, League
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.data_printer import format_printer
+from bundesliga_scraper.datatypes.league_registry import League
 from bundesliga_scraper.datatypes.matchday import Matchday
-from bundesliga_scraper.datatypes.table import Table
-from bundesliga_scraper.request_handler.utils import FIRST_ROUND_MATCHDAY, get_league
+from bundesliga_scraper.datatypes.standings import SeasonStandings
+from bundesliga_scraper.datatypes.table_entry import History
+from bundesliga_scraper.datatypes.team_registry import team_registry
+from bundesliga_scraper.request_handler.utils import (
+    get_league,
+    get_league_title,
+    get_season,
+    load_printer,
+)
 
 
 @dataclass(frozen=True)
@@ -36,52 +46,168 @@ def handle_table_request(args: Namespace) -> None:
     """
 
     league = get_league(args.league)
+    season = get_season(args)
 
-    season_matchdays = api.retrieve_all_matchdays(league)
-    current_matchday = api.retrieve_current_matchday(league)
-    empty_table: Table = api.initialize_league_table(league=league)
+    if getattr(args, "graph", False):
+        print_graph(league, season, args)
+        return
 
-    active_matchday = get_active_matchday(season_matchdays[current_matchday - 1])
-    table_request_job_queue = create_job_queue(args, active_matchday)
+    fixture_store, current_matchday, _ = fetch_concurrently(
+        partial(api.retrieve_fixture_store, league, season),
+        partial(api.retrieve_current_matchday, league),
+        partial(api.retrieve_team_names, league=league, season=season),
+    )
+    current_matchday = api.get_season_matchday(
+        api.get_match_data(league, season), current_matchday
+    )
+
+    active_matchday = get_active_matchday(
+        Matchday(
+            matchday=current_matchday,
+            fixtures=fixture_store.matchday_fixtures(current_matchday),
+        )
+    )
+    # the first round of the season, older seasons may have more or less teams
+    table_request_job_queue = create_job_queue(
+        args, active_matchday, fixture_store.last_matchday // 2
+    )
+
+    # the season is folded once, every job is answered from its prefix totals
+    season_standings = api.retrieve_season_standings(league, season)
+
+    if args.output_format:
+        write_jobs(
+            league=league,
+            season=season,
+            season_standings=season_standings,
+            jobs=table_request_job_queue,
+            args=args,
+        )
+        return
 
+    league_title = get_league_title(league, args)
     for job in table_request_job_queue:
         handle_job(
             league=league,
-            empty_table=empty_table,
-            season_matchdays=season_matchdays,
+            league_title=league_title,
+            season_standings=season_standings,
             job=job,
             highlights=args.highlights,
         )
 
 
 def handle_job(
-    empty_table: Table,
+    season_standings: SeasonStandings,
     league: League,
-    season_matchdays: list[Matchday],
+    league_title: str,
     job: TableRequestJob,
     highlights: list[str],
 ):
+    table_printer = load_printer("table_printer")
+    render_cache = load_printer("render_cache").render_cache
+
     title, selector = job.title, job.matchday_selctor
-    table = empty_table.copy()
 
-    title = f"{LEAGUE_NAMES[league]} {title}"
+    title = f"{league_title} {title}"
 
-    selected_matchdays = season_matchdays[selector.from_ - 1 : selector.to]
-    table.calculate_table(
-        matchdays=selected_matchdays, home=selector.home, away=selector.away
-    )
     highlights = [] if highlights is None else highlights
-    table_printer.print_table_entries(title, table.standings, highlights)
+
+    print()
+    # an unchanged season is neither folded nor rendered again
+    render_cache.print(
+        key=("table", league, title, selector, tuple(highlights)),
+        sources=(season_standings,),
+        create=lambda: table_printer.create_table_renderable(
+            title,
+            season_standings.calculate_table(
+                from_=selector.from_,
+                to=selector.to,
+                home=selector.home,
+                away=selector.away,
+            ).standings,
+            highlights,
+        ),
+    )
 
 
-def create_job_queue(args: Namespace, active_matchday: int) -> list[TableRequestJob]:
+def print_graph(league: League, season: int, args: Namespace) -> None:
+    """Draws the placements and points of the season up to the given matchday.
+
+    Only the highlighted teams are drawn if there are any. The curves come from
+    the standings history index, the season is not folded for them.
+    """
+    graph_printer = load_printer("graph_printer")
+
+    histories = api.retrieve_standings_history(league, season)
+    if args.matchday is not None:
+        histories = {
+            team: History(
+                placements=history.placements[: args.matchday],
+                points=history.points[: args.matchday],
+            )
+            for team, history in histories.items()
+        }
+    highlights = [] if args.highlights is None else args.highlights
+    selected_histories = (
+        api.filter_team_histories(histories, team_registry.matcher(highlights))
+        if highlights
+        else histories
+    )
+    graph_printer.print_standings_graph(
+        f"{get_league_title(league, args)} Standings",
+        selected_histories,
+        number_of_teams=len(histories),
+        highlights=highlights,
+    )
+
+
+def write_jobs(
+    season_standings: SeasonStandings,
+    league: League,
+    season: int,
+    jobs: list[TableRequestJob],
+    args: Namespace,
+) -> None:
+    """Writes the tables of all jobs as one json, csv or ndjson stream."""
+    with format_printer.open_writer(args, format_printer.TABLE_FIELDS) as writer:
+        for job in jobs:
+            writer.write(get_job_records(season_standings, league, season, job))
+
+
+def get_job_records(
+    season_standings: SeasonStandings,
+    league: League,
+    season: int,
+    job: TableRequestJob,
+) -> Iterator[format_printer.Record]:
+    """Computes the table of the job as records, see format_printer.TABLE_FIELDS."""
+    selector = job.matchday_selctor
+    table = season_standings.calculate_table(
+        from_=selector.from_, to=selector.to, home=selector.home, away=selector.away
+    )
+    return format_printer.get_table_records(
+        league=league.shortcut,
+        season=season,
+        view=job.title,
+        matchdays=(selector.from_, selector.to),
+        table_entries=table.standings,
+    )
+
+
+def create_job_queue(
+    args: Namespace, active_matchday: int, first_round_matchday: int
+) -> list[TableRequestJob]:
     table_request_job_queue: list[TableRequestJob] = []
 
     if args.first_round:
-        table_request_job_queue.append(create_first_round_job(active_matchday))
+        table_request_job_queue.append(
+            create_first_round_job(active_matchday, first_round_matchday)
+        )
 
     if args.second_round:
-        table_request_job_queue.append(create_second_round_job(active_matchday))
+        table_request_job_queue.append(
+            create_second_round_job(active_matchday, first_round_matchday)
+        )
 
     if args.last:
         table_request_job_queue.append(create_last_job(args.last, active_matchday))
@@ -148,14 +274,22 @@ def create_last_job(last: int, active_matchday: int) -> TableRequestJob:
     return TableRequestJob(title, last_selector)
 
 
-def create_second_round_job(active_matchday: int) -> TableRequestJob:
-    second_round_selector = get_second_round_selector(active_matchday)
+def create_second_round_job(
+    active_matchday: int, first_round_matchday: int
+) -> TableRequestJob:
+    second_round_selector = get_second_round_selector(
+        active_matchday, first_round_matchday
+    )
     title = "Second Round Table"
     return TableRequestJob(title, second_round_selector)
 
 
-def create_first_round_job(active_matchday: int) -> TableRequestJob:
-    first_round_selector = get_first_round_selector(active_matchday)
+def create_first_round_job(
+    active_matchday: int, first_round_matchday: int
+) -> TableRequestJob:
+    first_round_selector = get_first_round_selector(
+        active_matchday, first_round_matchday
+    )
     title = "First Round Table"
     return TableRequestJob(title, first_round_selector)
 
@@ -187,15 +321,19 @@ def get_since_selector(since: int, active_matchday: int) -> MatchdaySelector:
     return MatchdaySelector(from_=since, to=active_matchday)
 
 
-def get_first_round_selector(active_matchday: int) -> MatchdaySelector:
-    matchday = min(FIRST_ROUND_MATCHDAY, active_matchday)
+def get_first_round_selector(
+    active_matchday: int, first_round_matchday: int
+) -> MatchdaySelector:
+    matchday = min(first_round_matchday, active_matchday)
     return MatchdaySelector(to=matchday)
 
 
-def get_second_round_selector(active_matchday: int) -> MatchdaySelector:
-    if active_matchday <= FIRST_ROUND_MATCHDAY:
+def get_second_round_selector(
+    active_matchday: int, first_round_matchday: int
+) -> MatchdaySelector:
+    if active_matchday <= first_round_matchday:
         # TODO Implement a 0-Table
         raise ValueError(
             f"No second half table available. Its only matchday {active_matchday}"
         )
-    return MatchdaySelector(from_=FIRST_ROUND_MATCHDAY + 1, to=active_matchday)
+    return MatchdaySelector(from_=first_round_matchday + 1, to=active_matchday)
@@ -1,13 +1,26 @@
+import sys
 from argparse import Namespace
 from dataclasses import dataclass
+from functools import partial
 
 from bundesliga_scraper.api import api
-from bundesliga_scraper.data_printer.team_printer import print_team_entries
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.data_printer import format_printer
 from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.league_registry import League
 from bundesliga_scraper.datatypes.team import TeamSeasonMatches
-from bundesliga_scraper.request_handler.utils import MAX_MATCHDAY, get_league
+from bundesliga_scraper.datatypes.team_registry import team_registry
+from bundesliga_scraper.request_handler.utils import (
+    format_season,
+    get_league,
+    get_season,
+    load_printer,
+)
 
 TITLE_TEMPLATE = "{} Fixtures & Results"
+GRAPH_TITLE_TEMPLATE = "{} Standings"
+HEAD_TO_HEAD_TITLE_TEMPLATE = "{} vs {}"
+RECENT_MEETINGS_COUNT = 5
 FUTURE_GAMES_COUNT = 3
 PREVOUS_GAMES_COUNT = 2
 
@@ -23,28 +36,133 @@ class TeamRequestParams:
 def handle_team_request(args: Namespace) -> None:
     team: str = args.team_name[0].capitalize()
 
+    # a head to head covers every league and season at once
+    if getattr(args, "vs", None):
+        handle_head_to_head(team, args)
+        return
+
     league = get_league(args.league)
+    season = get_season(args)
 
-    team_fixture_entries = api.retrieve_team_match_data(league=league, team=team)
+    if getattr(args, "graph", False):
+        print_graph(team, league, season, args)
+        return
 
+    # results, fixtures and table all come from the cached season
+    fetch_concurrently(
+        partial(api.retrieve_all_matchdays, league, season),
+        partial(api.retrieve_team_names, league=league, season=season),
+    )
+    team_fixture_entries = api.retrieve_team_fixtures(
+        league=league, team=team, season=season
+    )
+    season_standings = api.retrieve_season_standings(league, season)
+    table = season_standings.calculate_table(from_=1, to=season_standings.last_matchday)
+
+    selected_team_matches = select_team_matches(
+        team, team_fixture_entries, next_=args.next, prev=args.prev, all_=args.all
+    )
+    if args.output_format:
+        with format_printer.open_writer(args, format_printer.TEAM_FIELDS) as writer:
+            writer.write(
+                format_printer.get_team_records(
+                    league.shortcut, season, selected_team_matches
+                )
+            )
+        return
+
+    team_printer = load_printer("team_printer")
+
+    title = TITLE_TEMPLATE.format(team)
+    if args.season is not None:
+        title = f"{title} {format_season(season)}"
+    team_printer.print_team_entries(title, selected_team_matches, table.standings)
+
+
+def handle_head_to_head(team: str, args: Namespace) -> None:
+    """Answers `team A --vs B` from the meetings of all synced seasons.
+
+    --season and --seasons limit the meetings, --prev the number of meetings
+    that are listed.
+    """
+    opponent = args.vs.capitalize()
+    seasons = args.seasons or (None if args.season is None else [args.season])
+    head_to_head = api.retrieve_head_to_head(team, opponent, seasons=seasons)
+    if not head_to_head.meetings:
+        # formatted output is read by other programs, see parse_user_args
+        print(
+            f"No meetings of {team} and {opponent} in the synced seasons, "
+            "store seasons with sync first",
+            file=sys.stderr if args.output_format else sys.stdout,
+        )
+        return
+
+    if args.output_format:
+        with format_printer.open_writer(args, format_printer.TEAM_FIELDS) as writer:
+            writer.write(format_printer.get_head_to_head_records(head_to_head))
+        return
+
+    head_to_head_printer = load_printer("head_to_head_printer")
+
+    head_to_head_printer.print_head_to_head(
+        HEAD_TO_HEAD_TITLE_TEMPLATE.format(team, opponent),
+        head_to_head,
+        recent=RECENT_MEETINGS_COUNT if args.prev is None else args.prev,
+    )
+
+
+def print_graph(team: str, league: League, season: int, args: Namespace) -> None:
+    """Draws the placements and points of the team from the standings history."""
+    graph_printer = load_printer("graph_printer")
+
+    histories = api.retrieve_standings_history(league, season)
+    team_histories = api.filter_team_histories(histories, team_registry.matcher([team]))
+    if not team_histories:
+        raise ValueError(f"No team matches {team}")
+
+    title = GRAPH_TITLE_TEMPLATE.format(team)
+    if args.season is not None:
+        title = f"{title} {format_season(season)}"
+    graph_printer.print_standings_graph(
+        title, team_histories, number_of_teams=len(histories), highlights=[]
+    )
+
+
+def select_team_matches(
+    team: str,
+    team_fixture_entries: list[FixtureEntry],
+    next_: int | None,
+    prev: int | None,
+    all_: bool,
+) -> TeamSeasonMatches:
+    """Selects the results and fixtures around the last played matchday.
+
+    Args:
+        team (str): (partial) name of the team
+        team_fixture_entries (list[FixtureEntry]): all fixtures of the team
+        next_ (int | None): number of fixtures, defaults to FUTURE_GAMES_COUNT
+        prev (int | None): number of results, defaults to PREVOUS_GAMES_COUNT
+        all_ (bool): select every result and fixture
+
+    Returns:
+        TeamSeasonMatches: the selected results and fixtures
+    """
     last_played_matchday_index = get_last_played_matchday_index(team_fixture_entries)
 
     team_request_params = TeamRequestParams(
-        next_=args.next,
-        prev=args.prev,
-        all_=args.all,
+        next_=next_,
+        prev=prev,
+        all_=all_,
         last_played_matchday_index=last_played_matchday_index,
     )
 
     from_, to = get_matchday_range(team_request_params)
 
-    selected_team_matches = TeamSeasonMatches(
+    return TeamSeasonMatches(
         team_name=team,
         results=team_fixture_entries[from_:last_played_matchday_index],
         fixtures=team_fixture_entries[last_played_matchday_index:to],
     )
-    title = TITLE_TEMPLATE.format(team)
-    print_team_entries(league, title, selected_team_matches)
 
 
 def get_matchday_range(params: TeamRequestParams):
@@ -53,7 +171,8 @@ def get_matchday_range(params: TeamRequestParams):
 
     if params.all_:
         from_ = 0
-        to = MAX_MATCHDAY
+        # up to the last fixture, whatever the number of matchdays
+        to = None
     else:
         from_ = params.last_played_matchday_index - previous_games
         to = params.last_played_matchday_index + future_games
@@ -64,4 +183,5 @@ def get_last_played_matchday_index(team_fixture_entries: list[FixtureEntry]):
     for i, fixture in enumerate(team_fixture_entries):
         if not fixture.match_is_finished:
             return i
-    return 0
+    # a finished season only has results
+    return len(team_fixture_entries)
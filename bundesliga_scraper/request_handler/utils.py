@@ -1,9 +1,96 @@
-from bundesliga_scraper.datatypes.constants import League
+from __future__ import annotations
 
+import importlib
+from argparse import Namespace
+from collections.abc import Callable, Hashable, Iterable
+from functools import partial
+from types import ModuleType
+from typing import Any
 
-MAX_MATCHDAY = 34
-FIRST_ROUND_MATCHDAY = MAX_MATCHDAY // 2
+from bundesliga_scraper.api import api
+from bundesliga_scraper.api.concurrent import fetch_concurrently
+from bundesliga_scraper.datatypes.constants import get_current_season
+from bundesliga_scraper.datatypes.league_registry import League, league_registry
+
+# subcommands whose season data can be fetched up front
+SEASON_SUBCOMMANDS = ("table", "fixture", "team")
 
 
 def get_league(league: str) -> League:
-    return League.Bundesliga if league.lower() == "bundesliga" else League.Bundesliga_2
+    return league_registry.get(league)
+
+
+def get_season(args: Namespace) -> int:
+    season = getattr(args, "season", None)
+    return get_current_season() if season is None else season
+
+
+def load_printer(name: str) -> ModuleType:
+    """Imports the printer module data_printer.<name>, e.g. "table_printer".
+
+    The printers import rich, which takes longer than the rest of a command.
+    Handlers load them only once something is displayed, so `--format` and
+    commands that fail early never import rich.
+    """
+    return importlib.import_module(f"bundesliga_scraper.data_printer.{name}")
+
+
+def format_season(season: int) -> str:
+    return f"{season}/{(season + 1) % 100:02d}"
+
+
+def get_league_title(league: League, args: Namespace) -> str:
+    """Name of the league in titles, with the season if the user chose one."""
+    if getattr(args, "season", None) is None:
+        return league.display_name
+    return f"{league.display_name} {format_season(args.season)}"
+
+
+def prefetch(commands: Iterable[Namespace]) -> None:
+    """Fetches the data of every league and season the commands need at once.
+
+    Every dataset is fetched once, no matter how many commands need it. At most
+    api.concurrent.MAX_WORKERS downloads run at the same time.
+    """
+    calls: dict[Hashable, Callable[[], Any]] = {}
+    for command in commands:
+        # a head to head is answered from the local store only
+        if command.subcommand not in SEASON_SUBCOMMANDS or getattr(command, "vs", None):
+            continue
+        seasons = getattr(command, "seasons", None) or [get_season(command)]
+        # a command for several leagues or seasons needs the data of all of them
+        for league in league_registry.select(command.league):
+            # only the running season has a current matchday, see get_season_matchday
+            calls[("current_matchday", league)] = partial(
+                api.retrieve_current_matchday, league
+            )
+            for season in seasons:
+                add_season_calls(calls, command.subcommand, league, season)
+
+    try:
+        fetch_concurrently(*calls.values())
+    except Exception:  # noqa: BLE001
+        # the commands fetch again and report the error themselves
+        return
+
+
+def add_season_calls(
+    calls: dict[Hashable, Callable[[], Any]],
+    subcommand: str,
+    league: League,
+    season: int,
+) -> None:
+    if subcommand == "fixture":
+        calls.setdefault(
+            ("match_data", league, season),
+            partial(api.fetch_match_data_entry, league=league, season=season),
+        )
+        return
+
+    # parsed in the worker as well, while other seasons still download
+    calls[("match_data", league, season)] = partial(
+        api.retrieve_fixture_store, league=league, season=season
+    )
+    calls[("team_names", league, season)] = partial(
+        api.retrieve_team_names, league=league, season=season
+    )
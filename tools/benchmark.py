@@ -0,0 +1,574 @@
+"""Benchmarks the hot paths of parsing, table computation and rendering.
+
+Runs entirely offline on OpenLigaDB responses of several full bl1 and bl2
+seasons. Responses recorded with `--record` are read from `tools/benchmark_data`,
+seasons that were never recorded are generated deterministically in the same
+json format. Every stage reports its best time and the peak memory it
+allocated, both are compared against the stored baseline. Times differ between
+machines, so they are compared relative to a calibration workload that only
+depends on the speed of the interpreter and the machine. It runs before every
+run of a stage, which also evens out a machine whose speed changes.
+
+Usage:
+    python tools/benchmark.py [--repeat 20] [--save-baseline]
+    python tools/benchmark.py --record   # needs network access
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import Namespace
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.panel import Panel
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bundesliga_scraper.api import api  # noqa: E402
+from bundesliga_scraper.api.cache import ResponseCache  # noqa: E402
+from bundesliga_scraper.api.fast_json import JsonValue  # noqa: E402
+from bundesliga_scraper.api.memory_cache import MemoryCache  # noqa: E402
+from bundesliga_scraper.data_printer import (  # noqa: E402
+    fixture_printer,
+    table_printer,
+)
+from bundesliga_scraper.data_printer.render_cache import render_cache  # noqa: E402
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry  # noqa: E402
+from bundesliga_scraper.datatypes.fixture_store import (  # noqa: E402
+    SeasonFixtureStore,
+)
+from bundesliga_scraper.datatypes.league_registry import (  # noqa: E402
+    League,
+    league_registry,
+)
+from bundesliga_scraper.datatypes.standings import SeasonStandings  # noqa: E402
+from bundesliga_scraper.datatypes.table import Table  # noqa: E402
+from bundesliga_scraper.request_handler import table_request_handler  # noqa: E402
+
+DATA_DIR = Path(__file__).resolve().parent / "benchmark_data"
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_baseline.json"
+SEASONS = (2022, 2023, 2024)
+# the running season, the end to end benchmark answers `table` for it
+CURRENT_SEASON = 2024
+PLAYED_MATCHDAYS = 20
+DEFAULT_REPEAT = 20
+# relative times still vary by about 20% between runs on a busy machine
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.1
+# shorter stages are dominated by timer noise, their times are only printed
+MIN_COMPARED_TIME_MS = 1.0
+HIGHLIGHTS = ["bayern", "hamburg"]
+
+# the benchmarked leagues, more leagues would change what the baseline measures
+LEAGUES = (league_registry.get("bundesliga"), league_registry.get("2_bundesliga"))
+# by league shortcut, see generate_season
+TEAM_NAMES = {
+    "bl1": [
+        "FC Bayern München",
+        "Bayer 04 Leverkusen",
+        "Borussia Dortmund",
+        "RB Leipzig",
+        "VfB Stuttgart",
+        "Eintracht Frankfurt",
+        "SC Freiburg",
+        "1. FC Union Berlin",
+        "TSG Hoffenheim",
+        "VfL Wolfsburg",
+        "Borussia Mönchengladbach",
+        "SV Werder Bremen",
+        "1. FSV Mainz 05",
+        "FC Augsburg",
+        "1. FC Heidenheim 1846",
+        "VfL Bochum",
+        "FC St. Pauli",
+        "Holstein Kiel",
+    ],
+    "bl2": [
+        "Hamburger SV",
+        "1. FC Köln",
+        "Hertha BSC",
+        "FC Schalke 04",
+        "Fortuna Düsseldorf",
+        "Hannover 96",
+        "1. FC Kaiserslautern",
+        "SC Paderborn 07",
+        "Karlsruher SC",
+        "1. FC Nürnberg",
+        "SV Darmstadt 98",
+        "Eintracht Braunschweig",
+        "SSV Ulm 1846",
+        "Preußen Münster",
+        "SV Elversberg",
+        "1. FC Magdeburg",
+        "Jahn Regensburg",
+        "SpVgg Greuther Fürth",
+    ],
+    "bl3": [
+        "Arminia Bielefeld",
+        "Dynamo Dresden",
+        "Energie Cottbus",
+        "Hansa Rostock",
+        "TSV 1860 München",
+        "Rot-Weiss Essen",
+        "FC Erzgebirge Aue",
+        "SV Waldhof Mannheim",
+        "1. FC Saarbrücken",
+        "Alemannia Aachen",
+        "VfL Osnabrück",
+        "SV Wehen Wiesbaden",
+        "SC Verl",
+        "FC Ingolstadt 04",
+        "Viktoria Köln",
+        "SV Sandhausen",
+        "SpVgg Unterhaching",
+        "Borussia Dortmund II",
+        "VfB Stuttgart II",
+        "Hannover 96 II",
+    ],
+}
+
+
+@dataclass(frozen=True)
+class SeasonData:
+    league: League
+    season: int
+    match_data: list[dict]
+    teams: list[dict]
+    current_group: dict
+
+
+@dataclass(frozen=True)
+class Measurement:
+    time_ms: float
+    # time_ms divided by the best time of the calibration
+    relative: float
+    peak_kib: float
+
+
+def load_season(league: League, season: int) -> SeasonData:
+    path = DATA_DIR / f"{league}_{season}.json"
+    if path.exists():
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return SeasonData(league=league, season=season, **raw)
+    return generate_season(league, season)
+
+
+def record_season(league: League, season: int) -> None:
+    client = api.get_client()
+
+    def download(url: str) -> JsonValue:
+        return client.get(url).json()
+
+    raw = {
+        "match_data": download(api.build_get_match_data_url(league, season)),
+        "teams": download(api.build_get_available_teams_url(league, season)),
+        "current_group": download(api.build_get_current_matchday_url(league)),
+    }
+    DATA_DIR.mkdir(exist_ok=True)
+    path = DATA_DIR / f"{league}_{season}.json"
+    path.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+    print(f"recorded {path.relative_to(ROOT)}")
+
+
+def generate_season(league: League, season: int) -> SeasonData:
+    """Creates a season in the OpenLigaDB format with a double round robin."""
+    rnd = random.Random(f"{league}{season}")
+    team_names = TEAM_NAMES[league.shortcut]
+    teams = [
+        {"teamId": team_id, "teamName": name, "shortName": name.split()[-1]}
+        for team_id, name in enumerate(team_names, start=1)
+    ]
+
+    rotation = list(range(len(teams)))
+    first_round = []
+    for matchday in range(len(teams) - 1):
+        pairs = [(rotation[i], rotation[-1 - i]) for i in range(len(teams) // 2)]
+        first_round.append(pairs if matchday % 2 else [(b, a) for a, b in pairs])
+        rotation = [rotation[0], rotation[-1], *rotation[1:-1]]
+    rounds = first_round + [[(b, a) for a, b in pairs] for pairs in first_round]
+
+    played = PLAYED_MATCHDAYS if season == CURRENT_SEASON else len(rounds)
+    # 2. Bundesliga lists the end result first, see FixtureEntry.from_dict
+    end_result_first = league.shortcut == "bl2"
+    season_start = datetime(season, 8, 23, 20, 30)
+    match_data = []
+    for matchday, pairs in enumerate(rounds, start=1):
+        friday = season_start + timedelta(weeks=matchday - 1)
+        for position, (home, away) in enumerate(pairs):
+            kickoff = friday + timedelta(days=min(position, 2), hours=position % 3)
+            home_goals, away_goals = rnd.randint(0, 4), rnd.randint(0, 3)
+            finished = matchday <= played
+            results = []
+            if finished:
+                results = [
+                    _result(1, "Halbzeit", home_goals // 2, away_goals // 2),
+                    _result(2, "Endergebnis", home_goals, away_goals),
+                ]
+                if end_result_first:
+                    results.reverse()
+            match_data.append(
+                {
+                    "matchID": season * 1000 + len(match_data),
+                    "matchDateTime": kickoff.isoformat(),
+                    "leagueShortcut": str(league),
+                    "leagueSeason": season,
+                    "group": {
+                        "groupName": f"{matchday}. Spieltag",
+                        "groupOrderID": matchday,
+                    },
+                    "team1": teams[home],
+                    "team2": teams[away],
+                    "matchIsFinished": finished,
+                    "matchResults": results,
+                    "goals": [],
+                }
+            )
+
+    current = min(played + 1, len(rounds))
+    return SeasonData(
+        league=league,
+        season=season,
+        match_data=match_data,
+        teams=teams,
+        current_group={"groupName": f"{current}. Spieltag", "groupOrderID": current},
+    )
+
+
+def _result(result_id: int, name: str, home_goals: int, away_goals: int) -> dict:
+    return {
+        "resultID": result_id,
+        "resultName": name,
+        "pointsTeam1": home_goals,
+        "pointsTeam2": away_goals,
+        "resultOrderID": result_id,
+        "resultTypeID": result_id,
+    }
+
+
+def measure(stage: Callable[[], Any], repeat: int) -> Measurement:
+    """Best time of repeat runs and the peak memory allocated by one run."""
+    times = []
+    calibration_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        calibration()
+        calibration_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        stage()
+        times.append(time.perf_counter() - start)
+
+    # the peak includes cyclic garbage, a collection that happens to run in
+    # the middle of the stage would make it depend on the runs before
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return Measurement(
+        time_ms=min(times) * 1000,
+        relative=min(times) / min(calibration_times),
+        peak_kib=peak / 1024,
+    )
+
+
+def calibration() -> None:
+    # dicts, strings and sorting like the stages, but independent of the package
+    rows = [{"team": f"team {idx % 18}", "goals": idx % 7} for idx in range(5_000)]
+    totals: dict[str, int] = {}
+    for row in rows:
+        totals[row["team"]] = totals.get(row["team"], 0) + row["goals"]
+    sorted(rows, key=lambda row: (row["goals"], row["team"]))
+
+
+def create_stages(seasons: list[SeasonData]) -> dict[str, Callable[[], Any]]:
+    """Creates one callable per stage, each covers all benchmark seasons."""
+    fixtures = [FixtureEntry.from_list(season.match_data) for season in seasons]
+    matchdays = [api._extract_season_matchdays(entries) for entries in fixtures]
+    stores = [SeasonFixtureStore.from_fixtures(entries) for entries in fixtures]
+    tables = []
+    for season, season_matchdays in zip(seasons, matchdays):
+        table = _empty_table(season)
+        table.calculate_table(season_matchdays)
+        tables.append(table)
+
+    def parse() -> None:
+        for season in seasons:
+            FixtureEntry.from_list(season.match_data)
+
+    # both keep every season alive like the memory cache does, see the peaks
+    def keep_fixture_entries() -> list[list[FixtureEntry]]:
+        return [FixtureEntry.from_list(season.match_data) for season in seasons]
+
+    def keep_fixture_store() -> list[SeasonFixtureStore]:
+        return [
+            SeasonFixtureStore.from_match_data(season.match_data) for season in seasons
+        ]
+
+    def extract_season_matchdays() -> None:
+        for entries in fixtures:
+            api._extract_season_matchdays(entries)
+
+    def calculate_table() -> None:
+        for season, season_matchdays in zip(seasons, matchdays):
+            _empty_table(season).calculate_table(season_matchdays)
+
+    def season_standings() -> None:
+        for season, season_matchdays in zip(seasons, matchdays):
+            standings = SeasonStandings(
+                league_name=season.league.display_name,
+                team_names=[team["teamName"] for team in season.teams],
+                matchdays=season_matchdays,
+            )
+            standings.calculate_table(1, len(season_matchdays))
+
+    def store_standings() -> None:
+        for season, store in zip(seasons, stores):
+            standings = SeasonStandings.from_store(
+                league_name=season.league.display_name,
+                store=store,
+                team_names=[team["teamName"] for team in season.teams],
+            )
+            standings.calculate_table(1, standings.last_matchday)
+
+    # folded once, the stages only compute the histories
+    python_standings = [
+        SeasonStandings(
+            league_name=season.league.display_name,
+            team_names=[team["teamName"] for team in season.teams],
+            matchdays=season_matchdays,
+        )
+        for season, season_matchdays in zip(seasons, matchdays)
+    ]
+    matrix_standings = [
+        SeasonStandings.from_store(
+            league_name=season.league.display_name,
+            store=store,
+            team_names=[team["teamName"] for team in season.teams],
+        )
+        for season, store in zip(seasons, stores)
+    ]
+
+    def standings_history() -> None:
+        # numpy if it is installed, see SeasonStandings.calculate_history
+        for standings in matrix_standings:
+            standings.calculate_history()
+
+    def standings_history_python() -> None:
+        for standings in python_standings:
+            standings.calculate_history()
+
+    def table_copy() -> None:
+        for table in tables:
+            table.copy()
+
+    # rendering includes everything rich does before writing, e.g. parsing markup
+    console = Console(
+        file=io.StringIO(), width=120, force_terminal=True, color_system="truecolor"
+    )
+
+    def render_table() -> None:
+        for table in tables:
+            rich_table = table_printer.create_table(table.league_name)
+            table_printer.add_rows(rich_table, table.standings, HIGHLIGHTS)
+            list(console.render(rich_table))
+
+    def render_cached_table() -> None:
+        for index, table in enumerate(tables):
+            render_cache.render(
+                console,
+                key=("benchmark", index),
+                sources=(table,),
+                create=lambda table=table: table_printer.create_table_renderable(
+                    table.league_name, table.standings, HIGHLIGHTS
+                ),
+            )
+
+    def render_fixtures() -> None:
+        for season_matchdays in matchdays:
+            for matchday in season_matchdays:
+                weekdays = matchday.split_fixture_into_weekdays()
+                for kickoff_times in weekdays.values():
+                    panel = Panel(
+                        fixture_printer.get_panel_content(HIGHLIGHTS, kickoff_times),
+                        width=fixture_printer.WIDTH,
+                        padding=1,
+                    )
+                    list(console.render(panel))
+
+    return {
+        "parse": parse,
+        "keep_fixture_entries": keep_fixture_entries,
+        "keep_fixture_store": keep_fixture_store,
+        "extract_season_matchdays": extract_season_matchdays,
+        "calculate_table": calculate_table,
+        "season_standings": season_standings,
+        "store_standings": store_standings,
+        "standings_history": standings_history,
+        "standings_history_python": standings_history_python,
+        "table_copy": table_copy,
+        "render_table": render_table,
+        "render_cached_table": render_cached_table,
+        "render_fixtures": render_fixtures,
+        "handle_table_request": create_table_request_stage(seasons),
+    }
+
+
+def _empty_table(season: SeasonData) -> Table:
+    return Table.from_team_names(
+        league_name=season.league.display_name,
+        team_names=[team["teamName"] for team in season.teams],
+    )
+
+
+def create_table_request_stage(seasons: list[SeasonData]) -> Callable[[], None]:
+    """Answers `table` with every job flag from a cache holding the responses."""
+    cache = ResponseCache(directory=Path(tempfile.mkdtemp()), offline=True)
+    for season in seasons:
+        if season.season != CURRENT_SEASON:
+            continue
+        league, number = season.league, season.season
+        cache.set(api.build_get_match_data_url(league, number), season.match_data, None)
+        cache.set(api.build_get_available_teams_url(league, number), season.teams, None)
+        cache.set(
+            api.build_get_current_matchday_url(league), season.current_group, None
+        )
+
+    api.response_cache = cache
+    api.set_use_store(False)
+    args = Namespace(
+        league="bundesliga",
+        season=CURRENT_SEASON,
+        matchday=None,
+        first_round=True,
+        second_round=True,
+        last=5,
+        since=10,
+        home=True,
+        away=True,
+        highlights=HIGHLIGHTS,
+        output_format=None,
+    )
+
+    def handle_table_request() -> None:
+        # start cold like a new process, only the disk cache is warm
+        api.memory_cache = MemoryCache()
+        render_cache.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            table_request_handler.handle_table_request(args)
+
+    return handle_table_request
+
+
+def compare(
+    results: dict[str, Measurement],
+    baseline: dict[str, dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Prints every stage next to its baseline and returns the regressions.
+
+    A stage is slower if its time relative to the calibration grew, the
+    absolute times are only printed. The peak memory is compared as is.
+    """
+    regressions = []
+    print(
+        f"{'stage':<26}{'time':>10}{'baseline':>11}{'relative':>10}{'baseline':>10}"
+        f"{'peak':>10}{'baseline':>10}"
+    )
+    for name, result in results.items():
+        expected = baseline.get(name, {})
+        time_baseline = relative_baseline = peak_baseline = "-"
+        if "time_ms" in expected:
+            time_baseline = f"{expected['time_ms']:.2f}ms"
+        if "relative" in expected:
+            relative_baseline = f"{expected['relative']:.3f}"
+        if "peak_kib" in expected:
+            peak_baseline = f"{expected['peak_kib']:.0f}KiB"
+        print(
+            f"{name:<26}{result.time_ms:>8.2f}ms{time_baseline:>11}"
+            f"{result.relative:>10.3f}{relative_baseline:>10}"
+            f"{result.peak_kib:>7.0f}KiB{peak_baseline:>10}"
+        )
+        if (
+            "relative" in expected
+            and expected["time_ms"] >= MIN_COMPARED_TIME_MS
+            and result.relative > expected["relative"] * (1 + time_tolerance)
+        ):
+            regressions.append(f"{name} is slower than the baseline")
+        if "peak_kib" in expected and result.peak_kib > expected["peak_kib"] * (
+            1 + memory_tolerance
+        ):
+            regressions.append(f"{name} allocates more than the baseline")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        for league in LEAGUES:
+            for season in SEASONS:
+                record_season(league, season)
+        return 0
+
+    seasons = [load_season(league, season) for league in LEAGUES for season in SEASONS]
+    results = {
+        name: measure(stage, args.repeat)
+        for name, stage in create_stages(seasons).items()
+    }
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    name: {
+                        "time_ms": round(result.time_ms, 3),
+                        "relative": round(result.relative, 4),
+                        "peak_kib": round(result.peak_kib, 1),
+                    }
+                    for name, result in results.items()
+                },
+                indent=4,
+            )
+            + "\n"
+        )
+        print(f"saved baseline to {args.baseline}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(f"FAIL: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
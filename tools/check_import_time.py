@@ -0,0 +1,79 @@
+"""Checks that the `get` entry point stays within its startup budget.
+
+Runs `python -X importtime` on everything `get --help` needs and fails if the
+cumulative import time of the package grows past the budget or if one of the
+heavy modules, only needed once a subcommand runs, is imported eagerly.
+
+Usage:
+    python tools/check_import_time.py [--budget-ms 25] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+PACKAGE = "bundesliga_scraper"
+STARTUP_CODE = (
+    "from bundesliga_scraper import __main__; "
+    "__main__.user_input_parser.create_parser()"
+)
+DEFAULT_BUDGET_MS = 25.0
+DEFAULT_RUNS = 5
+FORBIDDEN_MODULES = ("requests", "urllib3", "rich", "plotext", "numpy")
+
+
+def measure_import_time() -> tuple[float, set[str]]:
+    """Returns the import time of the package in ms and all imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            # header line
+            continue
+        modules.add(name.strip())
+        # only top level imports, nested ones are part of their parent's time
+        if not name.startswith("  ") and name.strip().startswith(PACKAGE):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    # the best of several runs filters out noise of a busy machine
+    measurements = [measure_import_time() for _ in range(args.runs)]
+    import_time = min(time for time, _ in measurements)
+    modules = set().union(*(modules for _, modules in measurements))
+
+    eager_imports = sorted(
+        {module.split(".")[0] for module in modules} & set(FORBIDDEN_MODULES)
+    )
+
+    print(f"startup import time: {import_time:.1f}ms (budget {args.budget_ms}ms)")
+    failed = False
+    if import_time > args.budget_ms:
+        print("FAIL: startup import time is over budget")
+        failed = True
+    if eager_imports:
+        print(f"FAIL: imported before dispatch: {', '.join(eager_imports)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""Local stand-in for OpenLigaDB to develop, benchmark and load test offline.
+
+Serves recorded responses under the url scheme of OpenLigaDB, e.g.
+`/getmatchdata/bl1/2024`. Recordings are read from `--data`, a directory
+written by running the cli with BUNDESLIGA_SCRAPER_RECORD=<dir>. Urls without
+a recording are answered from generated seasons (see tools/benchmark.py)
+unless `--no-generate` is given. Responses carry an ETag, so conditional
+requests are answered with 304 Not Modified.
+
+Usage:
+    python tools/fake_openligadb.py [--port 8080] [--data DIR]
+        [--latency 0.2] [--error-rate 0.1] [--error-status 503]
+    BUNDESLIGA_SCRAPER_BASE_URL=http://127.0.0.1:8080 get bundesliga table
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# importing benchmark puts the repository root on sys.path
+from benchmark import CURRENT_SEASON, TEAM_NAMES, SeasonData, generate_season
+
+from bundesliga_scraper.api.api import _extract_season_matchdays
+from bundesliga_scraper.datatypes.fixture_entry import FixtureEntry
+from bundesliga_scraper.datatypes.league_registry import league_registry
+from bundesliga_scraper.datatypes.table import Table
+
+DEFAULT_PORT = 8080
+
+
+@lru_cache(maxsize=None)
+def get_season(league: str, season: int) -> SeasonData:
+    league_data = league_registry.get_by_shortcut(league)
+    if league_data is None or league not in TEAM_NAMES:
+        raise ValueError(f"no teams for league {league}")
+    return generate_season(league_data, season)
+
+
+def generate_response(path: str) -> object | None:
+    """Answers the endpoints the cli uses from a generated season."""
+    endpoint, *params = path.split("/")
+    try:
+        if endpoint == "getcurrentgroup" and len(params) == 1:
+            return get_season(params[0], CURRENT_SEASON).current_group
+        league, season, *rest = params
+        data = get_season(league, int(season))
+    except ValueError:
+        return None
+    return generate_season_response(endpoint, data, rest)
+
+
+def generate_season_response(
+    endpoint: str, data: SeasonData, rest: list[str]
+) -> object | None:
+    """Answers the endpoints below /<endpoint>/<league>/<season>."""
+    if endpoint == "getmatchdata" and len(rest) <= 1:
+        return filter_match_data(data.match_data, rest)
+    if endpoint == "getlastchangedate" and len(rest) == 1:
+        # generated seasons never change
+        return f"{data.season}-08-01T00:00:00"
+    if endpoint == "getavailableteams" and not rest:
+        return data.teams
+    if endpoint == "getbltable" and not rest:
+        return generate_table(data)
+    return None
+
+
+def filter_match_data(match_data: list[dict], rest: list[str]) -> list[dict]:
+    """All matches, those of a matchday or those of a team, like getmatchdata."""
+    if not rest:
+        return match_data
+    if rest[0].isdigit():
+        matchday = int(rest[0])
+        return [m for m in match_data if m["group"]["groupOrderID"] == matchday]
+    team_filter = rest[0].lower()
+    return [
+        match
+        for match in match_data
+        if team_filter in match["team1"]["teamName"].lower()
+        or team_filter in match["team2"]["teamName"].lower()
+    ]
+
+
+def generate_table(data: SeasonData) -> list[dict]:
+    table = Table.from_team_names(
+        league_name=data.league.display_name,
+        team_names=[team["teamName"] for team in data.teams],
+    )
+    table.calculate_table(
+        _extract_season_matchdays(FixtureEntry.from_list(data.match_data))
+    )
+    return [
+        {
+            "teamName": entry.team_name,
+            "points": entry.points,
+            "opponentGoals": entry.opponent_goals,
+            "goals": entry.goals,
+            "matches": entry.matches,
+            "won": entry.won,
+            "lost": entry.lost,
+            "draw": entry.draw,
+            "goalDiff": entry.goal_diff,
+        }
+        for entry in table.standings
+    ]
+
+
+def create_handler(
+    data_dir: Path | None,
+    generate: bool,
+    latency: float,
+    error_rate: float,
+    error_status: int,
+) -> type[BaseHTTPRequestHandler]:
+    rnd = random.Random()
+
+    class FakeOpenLigaDBHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if latency:
+                time.sleep(latency)
+            if rnd.random() < error_rate:
+                self.send_error(error_status)
+                return
+
+            body = self.find_body(unquote(urlsplit(self.path).path).strip("/"))
+            if body is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def find_body(self, path: str) -> bytes | None:
+            if data_dir is not None:
+                recording = data_dir / f"{path}.json"
+                if recording.is_file():
+                    return recording.read_bytes()
+            if not generate:
+                return None
+            response = generate_response(path)
+            if response is None:
+                return None
+            return json.dumps(response, ensure_ascii=False).encode()
+
+    return FakeOpenLigaDBHandler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--data", type=Path, help="directory of recorded responses")
+    parser.add_argument("--no-generate", dest="generate", action="store_false")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--error-status", type=int, default=HTTPStatus.SERVICE_UNAVAILABLE
+    )
+    args = parser.parse_args()
+
+    handler = create_handler(
+        data_dir=args.data,
+        generate=args.generate,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"serving OpenLigaDB on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())